@@ -0,0 +1,153 @@
+"""
+Document ID generation and sequence number allocation.
+
+IDs follow ARC-{PID}-{TYPE}-v{VERSION}; multi-instance types carry a
+sequence number, ARC-{PID}-{TYPE}-{SEQ}-v{VERSION}. Sequence numbers are
+reserved in the state directory (.arckit/state/sequences/, see
+get_state_dir()) so concurrent callers never receive the same one.
+"""
+
+import json
+import os
+import re
+
+from .doc_types import MULTI_INSTANCE_TYPES, SUBDIR_MAP
+from .projects import scan_dir, find_project_dir_by_prefix
+from .repo import find_repo_root, get_state_dir
+from .state import file_lock, write_json_atomic, read_json, dir_mtime_ns
+
+# Reservation files live in {state dir}/sequences/{project}-{type}.json
+SEQUENCES_DIR = "sequences"
+
+
+# ============================================================================
+# Document Sequence Allocation
+# ============================================================================
+
+def scan_last_sequence(directory, project_id, doc_type):
+    """Highest NNN among ARC-{project_id}-{doc_type}-NNN-*.md files (0 if none)."""
+    pattern = re.compile(rf"ARC-{re.escape(project_id)}-{re.escape(doc_type)}-(\d+)-")
+    last = 0
+    for name, (is_dir, _) in scan_dir(directory, mtimes=False).items():
+        if is_dir or not name.endswith(".md"):
+            continue
+        m = pattern.match(name)
+        if m:
+            last = max(last, int(m.group(1)))
+    return last
+
+
+def allocate_sequence(repo_root, project_id, doc_type, directory, count=1):
+    """Reserve `count` consecutive sequence numbers for a multi-instance type.
+
+    Returns the first reserved number. The reservation file for
+    (project_id, doc_type) holds the next free number and the mtime of
+    `directory` when it was last scanned; `directory` is only rescanned
+    when that mtime changed (files added outside this allocator). Numbers
+    are never handed out twice, even if no file is written for them.
+    """
+    sequences_dir = os.path.join(get_state_dir(repo_root), SEQUENCES_DIR)
+    os.makedirs(sequences_dir, exist_ok=True)
+    base = os.path.join(sequences_dir, f"{project_id}-{doc_type}")
+    directory = os.path.abspath(directory)
+
+    with file_lock(f"{base}.lock"):
+        state = read_json(f"{base}.json")
+        if not isinstance(state, dict) or not isinstance(state.get("next"), int):
+            state = {}
+        next_num = state.get("next", 1)
+        mtime = dir_mtime_ns(directory)
+        if state.get("directory") != directory or state.get("dir_mtime_ns") != mtime:
+            next_num = max(next_num, scan_last_sequence(directory, project_id, doc_type) + 1)
+        write_json_atomic(f"{base}.json", {
+            "next": next_num + count,
+            "directory": directory,
+            "dir_mtime_ns": mtime,
+        })
+
+    return next_num
+
+
+def reserve_sequences(next_num_dir, padded_pid, doc_type, count=1, marker=None):
+    """Reserve `count` consecutive sequence numbers in DIR; return the first.
+
+    DIR's repo root (found with `marker`, see find_repo_root()) holds the
+    reservation state.
+    """
+    repo_root = find_repo_root(next_num_dir, required=False, marker=marker)
+    if repo_root:
+        # Reserve the numbers so concurrent callers never get the same ones
+        return allocate_sequence(repo_root, padded_pid, doc_type, next_num_dir, count)
+    # Outside an ArcKit repo: no reservation state, scan DIR
+    return scan_last_sequence(next_num_dir, padded_pid, doc_type) + 1
+
+
+def default_sequence_dir(padded_pid, doc_type, marker=None):
+    """Subdirectory for a multi-instance type in the matching project, or None."""
+    repo_root = find_repo_root(required=False, marker=marker)
+    if not repo_root:
+        return None
+    project_dir = find_project_dir_by_prefix(padded_pid, repo_root)
+    if not project_dir:
+        return None
+    return os.path.join(project_dir, SUBDIR_MAP.get(doc_type, ""))
+
+
+# ============================================================================
+# Document IDs
+# ============================================================================
+
+def is_multi_instance(doc_type):
+    return doc_type in MULTI_INSTANCE_TYPES
+
+
+def normalize_project_id(project_id):
+    """Zero-pad a project ID to 3 digits ("1" -> "001"). Raises ValueError."""
+    return f"{int(str(project_id).lstrip('0') or '0'):03d}"
+
+
+def run_batch(lines, marker=None):
+    """Generate IDs for JSON-line requests; return one result dict per request.
+
+    Multi-instance requests are grouped by (project, type, directory) and
+    each group's sequence numbers are reserved with a single allocation.
+    `marker` is passed to find_repo_root().
+    """
+    results = []
+    pending = {}  # (pid, type, dir) -> [(result index, version)]
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            padded_pid = normalize_project_id(request["project"])
+            doc_type = str(request["type"])
+            version = str(request.get("version", "1.0"))
+        except (ValueError, KeyError) as e:
+            results.append({"error": f"Invalid request {line.strip()!r}: {e}"})
+            continue
+
+        if not is_multi_instance(doc_type):
+            results.append({"id": f"ARC-{padded_pid}-{doc_type}-v{version}"})
+            continue
+
+        next_num_dir = request.get("dir") or default_sequence_dir(padded_pid, doc_type, marker)
+        if not next_num_dir:
+            results.append({"error": f"Multi-instance type '{doc_type}' needs \"dir\" "
+                                     f"(no project {padded_pid} found)"})
+            continue
+        key = (padded_pid, doc_type, os.path.abspath(next_num_dir))
+        pending.setdefault(key, []).append((len(results), version))
+        results.append(None)
+
+    for (padded_pid, doc_type, next_num_dir), slots in pending.items():
+        first = reserve_sequences(next_num_dir, padded_pid, doc_type, len(slots), marker)
+        for offset, (index, version) in enumerate(slots):
+            results[index] = {"id": f"ARC-{padded_pid}-{doc_type}-{first + offset:03d}-v{version}"}
+
+    for result in results:
+        if "id" in result:
+            result["filename"] = f"{result['id']}.md"
+    return results
@@ -22,7 +22,7 @@ from pathlib import Path
 # Add parent directory to path for common imports
 sys.path.insert(0, os.path.dirname(__file__))
 from common import (
-    find_repo_root, get_next_project_number, slugify, create_project_dir,
+    find_repo_root, reserve_project_dir, slugify, create_project_dir,
     get_arckit_dir, get_memory_dir, get_templates_dir,
     log_info, log_success, log_error, output_json_array,
 )
@@ -77,14 +77,11 @@ def main():
             log_error("Project name cannot be empty")
             sys.exit(1)
 
-    # Get next project number
-    project_number = get_next_project_number(repo_root)
-    log_info(f"Project number: {project_number}")
-
-    # Create project slug and directory
+    # Allocate the next project number (creates projects/NNN-slug atomically)
     project_slug = slugify(project_name)
-    project_dir_name = f"{project_number}-{project_slug}"
-    project_dir = os.path.join(repo_root, "projects", project_dir_name)
+    project_number, project_dir = reserve_project_dir(repo_root, project_slug)
+    project_dir_name = os.path.basename(project_dir)
+    log_info(f"Project number: {project_number}")
 
     log_info(f"Creating project: {project_dir_name}")
 
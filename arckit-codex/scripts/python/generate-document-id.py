@@ -4,31 +4,46 @@ Generate standardized ArcKit document IDs.
 
 Usage:
     python3 generate-document-id.py PROJECT_ID DOC_TYPE [VERSION] [OPTIONS]
+    python3 generate-document-id.py --batch < requests.jsonl
 
 Options:
     --filename           Return ID with .md extension
-    --next-num DIR       For multi-instance types, find next sequence number
+    --next-num DIR       For multi-instance types, reserve the next sequence number
+                         (tracked in .arckit/state/sequences/, or the user
+                         cache in repos without .arckit/, so concurrent
+                         callers never receive the same number)
+    --batch              Read JSON lines from stdin and print one JSON result per line
 
 Examples:
     python3 generate-document-id.py 001 REQ          -> ARC-001-REQ-v1.0
     python3 generate-document-id.py 042 HLD 2.1      -> ARC-042-HLD-v2.1
     python3 generate-document-id.py 001 REQ 1.0 --filename -> ARC-001-REQ-v1.0.md
     python3 generate-document-id.py 001 ADR 1.0 --filename --next-num ./decisions -> ARC-001-ADR-001-v1.0.md
+
+Batch mode:
+    Each input line is {"project": "001", "type": "ADR", "version": "1.0", "dir": "..."}
+    ("version" defaults to 1.0; "dir" is only used by multi-instance types and
+    defaults to the type's subdirectory of the matching project). Each output
+    line is {"id": ..., "filename": ...} or {"error": ...}, in input order.
+    Sequence numbers for the same project, type and directory are reserved
+    in one contiguous block.
+
+        {"project": "1", "type": "ADR"}      -> {"id": "ARC-001-ADR-004-v1.0", ...}
+        {"project": "1", "type": "ADR"}      -> {"id": "ARC-001-ADR-005-v1.0", ...}
+        {"project": "1", "type": "REQ", "version": "2.0"} -> {"id": "ARC-001-REQ-v2.0", ...}
 """
 
 import argparse
-import glob
+import json
 import os
-import re
 import sys
 
-# Multi-instance document types that require sequence numbers
-# Keep in sync with arckit-claude/config/doc-types.mjs MULTI_INSTANCE_TYPES
-MULTI_INSTANCE_TYPES = {"ADR", "DIAG", "DFD", "WARD", "DMC", "RSCH", "AWRS", "AZRS", "GCRS", "DSCT"}
-
-
-def is_multi_instance(doc_type):
-    return doc_type in MULTI_INSTANCE_TYPES
+# Add parent directory to path for common imports
+sys.path.insert(0, os.path.dirname(__file__))
+from common import ROOT_MARKER  # also puts arckit_core on the import path
+from arckit_core.doc_ids import (
+    is_multi_instance, normalize_project_id, reserve_sequences, run_batch,
+)
 
 
 def main():
@@ -36,47 +51,38 @@ def main():
         description="Generate standardized ArcKit document IDs",
         add_help=True,
     )
-    parser.add_argument("project_id", help="Project ID (e.g., 001)")
-    parser.add_argument("doc_type", help="Document type code (e.g., REQ, ADR)")
+    parser.add_argument("project_id", nargs="?", help="Project ID (e.g., 001)")
+    parser.add_argument("doc_type", nargs="?", help="Document type code (e.g., REQ, ADR)")
     parser.add_argument("version", nargs="?", default="1.0", help="Version (default: 1.0)")
     parser.add_argument("--filename", action="store_true", help="Return ID with .md extension")
     parser.add_argument("--next-num", dest="next_num_dir", metavar="DIR",
-                        help="For multi-instance types, scan DIR for next sequence number")
+                        help="For multi-instance types, reserve the next sequence number in DIR")
+    parser.add_argument("--batch", action="store_true",
+                        help="Read JSON-line requests from stdin, print one JSON result per line")
     args = parser.parse_args()
 
+    if args.batch:
+        results = run_batch(sys.stdin, marker=ROOT_MARKER)
+        for result in results:
+            print(json.dumps(result))
+        sys.exit(1 if any("error" in r for r in results) else 0)
+
+    if not args.project_id or not args.doc_type:
+        parser.error("PROJECT_ID and DOC_TYPE are required (or use --batch)")
+
     # Normalize project ID to 3-digit zero-padded
     try:
-        pid_clean = int(args.project_id.lstrip("0") or "0")
+        padded_pid = normalize_project_id(args.project_id)
     except ValueError:
         print(f"Error: Invalid PROJECT_ID: {args.project_id}", file=sys.stderr)
         sys.exit(1)
-    padded_pid = f"{pid_clean:03d}"
 
     doc_type = args.doc_type
     version = args.version
 
     if is_multi_instance(doc_type):
         if args.next_num_dir:
-            next_num_dir = args.next_num_dir
-            if os.path.isdir(next_num_dir):
-                # Scan directory for existing files to find next sequence number
-                pattern_prefix = f"ARC-{padded_pid}-{doc_type}-"
-                last_num = 0
-                for fname in os.listdir(next_num_dir):
-                    if not fname.endswith(".md"):
-                        continue
-                    m = re.match(
-                        rf"ARC-{padded_pid}-{re.escape(doc_type)}-(\d+)-",
-                        fname,
-                    )
-                    if m:
-                        num = int(m.group(1))
-                        if num > last_num:
-                            last_num = num
-                next_num = f"{last_num + 1:03d}"
-            else:
-                # Directory doesn't exist yet, start at 001
-                next_num = "001"
+            next_num = f"{reserve_sequences(args.next_num_dir, padded_pid, doc_type, marker=ROOT_MARKER):03d}"
             doc_id = f"ARC-{padded_pid}-{doc_type}-{next_num}-v{version}"
         else:
             print(f"Error: Multi-instance type '{doc_type}' requires --next-num DIR option", file=sys.stderr)
@@ -0,0 +1,100 @@
+"""
+File locking and atomic JSON state files.
+
+Used for docs/manifest.json and for the counters and reservations kept in
+the state directory (.arckit/state/), which concurrent scripts and hooks
+update.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Hold an exclusive advisory lock on `path` (created if missing).
+
+    Uses fcntl on POSIX and msvcrt on Windows; falls back to no locking
+    on platforms with neither.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            # LK_LOCK retries for ~10s before raising; loop until acquired
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            with contextlib.suppress(OSError):
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+
+def write_json_atomic(path, data, indent=None):
+    """Write JSON to `path` via a temp file in the same directory + rename.
+
+    Readers never see a half-written file. An existing file keeps its mode;
+    new files get 0644 (mkstemp alone would create them 0600).
+    """
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}-", suffix=".tmp",
+    )
+    try:
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def read_json(path):
+    """Read a JSON file, returning None if it is missing or unparseable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def dir_mtime_ns(path):
+    """Modification time of `path` in nanoseconds, 0 if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def file_size(path):
+    """Size of `path` in bytes, 0 if missing."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
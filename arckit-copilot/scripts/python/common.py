@@ -2,154 +2,63 @@
 """
 Common utilities for ArcKit scripts (plugin version).
 Looks for projects/ directory as repo root indicator.
+
+The implementation lives in the arckit_core package; this module re-exports
+it under the names the scripts have always imported.
 """
 
 import os
-import re
 import sys
 import json
 import shutil
 import subprocess
+from functools import partial
 from pathlib import Path
 
-# ANSI color codes
-RED = "\033[0;31m"
-GREEN = "\033[0;32m"
-YELLOW = "\033[1;33m"
-BLUE = "\033[0;34m"
-NC = "\033[0m"  # No Color
-
-
-# ============================================================================
-# Logging Functions
-# ============================================================================
-
-def log_info(msg):
-    print(f"{BLUE}[INFO]{NC} {msg}", file=sys.stderr)
-
-
-def log_success(msg):
-    print(f"{GREEN}[SUCCESS]{NC} {msg}", file=sys.stderr)
-
-
-def log_warning(msg):
-    print(f"{YELLOW}[WARNING]{NC} {msg}", file=sys.stderr)
-
-
-def log_error(msg):
-    print(f"{RED}[ERROR]{NC} {msg}", file=sys.stderr)
-
-
-# ============================================================================
-# Repository Root Detection
-# ============================================================================
-
-def find_repo_root(start_dir=None):
-    """Find the repository root by looking for projects/ directory."""
-    current = Path(start_dir or os.getcwd()).resolve()
-    while current != current.parent:
-        if (current / "projects").is_dir():
-            return str(current)
-        current = current.parent
-    log_error("Not in an ArcKit project (no projects/ directory found)")
-    sys.exit(1)
-
-
-# ============================================================================
-# Project Management
-# ============================================================================
-
-def get_next_project_number(repo_root):
-    """Get the next available project number (zero-padded to 3 digits)."""
-    projects_dir = Path(repo_root) / "projects"
-    if not projects_dir.is_dir():
-        return "001"
-
-    max_num = 0
-    for entry in projects_dir.iterdir():
-        if entry.is_dir():
-            m = re.match(r"^(\d{3})-", entry.name)
-            if m:
-                num = int(m.group(1))
-                if num > max_num:
-                    max_num = num
-
-    return f"{max_num + 1:03d}"
-
-
-def slugify(text):
-    """Convert text to kebab-case slug."""
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = text.strip("-")
-    return text
-
-
-def create_project_dir(project_dir):
-    """Create project directory structure with all required subdirectories."""
-    subdirs = [
-        "", "vendors", "external", "final",
-        "decisions", "diagrams", "wardley-maps",
-        "data-contracts", "reviews",
-    ]
-    for sub in subdirs:
-        (Path(project_dir) / sub).mkdir(parents=True, exist_ok=True)
-    log_success(f"Created project directory: {project_dir}")
-
-
-# ============================================================================
-# Project Finding
-# ============================================================================
-
-def find_project_dir_by_prefix(prefix, repo_root=None):
-    """Find project directory by number or prefix (exact then fuzzy match)."""
-    if repo_root is None:
-        repo_root = find_repo_root()
-    projects_dir = Path(repo_root) / "projects"
-    if not projects_dir.is_dir():
-        log_error("No projects directory found")
-        return None
-
-    # Exact match first
-    for entry in sorted(projects_dir.iterdir()):
-        if entry.is_dir():
-            name = entry.name
-            if name == prefix or name.startswith(f"{prefix}-"):
-                return str(entry)
-
-    # Fuzzy match
-    for entry in sorted(projects_dir.iterdir()):
-        if entry.is_dir() and prefix in entry.name:
-            return str(entry)
-
-    log_error(f"No project found matching: {prefix}")
-    return None
-
-
-def get_project_number_from_dir(dir_path):
-    """Extract 3-digit project number from directory name."""
-    name = Path(dir_path).name
-    m = re.match(r"^(\d{3})-", name)
-    return m.group(1) if m else None
-
-
-def list_projects(repo_root=None):
-    """List all projects."""
-    if repo_root is None:
-        repo_root = find_repo_root()
-    projects_dir = Path(repo_root) / "projects"
-    if not projects_dir.is_dir():
-        print("No projects found")
-        return
-
-    dirs = sorted(d for d in projects_dir.iterdir() if d.is_dir())
-    if not dirs:
-        print("No projects found")
-        return
-
-    print("Available projects:")
-    for d in dirs:
-        print(f"  - {d.name}")
+# arckit_core is vendored next to this file, installed with arckit-cli, or
+# (in a source checkout) found under src/
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    import arckit_core  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from arckit_core import projects as _projects, repo as _repo  # noqa: E402
+from arckit_core.log import (  # noqa: E402,F401
+    RED, GREEN, YELLOW, BLUE, NC,
+    log_info, log_success, log_warning, log_error,
+)
+from arckit_core.doc_types import (  # noqa: E402,F401
+    DOC_TYPES, MULTI_INSTANCE_TYPES, SUBDIR_MAP, ARC_FILENAME_RE,
+    classify_filename, extract_doc_type,
+)
+from arckit_core.state import (  # noqa: E402,F401
+    file_lock, write_json_atomic, read_json, dir_mtime_ns,
+)
+from arckit_core.projects import (  # noqa: E402,F401
+    PROJECT_COUNTER, slugify, create_project_dir, get_project_number_from_dir,
+    scan_dir, snapshot_project, snapshot_files, snapshot_subdirs, list_project_dirs,
+    scan_next_project_number, read_project_counter, get_next_project_number,
+    reserve_project_dir, ProjectIndex,
+)
+from arckit_core.doc_ids import (  # noqa: E402,F401
+    SEQUENCES_DIR, scan_last_sequence, allocate_sequence,
+)
+
+# Plugin repos have no .arckit/; projects/ marks the repository root. Helpers
+# that find the root themselves when repo_root is omitted are re-exported
+# with that marker bound; pass marker=ROOT_MARKER to other arckit_core calls.
+ROOT_MARKER = "projects"
+
+find_repo_root = partial(_repo.find_repo_root, marker=ROOT_MARKER)
+get_arckit_dir = partial(_repo.get_arckit_dir, marker=ROOT_MARKER)
+get_state_dir = partial(_repo.get_state_dir, marker=ROOT_MARKER)
+get_templates_dir = partial(_repo.get_templates_dir, marker=ROOT_MARKER)
+get_projects_dir = partial(_repo.get_projects_dir, marker=ROOT_MARKER)
+get_memory_dir = partial(_repo.get_memory_dir, marker=ROOT_MARKER)
+match_projects = partial(_projects.match_projects, marker=ROOT_MARKER)
+find_project_dir_by_prefix = partial(_projects.find_project_dir_by_prefix, marker=ROOT_MARKER)
+list_projects = partial(_projects.list_projects, marker=ROOT_MARKER)
 
 
 # ============================================================================
@@ -162,17 +71,7 @@ def has_git():
 
 
 def get_repo_root():
-    """Get repository root using git (fallback to find_repo_root)."""
-    if has_git():
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True, text=True, timeout=5,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+    """Get repository root (same as find_repo_root; does not fork git)."""
     return find_repo_root()
 
 
@@ -254,35 +153,3 @@ def json_escape(s):
 def output_json_array(items):
     """Output a JSON array string from a list."""
     return json.dumps(items)
-
-
-# ============================================================================
-# Path Helpers
-# ============================================================================
-
-def get_arckit_dir(repo_root=None):
-    """Get .arckit directory path."""
-    if repo_root is None:
-        repo_root = find_repo_root()
-    return os.path.join(repo_root, ".arckit")
-
-
-def get_templates_dir(repo_root=None):
-    """Get templates directory path."""
-    if repo_root is None:
-        repo_root = find_repo_root()
-    return os.path.join(repo_root, ".arckit", "templates")
-
-
-def get_projects_dir(repo_root=None):
-    """Get projects directory path."""
-    if repo_root is None:
-        repo_root = find_repo_root()
-    return os.path.join(repo_root, "projects")
-
-
-def get_memory_dir(repo_root=None):
-    """Get memory directory path (000-global)."""
-    if repo_root is None:
-        repo_root = find_repo_root()
-    return os.path.join(repo_root, "projects", "000-global")
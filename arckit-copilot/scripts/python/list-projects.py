@@ -7,83 +7,36 @@ Usage:
 
 Options:
     --json           Output in JSON format
+    --ndjson         Stream one compact JSON object per project (one per line)
     --verbose, -v    Show detailed artifact status
+    --jobs N, -j N   Scan projects on N threads (default: 1)
+    --weights FILE   Completion weights JSON (default: .arckit/completion-weights.json)
     --help, -h       Show help message
+
+Completion is scored from ARC-* filenames (ARC-001-REQ-v1.0.md counts as
+REQ) found in the project and its subdirectories. The weights file maps
+doc type codes or DOC_TYPES categories to weights, e.g.
+
+    {"REQ": 3, "STKE": 2, "RISK": 1, "Compliance": 2}
+
+where a category is satisfied by any document in it. Legacy unversioned
+filenames (requirements.md, sow.md, ...) still count for their type.
 """
 
 import argparse
 import json
 import os
 import sys
-from pathlib import Path
 
 # Add parent directory to path for common imports
 sys.path.insert(0, os.path.dirname(__file__))
 from common import (
-    find_repo_root, get_projects_dir, get_project_number_from_dir,
-    log_warning,
+    find_repo_root, get_projects_dir, get_arckit_dir, list_project_dirs,
+    log_error, log_warning,
+)
+from arckit_core.status import (
+    ARTIFACTS, WEIGHTS_FILE, load_completion_weights, scan_projects,
 )
-
-
-def check_artifact(project_dir, artifact):
-    """Check if an artifact exists (file or non-empty directory)."""
-    if artifact.endswith("/"):
-        d = os.path.join(project_dir, artifact.rstrip("/"))
-        return os.path.isdir(d) and bool(os.listdir(d))
-    return os.path.isfile(os.path.join(project_dir, artifact))
-
-
-def count_vendors(project_dir):
-    """Count vendor proposal directories."""
-    vendors_dir = os.path.join(project_dir, "vendors")
-    if not os.path.isdir(vendors_dir):
-        return 0
-    return sum(1 for d in os.listdir(vendors_dir)
-               if os.path.isdir(os.path.join(vendors_dir, d)))
-
-
-def count_external_docs(project_dir):
-    """Count external documents (excluding README.md)."""
-    external_dir = os.path.join(project_dir, "external")
-    if not os.path.isdir(external_dir):
-        return 0
-    extensions = {".pdf", ".docx", ".md", ".csv", ".sql", ".png", ".jpg"}
-    count = 0
-    for fname in os.listdir(external_dir):
-        if fname == "README.md":
-            continue
-        fpath = os.path.join(external_dir, fname)
-        if os.path.isfile(fpath) and Path(fname).suffix.lower() in extensions:
-            count += 1
-    return count
-
-
-def calculate_completion(project_dir):
-    """Calculate completion percentage based on standard artifacts."""
-    total = 10
-    completed = 0
-
-    artifacts = [
-        "stakeholder-drivers.md", "risk-register.md", "sobc.md",
-        "requirements.md", "data-model.md", "research-findings.md",
-        "sow.md", "evaluation-criteria.md",
-    ]
-
-    for artifact in artifacts:
-        if os.path.isfile(os.path.join(project_dir, artifact)):
-            completed += 1
-
-    # Wardley maps
-    wm_dir = os.path.join(project_dir, "wardley-maps")
-    if os.path.isdir(wm_dir) and os.listdir(wm_dir):
-        completed += 1
-
-    # Vendors
-    vendors_dir = os.path.join(project_dir, "vendors")
-    if os.path.isdir(vendors_dir) and os.listdir(vendors_dir):
-        completed += 1
-
-    return completed * 100 // total
 
 
 def get_status_emoji(percentage):
@@ -102,14 +55,31 @@ def get_status_emoji(percentage):
 
 def main():
     parser = argparse.ArgumentParser(description="List all ArcKit projects with status indicators")
-    parser.add_argument("--json", dest="json_mode", action="store_true", help="Output in JSON format")
+    output_mode = parser.add_mutually_exclusive_group()
+    output_mode.add_argument("--json", dest="json_mode", action="store_true", help="Output in JSON format")
+    output_mode.add_argument("--ndjson", action="store_true",
+                             help="Stream one compact JSON object per project as it is scanned")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed artifact status")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="Scan projects on N threads (default: 1)")
+    parser.add_argument("--weights", metavar="FILE",
+                        help=f"Completion weights JSON (default: .arckit/{WEIGHTS_FILE} if present)")
     args = parser.parse_args()
 
     repo_root = find_repo_root()
+    weights_path = args.weights or os.path.join(get_arckit_dir(repo_root), WEIGHTS_FILE)
+    weights = None
+    if args.weights or os.path.isfile(weights_path):
+        try:
+            weights = load_completion_weights(weights_path)
+        except ValueError as e:
+            log_error(str(e))
+            sys.exit(1)
     projects_dir = get_projects_dir(repo_root)
 
     if not os.path.isdir(projects_dir):
+        if args.ndjson:
+            sys.exit(0)
         if args.json_mode:
             print('{"projects": []}')
         else:
@@ -119,12 +89,12 @@ def main():
         sys.exit(0)
 
     # Get sorted project directories
-    project_dirs = sorted(
-        d for d in Path(projects_dir).iterdir() if d.is_dir()
-    )
+    project_dirs = list_project_dirs(projects_dir)
     project_count = len(project_dirs)
 
     if project_count == 0:
+        if args.ndjson:
+            sys.exit(0)
         if args.json_mode:
             print('{"projects": []}')
         else:
@@ -133,43 +103,24 @@ def main():
             print("Run: /arckit.create to create a new project")
         sys.exit(0)
 
+    # NDJSON output mode: emit each project as soon as it is scanned
+    if args.ndjson:
+        try:
+            for project in scan_projects(project_dirs, args.jobs, weights):
+                sys.stdout.write(json.dumps(project, separators=(",", ":")) + "\n")
+                sys.stdout.flush()
+        except BrokenPipeError:
+            # Consumer stopped reading (e.g. piped into head); exit quietly
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(0)
+
     # JSON output mode
     if args.json_mode:
-        projects = []
-        for pd in project_dirs:
-            pdir = str(pd)
-            project_name = pd.name
-            project_number = get_project_number_from_dir(pdir) or ""
-            vendor_count = count_vendors(pdir)
-            external_doc_count = count_external_docs(pdir)
-            completion = calculate_completion(pdir)
-
-            projects.append({
-                "name": project_name,
-                "number": project_number,
-                "path": pdir,
-                "completion_percentage": completion,
-                "vendor_count": vendor_count,
-                "external_doc_count": external_doc_count,
-                "artifacts": {
-                    "stakeholder_drivers": check_artifact(pdir, "stakeholder-drivers.md"),
-                    "risk_register": check_artifact(pdir, "risk-register.md"),
-                    "sobc": check_artifact(pdir, "sobc.md"),
-                    "requirements": check_artifact(pdir, "requirements.md"),
-                    "data_model": check_artifact(pdir, "data-model.md"),
-                    "research_findings": check_artifact(pdir, "research-findings.md"),
-                    "wardley_maps": check_artifact(pdir, "wardley-maps/"),
-                    "sow": check_artifact(pdir, "sow.md"),
-                    "evaluation_criteria": check_artifact(pdir, "evaluation-criteria.md"),
-                    "vendors": check_artifact(pdir, "vendors/"),
-                },
-            })
-
         output = {
             "repository_root": repo_root,
             "projects_dir": projects_dir,
             "project_count": project_count,
-            "projects": projects,
+            "projects": list(scan_projects(project_dirs, args.jobs, weights)),
         }
         print(json.dumps(output, indent=2))
         sys.exit(0)
@@ -182,35 +133,22 @@ def main():
     print(f"Projects found: {project_count}")
     print()
 
-    for pd in project_dirs:
-        pdir = str(pd)
-        project_name = pd.name
-        project_number = get_project_number_from_dir(pdir) or ""
-        vendor_count = count_vendors(pdir)
-        external_doc_count = count_external_docs(pdir)
-        completion = calculate_completion(pdir)
+    for project in scan_projects(project_dirs, args.jobs, weights):
+        completion = project["completion_percentage"]
+        vendor_count = project["vendor_count"]
+        external_doc_count = project["external_doc_count"]
         status = get_status_emoji(completion)
 
-        print(f"{status} [{project_number}] {project_name} ({completion}% complete)")
+        print(f"{status} [{project['number']}] {project['name']} ({completion}% complete)")
 
         if args.verbose:
-            print(f"    Path: {pdir}")
+            print(f"    Path: {project['path']}")
             print("    Artifacts:")
 
-            checks = [
-                ("stakeholder-drivers.md", "Stakeholder Drivers"),
-                ("risk-register.md", "Risk Register"),
-                ("sobc.md", "Strategic Outline Business Case"),
-                ("requirements.md", "Requirements"),
-                ("data-model.md", "Data Model"),
-                ("research-findings.md", "Research Findings"),
-                ("wardley-maps/", "Wardley Maps"),
-                ("sow.md", "Statement of Work"),
-                ("evaluation-criteria.md", "Evaluation Criteria"),
-            ]
-
-            for artifact, label in checks:
-                mark = "\u2713" if check_artifact(pdir, artifact) else "\u2717"
+            for key, _, _, label in ARTIFACTS:
+                if key == "vendors":
+                    continue
+                mark = "\u2713" if project["artifacts"][key] else "\u2717"
                 print(f"      {mark} {label}")
 
             if vendor_count > 0:
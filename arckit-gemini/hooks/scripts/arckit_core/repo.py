@@ -0,0 +1,123 @@
+"""
+Repository root discovery and standard ArcKit paths.
+
+The root is the nearest ancestor containing the marker directory:
+ROOT_MARKER (".arckit") for CLI-initialised repos, "projects" for plugin
+repos (the plugin copies of common.py pass marker="projects"). Helpers that
+resolve the root themselves when repo_root is None take the same marker
+argument. ARCKIT_ROOT overrides the walk for paths inside it.
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+from .log import log_error
+
+ROOT_MARKER = ".arckit"
+
+# Per-process cache: (marker, absolute start directory) -> resolved repo root
+_repo_root_cache = {}
+
+
+def find_repo_root(start_dir=None, required=True, marker=None):
+    """Find the repository root by looking for the marker directory
+    (default ROOT_MARKER).
+
+    ARCKIT_ROOT, when set, is used as the root without walking the tree,
+    unless start_dir lies outside it (then start_dir's own root is found).
+    Otherwise the result is cached per start directory, so helpers that
+    default repo_root=None resolve it only once per process. With
+    required=False, returns None instead of exiting when no root is found.
+    """
+    override = os.environ.get("ARCKIT_ROOT")
+    if override:
+        if not os.path.isdir(override):
+            log_error(f"ARCKIT_ROOT is not a directory: {override}")
+            sys.exit(1)
+        if start_dir is None or is_within(start_dir, override):
+            return os.path.abspath(override)
+
+    marker = marker or ROOT_MARKER
+    start = os.path.abspath(start_dir or os.getcwd())
+    cached = _repo_root_cache.get((marker, start))
+    if cached:
+        return cached
+
+    current = Path(start).resolve()
+    while current != current.parent:
+        if (current / marker).is_dir():
+            _repo_root_cache[(marker, start)] = str(current)
+            return str(current)
+        current = current.parent
+    if not required:
+        return None
+    label = marker if marker.startswith(".") else f"{marker}/"
+    log_error(f"Not in an ArcKit project (no {label} directory found)")
+    sys.exit(1)
+
+
+def is_within(path, root):
+    """True if path is root or inside it (symlinks resolved)."""
+    path, root = os.path.realpath(path), os.path.realpath(root)
+    try:
+        return os.path.commonpath([path, root]) == root
+    except ValueError:  # different drives
+        return False
+
+
+def user_cache_dir():
+    """Per-user ArcKit cache directory (not created)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "arckit")
+
+
+def get_arckit_dir(repo_root=None, marker=None):
+    """Get .arckit directory path."""
+    if repo_root is None:
+        repo_root = find_repo_root(marker=marker)
+    return os.path.join(repo_root, ".arckit")
+
+
+def get_state_dir(repo_root=None, marker=None):
+    """Get the directory for counters and allocation state (not created).
+
+    .arckit/state/ in repos that have an .arckit/ directory. Plugin repos
+    (projects/ only) keep their state in a per-repo directory under the
+    user cache instead, so allocating a number never adds .arckit/ to them.
+    """
+    if repo_root is None:
+        repo_root = find_repo_root(marker=marker)
+    arckit_dir = os.path.join(repo_root, ".arckit")
+    if os.path.isdir(arckit_dir):
+        return os.path.join(arckit_dir, "state")
+    real_root = os.path.realpath(repo_root)
+    key = hashlib.sha1(real_root.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(user_cache_dir(), "state", f"{os.path.basename(real_root)}-{key}")
+
+
+def get_templates_dir(repo_root=None, marker=None):
+    """Get templates directory path."""
+    if repo_root is None:
+        repo_root = find_repo_root(marker=marker)
+    return os.path.join(repo_root, ".arckit", "templates")
+
+
+def get_projects_dir(repo_root=None, marker=None):
+    """Get projects directory path."""
+    if repo_root is None:
+        repo_root = find_repo_root(marker=marker)
+    return os.path.join(repo_root, "projects")
+
+
+def get_memory_dir(repo_root=None, marker=None):
+    """Get memory directory path (000-global)."""
+    if repo_root is None:
+        repo_root = find_repo_root(marker=marker)
+    return os.path.join(repo_root, "projects", "000-global")
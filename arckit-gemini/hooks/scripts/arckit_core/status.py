@@ -0,0 +1,175 @@
+"""
+Project status records and completion scoring.
+
+Completion is scored from the project's own ARC-* filenames
+(ARC-001-REQ-v1.0.md counts as REQ in project 001) found in the project
+directory and its artifact subdirectories, weighted by doc type code
+or DOC_TYPES category. Legacy unversioned filenames (requirements.md,
+sow.md, ...) still count for their type.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from .doc_types import ARTIFACT_SUBDIRS, DOC_TYPES, classify_filename
+from .projects import (
+    get_project_number_from_dir, snapshot_project, snapshot_files, snapshot_subdirs,
+)
+
+# (JSON key, doc type code, legacy artifact path, verbose label) -- a legacy
+# path with a trailing "/" means a non-empty directory. Vendors are listed
+# separately in verbose output.
+ARTIFACTS = [
+    ("stakeholder_drivers", "STKE", "stakeholder-drivers.md", "Stakeholder Drivers"),
+    ("risk_register", "RISK", "risk-register.md", "Risk Register"),
+    ("sobc", "SOBC", "sobc.md", "Strategic Outline Business Case"),
+    ("requirements", "REQ", "requirements.md", "Requirements"),
+    ("data_model", "DATA", "data-model.md", "Data Model"),
+    ("research_findings", "RSCH", "research-findings.md", "Research Findings"),
+    ("wardley_maps", "WARD", "wardley-maps/", "Wardley Maps"),
+    ("sow", "SOW", "sow.md", "Statement of Work"),
+    ("evaluation_criteria", "EVAL", "evaluation-criteria.md", "Evaluation Criteria"),
+    ("vendors", "VEND", "vendors/", "Vendor Proposals"),
+]
+
+# Doc type code -> legacy artifact that also satisfies it
+LEGACY_ARTIFACTS = {code: legacy for _, code, legacy, _ in ARTIFACTS}
+
+# Default completion weights: the standard artifacts, equally weighted
+DEFAULT_COMPLETION_WEIGHTS = {code: 1 for _, code, _, _ in ARTIFACTS}
+
+WEIGHTS_FILE = "completion-weights.json"
+
+CATEGORIES = {meta["category"] for meta in DOC_TYPES.values()}
+
+
+def check_artifact(snapshot, artifact):
+    """Check if an artifact exists (file or non-empty directory)."""
+    entries = snapshot["entries"]
+    if artifact.endswith("/"):
+        return bool(entries.get(artifact.rstrip("/")))
+    entry = entries[""].get(artifact)
+    return entry is not None and not entry[0]
+
+
+def count_vendors(snapshot):
+    """Count vendor proposal directories."""
+    return len(snapshot_subdirs(snapshot, "vendors"))
+
+
+def count_external_docs(snapshot):
+    """Count external documents (excluding README.md)."""
+    extensions = {".pdf", ".docx", ".md", ".csv", ".sql", ".png", ".jpg"}
+    count = 0
+    for fname in snapshot_files(snapshot, "external"):
+        if fname == "README.md":
+            continue
+        if Path(fname).suffix.lower() in extensions:
+            count += 1
+    return count
+
+
+def project_doc_types(snapshot, project_number=None):
+    """Set of known doc type codes with an ARC-* file in the project.
+
+    Only the project root and ARTIFACT_SUBDIRS are searched, so copies
+    under external/ or vendors/ do not count. With project_number set,
+    files numbered for another project are ignored too.
+    """
+    types = set()
+    for subdir in [""] + ARTIFACT_SUBDIRS:
+        for name in snapshot_files(snapshot, subdir):
+            parsed = classify_filename(name)
+            if not parsed or parsed.doc_type not in DOC_TYPES:
+                continue
+            if project_number and parsed.project != project_number:
+                continue
+            types.add(parsed.doc_type)
+    return types
+
+
+def has_doc_type(snapshot, doc_types, code):
+    """Check for an ARC-* document of `code`, falling back to its legacy artifact."""
+    if code in doc_types:
+        return True
+    legacy = LEGACY_ARTIFACTS.get(code)
+    return bool(legacy) and check_artifact(snapshot, legacy)
+
+
+def calculate_completion(snapshot, doc_types, weights=None):
+    """Calculate weighted completion percentage from the project's doc types.
+
+    `weights` maps doc type codes or DOC_TYPES categories to weights
+    (default: DEFAULT_COMPLETION_WEIGHTS).
+    """
+    if weights is None:
+        weights = DEFAULT_COMPLETION_WEIGHTS
+    total = sum(weights.values())
+    if total <= 0:
+        return 0
+
+    categories = {DOC_TYPES[code]["category"] for code in doc_types}
+    completed = 0
+    for key, weight in weights.items():
+        if key in categories or has_doc_type(snapshot, doc_types, key):
+            completed += weight
+
+    return int(completed * 100 // total)
+
+
+def load_completion_weights(path):
+    """Load and validate a completion weights JSON file.
+
+    Raises ValueError (with a message naming the file) if it cannot be read
+    or is not a non-empty object of known codes/categories to non-negative
+    numbers.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            weights = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cannot read completion weights {path}: {e}") from e
+
+    if not isinstance(weights, dict) or not weights:
+        raise ValueError(f"Completion weights must be a non-empty JSON object: {path}")
+    for key, weight in weights.items():
+        if key not in DOC_TYPES and key not in CATEGORIES:
+            raise ValueError(f"Unknown doc type code or category in {path}: {key}")
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"Weight for {key} must be a non-negative number: {path}")
+    return weights
+
+
+def scan_project(project_dir, weights=None):
+    """Build one project's record from a single directory snapshot."""
+    pdir = str(project_dir)
+    snapshot = snapshot_project(pdir, mtimes=False)
+    number = get_project_number_from_dir(pdir)
+    doc_types = project_doc_types(snapshot, number)
+    return {
+        "name": Path(pdir).name,
+        "number": number or "",
+        "path": pdir,
+        "completion_percentage": calculate_completion(snapshot, doc_types, weights),
+        "vendor_count": count_vendors(snapshot),
+        "external_doc_count": count_external_docs(snapshot),
+        "artifacts": {
+            key: has_doc_type(snapshot, doc_types, code) for key, code, _, _ in ARTIFACTS
+        },
+    }
+
+
+def scan_projects(project_dirs, jobs=1, weights=None):
+    """Yield project records in directory order.
+
+    With jobs > 1 projects are scanned on a thread pool; scanning is
+    I/O bound, so this pays off mainly on network filesystems.
+    """
+    if jobs <= 1:
+        for pd in project_dirs:
+            yield scan_project(pd, weights)
+        return
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(partial(scan_project, weights=weights), project_dirs)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+ArcKit BeforeTool Hook for Gemini CLI -- Combined Dispatcher.
+
+Runs ARC filename validation and file protection in a single process, so
+each write_file/edit_file call pays for one interpreter start and one
+hook_utils import instead of two.
+
+Order matters and mirrors the previous separate hook entries:
+  1. validate-filename (write_file only) -- may block, or rewrite file_path
+  2. file-protection -- checks the final (possibly corrected) file_path
+
+The individual scripts remain runnable on their own.
+
+Hook Type: BeforeTool
+Input (stdin): JSON with tool_name, tool_input, cwd, etc.
+Output (stdout): JSON with updatedInput and/or additionalContext, or nothing
+Exit codes: 0 = allow, 2 = block
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from hook_utils import parse_hook_input, emit_decision, load_hook_module
+
+
+def before_tool(data):
+    """Run all BeforeTool checks and return one merged hook decision."""
+    decision = {}
+
+    if data.get("tool_name") == "write_file":
+        decision = load_hook_module("validate-filename").validate_filename(data)
+        if decision.get("block"):
+            return decision
+        if "updatedInput" in decision:
+            data = dict(data, tool_input=decision["updatedInput"])
+
+    protection = load_hook_module("file-protection").check_file_protection(data)
+    if protection.get("block"):
+        return protection
+
+    return {**decision, **protection}
+
+
+def main():
+    data = parse_hook_input()
+    if not data:
+        sys.exit(0)
+    emit_decision(before_tool(data))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
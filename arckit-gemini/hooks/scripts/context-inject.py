@@ -6,6 +6,11 @@ Pre-computes project context when any /arckit: command is run.
 Injects project inventory, artifact lists, and external documents
 via additionalContext so commands don't need to discover this themselves.
 
+Rendered per-project sections are cached in .arckit/cache/ and only
+regenerated for projects whose directories changed since the last run.
+When the prompt names a project (e.g. /arckit:requirements 001), only that
+project and 000-global are scanned; other projects get a one-line summary.
+
 Python equivalent of arckit-claude/hooks/arckit-context.mjs.
 
 Hook Type: BeforeAgent
@@ -19,11 +24,90 @@ import sys
 
 sys.path.insert(0, os.path.dirname(__file__))
 from hook_utils import (
-    parse_hook_input, is_dir, is_file, read_text,
-    list_dir, mtime_ms, find_repo_root, extract_doc_type,
-    doc_type_name, output_context, SUBDIR_MAP, ARTIFACT_SUBDIRS,
+    parse_hook_input, is_dir, read_text, find_repo_root,
+    doc_type_name, output_context, load_artifact_index, newest_artifact_mtime,
+    load_cache, save_cache, list_project_names,
 )
 
+SECTIONS_CACHE = "context-sections.json"
+
+
+def render_project_section(projects_dir, project_name, entry):
+    """Render the markdown context section for one project."""
+    lines = []
+    project_dir = os.path.join(projects_dir, project_name)
+
+    # Extract project number
+    project_number = ""
+    pm = re.match(r"^(\d{3})-", project_name)
+    if pm:
+        project_number = pm.group(1)
+
+    lines.append(f"### {project_name}")
+    lines.append(f"- **Path**: {project_dir}")
+    if project_number:
+        lines.append(f"- **Project ID**: {project_number}")
+
+    # ARC-* artifacts in main project dir and artifact subdirectories
+    artifacts = entry["artifacts"]
+    if artifacts:
+        lines.append(f"- **Artifacts** ({len(artifacts)}):")
+        for artifact in artifacts:
+            dname = doc_type_name(artifact["type"])
+            lines.append(f"  - `{artifact['path']}` ({dname})")
+    else:
+        lines.append("- **Artifacts**: none")
+
+    # Vendor directories and profiles
+    vendors = entry["vendors"]
+    if vendors["dirs"] or vendors["profiles"]:
+        lines.append(f"- **Vendors** ({len(vendors['dirs']) + len(vendors['profiles'])}):")
+        lines.extend(f"  - {vname}" for vname in vendors["profiles"])
+        lines.extend(f"  - {vname}" for vname in vendors["dirs"])
+
+    # Tech notes
+    if entry["techNotes"]:
+        lines.append(f"- **Tech Notes** ({len(entry['techNotes'])}):")
+        lines.extend(f"  - {f}" for f in entry["techNotes"])
+
+    # External documents
+    if entry["external"]:
+        newest_artifact = newest_artifact_mtime(entry)
+        lines.append(f"- **External documents** ({len(entry['external'])}) in `external/`:")
+        for ext in entry["external"]:
+            if ext["mtime"] > newest_artifact:
+                lines.append(f"  - `{ext['name']}` (**NEW** -- newer than latest artifact)")
+            else:
+                lines.append(f"  - `{ext['name']}`")
+
+    lines.append("")  # blank line between projects
+    return "\n".join(lines)
+
+
+def match_project(names, args):
+    """Find the project named in the command arguments, or None.
+
+    Accepts a project number ("1", "001"), a full directory name
+    ("001-fuel-prices") or a bare slug ("fuel-prices"). 000-global is
+    never a scoping target since it is always included.
+    """
+    for token in re.findall(r"[A-Za-z0-9][A-Za-z0-9_-]*", args.lower()):
+        nm = re.match(r"^(\d{1,3})(?:-|$)", token)
+        for name in names:
+            if name == "000-global":
+                continue
+            if name.lower() == token or name[4:].lower() == token:
+                return name
+            if nm and name.startswith(nm.group(1).zfill(3) + "-"):
+                return name
+    return None
+
+
+def section_key(entry):
+    """Cache key for a rendered section: tracked dir mtimes + newest artifact."""
+    return {"dirs": entry["dirs"], "newest": newest_artifact_mtime(entry)}
+
+
 data = parse_hook_input()
 user_prompt = data.get("prompt", "")
 
@@ -60,125 +144,70 @@ lines.append("## ArcKit Project Context (auto-detected by hook)\n")
 lines.append(f"Repository: {repo_root}")
 lines.append(f"ArcKit Version: {arckit_version}\n")
 
-# Count projects
-project_entries = [
-    e for e in list_dir(projects_dir)
-    if is_dir(os.path.join(projects_dir, e))
-]
+# Scoping: when the prompt names a project (/arckit:<cmd> 001 ...), only that
+# project and 000-global are scanned and rendered in full; the rest are
+# summarised one line each. ARCKIT_CONTEXT_SCOPE=all disables scoping.
+scoped_project = None
+command_args = user_prompt[cmd_match.end():] if cmd_match else ""
+if command_args.strip() and os.environ.get("ARCKIT_CONTEXT_SCOPE", "auto") != "all":
+    scoped_project = match_project(list_project_names(repo_root), command_args)
+
+# Load the persistent artifact index (rescans only changed projects)
+if scoped_project:
+    index = load_artifact_index(repo_root, only={scoped_project, "000-global"})
+else:
+    index = load_artifact_index(repo_root)
+project_entries = index["names"]
 lines.append(f"**{len(project_entries)} project(s) found:**\n")
-
-# Scan each project
+if scoped_project:
+    lines.append(
+        f"Context scoped to **{scoped_project}** (named in the command); "
+        "other projects are summarised below.\n"
+    )
+
+# Render each project, reusing cached sections whose directories are unchanged
+# (sections from another checkout location or ArcKit version are discarded)
+cached = load_cache(repo_root, SECTIONS_CACHE) or {}
+cached_sections = {}
+if cached.get("root") == repo_root and cached.get("version") == arckit_version:
+    cached_sections = cached.get("sections", {})
+sections = dict(cached_sections)
+summary = []
 for project_name in project_entries:
-    project_dir = os.path.join(projects_dir, project_name)
-
-    # Extract project number
-    project_number = ""
-    pm = re.match(r"^(\d{3})-", project_name)
-    if pm:
-        project_number = pm.group(1)
-
-    lines.append(f"### {project_name}")
-    lines.append(f"- **Path**: {project_dir}")
-    if project_number:
-        lines.append(f"- **Project ID**: {project_number}")
-
-    # Scan for ARC-* artifacts in main project dir
-    artifact_list = []
-    artifact_count = 0
-    newest_artifact_mtime = 0
-
-    for f in list_dir(project_dir):
-        fp = os.path.join(project_dir, f)
-        if is_file(fp) and f.startswith("ARC-") and f.endswith(".md"):
-            dtype = extract_doc_type(f) or f
-            dname = doc_type_name(dtype)
-            artifact_list.append(f"  - `{f}` ({dname})")
-            artifact_count += 1
-            amtime = mtime_ms(fp)
-            if amtime > newest_artifact_mtime:
-                newest_artifact_mtime = amtime
-
-    # Also scan subdirectories
-    for subdir in ARTIFACT_SUBDIRS:
-        sub_path = os.path.join(project_dir, subdir)
-        if is_dir(sub_path):
-            for f in list_dir(sub_path):
-                fp = os.path.join(sub_path, f)
-                if is_file(fp) and f.startswith("ARC-") and f.endswith(".md"):
-                    dtype = extract_doc_type(f) or f
-                    dname = doc_type_name(dtype)
-                    artifact_list.append(f"  - `{subdir}/{f}` ({dname})")
-                    artifact_count += 1
-                    amtime = mtime_ms(fp)
-                    if amtime > newest_artifact_mtime:
-                        newest_artifact_mtime = amtime
-
-    if artifact_count > 0:
-        lines.append(f"- **Artifacts** ({artifact_count}):")
-        lines.extend(artifact_list)
+    entry = index["projects"].get(project_name)
+    if scoped_project and project_name not in (scoped_project, "000-global"):
+        if entry is not None:
+            summary.append(f"- {project_name} ({len(entry['artifacts'])} artifact(s))")
+        else:
+            summary.append(f"- {project_name}")
+        continue
+    key = section_key(entry)
+    hit = cached_sections.get(project_name)
+    if hit and hit.get("key") == key:
+        text = hit["text"]
     else:
-        lines.append("- **Artifacts**: none")
-
-    # Check for vendor directories and profiles
-    vendors_dir = os.path.join(project_dir, "vendors")
-    if is_dir(vendors_dir):
-        vendor_dirs = []
-        vendor_profiles = []
-        for vname in list_dir(vendors_dir):
-            vpath = os.path.join(vendors_dir, vname)
-            if is_dir(vpath):
-                vendor_dirs.append(f"  - {vname}")
-            elif is_file(vpath) and vname.endswith("-profile.md"):
-                vendor_profiles.append(f"  - {vname}")
-        if vendor_dirs or vendor_profiles:
-            lines.append(f"- **Vendors** ({len(vendor_dirs) + len(vendor_profiles)}):")
-            lines.extend(vendor_profiles)
-            lines.extend(vendor_dirs)
-
-    # Check for tech notes
-    tech_notes_dir = os.path.join(project_dir, "tech-notes")
-    if is_dir(tech_notes_dir):
-        note_list = []
-        for f in list_dir(tech_notes_dir):
-            if is_file(os.path.join(tech_notes_dir, f)) and f.endswith(".md"):
-                note_list.append(f"  - {f}")
-        if note_list:
-            lines.append(f"- **Tech Notes** ({len(note_list)}):")
-            lines.extend(note_list)
-
-    # Check for external documents
-    external_dir = os.path.join(project_dir, "external")
-    if is_dir(external_dir):
-        ext_list = []
-        for f in list_dir(external_dir):
-            fp = os.path.join(external_dir, f)
-            if not is_file(fp):
-                continue
-            if f == "README.md":
-                continue
-            ext_mtime = mtime_ms(fp)
-            if ext_mtime > newest_artifact_mtime:
-                ext_list.append(f"  - `{f}` (**NEW** -- newer than latest artifact)")
-            else:
-                ext_list.append(f"  - `{f}`")
-        if ext_list:
-            lines.append(f"- **External documents** ({len(ext_list)}) in `external/`:")
-            lines.extend(ext_list)
-
-    lines.append("")  # blank line between projects
-
-# Check for global policies
-policies_dir = os.path.join(projects_dir, "000-global", "policies")
-if is_dir(policies_dir):
-    policy_list = []
-    for f in list_dir(policies_dir):
-        fp = os.path.join(policies_dir, f)
-        if is_file(fp):
-            policy_list.append(f"  - `{f}`")
-    if policy_list:
-        lines.append("### Global Policies (000-global/policies/)")
-        lines.extend(policy_list)
-        lines.append("")
+        text = render_project_section(projects_dir, project_name, entry)
+    sections[project_name] = {"key": key, "text": text}
+    lines.append(text)
+
+if summary:
+    lines.append("### Other projects (summary)")
+    lines.extend(summary)
+    lines.append("")
+
+# Drop sections for projects that no longer exist
+sections = {n: sections[n] for n in project_entries if n in sections}
+if sections != cached_sections:
+    save_cache(repo_root, SECTIONS_CACHE, {
+        "root": repo_root, "version": arckit_version, "sections": sections,
+    })
+
+# Global policies
+global_entry = index["projects"].get("000-global")
+if global_entry and global_entry["policies"]:
+    lines.append("### Global Policies (000-global/policies/)")
+    lines.extend(f"  - `{f}`" for f in global_entry["policies"])
+    lines.append("")
 
 context_text = "\n".join(lines)
 output_context(context_text)
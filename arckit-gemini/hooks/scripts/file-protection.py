@@ -18,7 +18,7 @@ import re
 import sys
 
 sys.path.insert(0, os.path.dirname(__file__))
-from hook_utils import parse_hook_input, output_json, output_block
+from hook_utils import parse_hook_input, emit_decision
 
 # Files and paths to protect
 PROTECTED_PATHS = [
@@ -149,39 +149,52 @@ def is_protected(file_path):
     return False, ""
 
 
-# --- Main ---
-input_data = parse_hook_input()
-if not input_data:
-    sys.exit(0)
+def check_file_protection(data):
+    """Check a write/edit tool call against the protection rules.
 
-tool_name = input_data.get("tool_name", "")
-file_path = input_data.get("tool_input", {}).get("file_path", "")
+    Returns a hook decision: {} to allow, {"block": reason} for protected
+    files, or {"additionalContext": hint} for files that look like config.
+    """
+    tool_name = data.get("tool_name", "")
+    file_path = data.get("tool_input", {}).get("file_path", "")
 
-# Only check write-related tools
-if tool_name not in ("write_file", "edit_file", "Edit", "Write"):
-    sys.exit(0)
-if not file_path:
-    sys.exit(0)
+    # Only check write-related tools
+    if tool_name not in ("write_file", "edit_file", "Edit", "Write"):
+        return {}
+    if not file_path:
+        return {}
 
-blocked, reason = is_protected(file_path)
+    blocked, reason = is_protected(file_path)
 
-if blocked:
-    output_block(
-        f"Protected: {reason}\n"
-        f"File: {file_path}\n"
-        f"Edit manually outside Gemini CLI, or add an exception in file-protection.py."
-    )
+    if blocked:
+        return {
+            "block": (
+                f"Protected: {reason}\n"
+                f"File: {file_path}\n"
+                f"Edit manually outside Gemini CLI, or add an exception in file-protection.py."
+            )
+        }
 
-# Return additionalContext for allowed files with hints
-file_path_lower = file_path.lower()
-if any(kw in file_path_lower for kw in ("config", "settings", "setup")):
-    output_json({
-        "hookSpecificOutput": {
+    # Return additionalContext for allowed files with hints
+    file_path_lower = file_path.lower()
+    if any(kw in file_path_lower for kw in ("config", "settings", "setup")):
+        return {
             "additionalContext": (
                 f"Note: {file_path} may contain configuration. "
                 "Ensure no secrets are included."
             ),
         }
-    })
 
-sys.exit(0)
+    return {}
+
+
+def main():
+    input_data = parse_hook_input()
+    if not input_data:
+        sys.exit(0)
+    emit_decision(check_file_protection(input_data))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+ArcKit Hook Client for Gemini CLI.
+
+Thin entry point used by hooks.json: forwards stdin to the optional hook
+daemon (hook-daemon.py) over a Unix socket and replays its stdout, stderr
+and exit code. When no daemon is listening, the hook script is executed
+in this process instead, so hooks behave identically either way.
+
+Usage:
+    python3 hook-client.py HOOK_NAME   (e.g. context-inject)
+
+Environment:
+    ARCKIT_HOOK_SOCKET   Socket path (default: $XDG_RUNTIME_DIR/arckit-hooks.sock,
+                         else <tmpdir>/arckit-<uid>/hooks.sock); its directory
+                         must be owned by you and not group/world-writable
+    ARCKIT_HOOK_DAEMON   Set to 1 to start the daemon in the background when
+                         it is not running (this call still runs in-process)
+
+The socket is only used if it and its directory belong to the current user
+and are not writable by anyone else; otherwise the hook runs in-process.
+A daemon started from different hook code (e.g. before an extension
+upgrade) is asked to exit and is restarted.
+
+Kept deliberately small: only stdlib modules needed to talk to the socket
+are imported on the daemon path.
+"""
+
+import json
+import os
+import socket
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+from hook_socket import socket_path, is_trusted_socket, code_fingerprint  # noqa: E402
+
+CONNECT_TIMEOUT = 0.5
+RESPONSE_TIMEOUT = 60
+
+
+def connect():
+    """Connect to the daemon, return a socket or None if unavailable."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path()
+    if not is_trusted_socket(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def run_via_daemon(sock, hook, stdin_text):
+    """Send one request and replay the response.
+
+    Returns the exit code, or None if the daemon is running different hook
+    code and exited without running the request.
+    """
+    request = {
+        "hook": hook,
+        "fingerprint": code_fingerprint(SCRIPT_DIR),
+        "stdin": stdin_text,
+        "cwd": os.getcwd(),
+        "env": {
+            k: v for k, v in os.environ.items()
+            if k.startswith("ARCKIT_") or k == "extensionPath"
+        },
+    }
+    sock.settimeout(RESPONSE_TIMEOUT)
+    with sock:
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    response = json.loads(b"".join(chunks).decode("utf-8"))
+    if response.get("restart"):
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response.get("code", 0)
+
+
+def run_in_process(hook, stdin_text):
+    """Execute the hook script in this interpreter (daemon unavailable)."""
+    import io
+    import runpy
+    sys.stdin = io.StringIO(stdin_text)
+    sys.argv = [os.path.join(SCRIPT_DIR, f"{hook}.py")]
+    runpy.run_path(sys.argv[0], run_name="__main__")
+    return 0
+
+
+def start_daemon():
+    """Spawn hook-daemon.py detached from this process."""
+    import subprocess
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.join(SCRIPT_DIR, "hook-daemon.py")],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def main():
+    if len(sys.argv) != 2 or not sys.argv[1].replace("-", "").isalpha():
+        sys.stderr.write("Usage: hook-client.py HOOK_NAME\n")
+        sys.exit(1)
+    hook = sys.argv[1]
+    if not os.path.isfile(os.path.join(SCRIPT_DIR, f"{hook}.py")):
+        sys.stderr.write(f"[ArcKit] Unknown hook: {hook}\n")
+        sys.exit(1)
+
+    try:
+        stdin_text = sys.stdin.read()
+    except Exception:
+        stdin_text = ""
+
+    sock = connect()
+    if sock is not None:
+        try:
+            code = run_via_daemon(sock, hook, stdin_text)
+        except (OSError, ValueError) as e:
+            # The request may already have run; fail open rather than rerun it
+            sys.stderr.write(f"[ArcKit] Hook daemon error ({hook}): {e}\n")
+            code = 0
+        if code is not None:
+            sys.stdout.flush()
+            sys.exit(code)
+        # Stale daemon (hook code changed since it started): replace it
+        start_daemon()
+    elif os.environ.get("ARCKIT_HOOK_DAEMON") == "1":
+        start_daemon()
+    sys.exit(run_in_process(hook, stdin_text))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+ArcKit Hook Daemon for Gemini CLI (optional).
+
+Long-running local server that executes ArcKit hook scripts in-process so
+each hook invocation skips interpreter startup, the hook_utils import
+(DOC_TYPES, compiled patterns) and reloading the artifact index. Hook
+entries in hooks.json call hook-client.py, which forwards stdin to this
+daemon over a Unix socket and falls back to running the hook itself when
+the daemon is not running.
+
+Usage:
+    python3 hook-daemon.py [--socket PATH] [--idle-timeout SECONDS]
+
+Start it manually, or set ARCKIT_HOOK_DAEMON=1 so hook-client.py starts
+it in the background on first use. The daemon exits after --idle-timeout
+seconds without requests (default 1800).
+
+The socket lives in a directory only the current user can write (see
+hook_socket.py); the daemon refuses to start anywhere else. It also exits
+when a client's hook code fingerprint differs from the one it started
+with, so an extension upgrade never runs new hook scripts against helper
+modules loaded from the old version.
+
+Protocol: one JSON request line per connection
+    {"hook": "context-inject", "fingerprint": "...", "stdin": "...", "cwd": "...", "env": {...}}
+answered by one JSON response line
+    {"code": 0, "stdout": "...", "stderr": "..."}
+or, when the fingerprint does not match (the daemon then exits),
+    {"restart": true}
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+import hook_utils  # noqa: E402,F401 -- imported once to keep doc types and patterns warm
+from hook_socket import socket_path, ensure_socket_dir, code_fingerprint  # noqa: E402
+
+# Hook names are plain script stems in this directory (no paths)
+HOOK_NAME_RE = re.compile(r"^[a-z][a-z-]*$")
+
+# Environment variables taken from the client for the duration of a request;
+# the daemon's own values for these are hidden while a request runs
+FORWARDED_ENV_RE = re.compile(r"^(ARCKIT_\w+|extensionPath)$")
+
+DEFAULT_IDLE_TIMEOUT = 1800
+
+
+class HookRunner:
+    """Executes hook scripts in this process with captured stdio.
+
+    Hook scripts mutate process globals (stdin/stdout, cwd, environ), so
+    requests are serialised with a lock. The forwarded variables (ARCKIT_*,
+    extensionPath) are replaced wholesale by the request's, so a value set
+    in the daemon's own environment never leaks into a request that does
+    not set it. Compiled script code is cached and recompiled only when the
+    script file changes.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.code_cache = {}
+
+    def compile_hook(self, path):
+        mtime = os.stat(path).st_mtime_ns
+        cached = self.code_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(path, "r", encoding="utf-8") as f:
+            code = compile(f.read(), path, "exec")
+        self.code_cache[path] = (mtime, code)
+        return code
+
+    def run(self, hook, stdin_text, cwd, env):
+        if not HOOK_NAME_RE.match(hook or ""):
+            return {"code": 1, "stdout": "", "stderr": f"Invalid hook name: {hook!r}\n"}
+        path = os.path.join(SCRIPT_DIR, f"{hook}.py")
+        if not os.path.isfile(path):
+            return {"code": 1, "stdout": "", "stderr": f"Unknown hook: {hook}\n"}
+
+        with self.lock:
+            out, err = io.StringIO(), io.StringIO()
+            saved_stdin, saved_argv, saved_path = sys.stdin, sys.argv, list(sys.path)
+            saved_cwd = os.getcwd()
+            saved_env = {k: v for k, v in os.environ.items() if FORWARDED_ENV_RE.match(k)}
+            code = 0
+            try:
+                for k in saved_env:
+                    del os.environ[k]
+                os.environ.update(env)
+                if cwd and os.path.isdir(cwd):
+                    os.chdir(cwd)
+                sys.stdin = io.StringIO(stdin_text)
+                sys.argv = [path]
+                with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                    try:
+                        exec(self.compile_hook(path), {"__name__": "__main__", "__file__": path})
+                    except SystemExit as e:
+                        if e.code is None:
+                            code = 0
+                        elif isinstance(e.code, int):
+                            code = e.code
+                        else:
+                            err.write(f"{e.code}\n")
+                            code = 1
+                    except Exception:
+                        traceback.print_exc(file=err)
+                        code = 1
+            finally:
+                sys.stdin, sys.argv, sys.path[:] = saved_stdin, saved_argv, saved_path
+                os.chdir(saved_cwd)
+                for k in [k for k in os.environ if FORWARDED_ENV_RE.match(k)]:
+                    del os.environ[k]
+                os.environ.update(saved_env)
+            return {"code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.server.last_request = time.monotonic()
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+        except (json.JSONDecodeError, ValueError, UnicodeDecodeError):
+            return
+        if request.get("fingerprint") != self.server.fingerprint:
+            # Hook code changed since startup: free the socket path, answer,
+            # then exit so the client starts a fresh daemon. Replying before
+            # shutting down matters: handler threads die with the process.
+            self.server.remove_socket_file()
+            self.wfile.write(b'{"restart": true}\n')
+            self.server.shutdown_soon()
+            return
+        env = {
+            k: str(v) for k, v in (request.get("env") or {}).items()
+            if FORWARDED_ENV_RE.match(k)
+        }
+        response = self.server.runner.run(
+            request.get("hook", ""), request.get("stdin", ""), request.get("cwd", ""), env,
+        )
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+        self.server.last_request = time.monotonic()
+
+
+class HookServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path):
+        self.runner = HookRunner()
+        self.fingerprint = code_fingerprint(SCRIPT_DIR)
+        self.last_request = time.monotonic()
+        super().__init__(socket_path, HookRequestHandler)
+        st = os.stat(socket_path)
+        self.socket_id = (st.st_dev, st.st_ino)
+
+    def owns_socket_file(self):
+        """True if the socket path still refers to this server's socket."""
+        try:
+            st = os.stat(self.server_address)
+        except OSError:
+            return False
+        return (st.st_dev, st.st_ino) == self.socket_id
+
+    def remove_socket_file(self):
+        if self.owns_socket_file():
+            with contextlib.suppress(OSError):
+                os.unlink(self.server_address)
+
+    def shutdown_soon(self):
+        """Shut down from a request handler (shutdown() would deadlock there)."""
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+
+def remove_stale_socket(socket_path):
+    """Remove a leftover socket file. Returns False if a daemon is already live."""
+    if not os.path.exists(socket_path):
+        return True
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+        return False
+    except OSError:
+        os.unlink(socket_path)
+        return True
+    finally:
+        probe.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ArcKit Gemini hook daemon")
+    parser.add_argument("--socket", default=socket_path(), help="Unix socket path")
+    parser.add_argument("--idle-timeout", type=int, default=DEFAULT_IDLE_TIMEOUT,
+                        help=f"Exit after this many idle seconds (default: {DEFAULT_IDLE_TIMEOUT}, 0 = never)")
+    args = parser.parse_args()
+
+    if not hasattr(socket, "AF_UNIX"):
+        sys.stderr.write("[ArcKit] Unix sockets are not supported on this platform\n")
+        sys.exit(1)
+    if not ensure_socket_dir(args.socket):
+        sys.stderr.write(
+            f"[ArcKit] Socket directory {os.path.dirname(os.path.abspath(args.socket))} "
+            "must be owned by you and not writable by group or others\n"
+        )
+        sys.exit(1)
+    if not remove_stale_socket(args.socket):
+        sys.stderr.write(f"[ArcKit] Hook daemon already running on {args.socket}\n")
+        sys.exit(0)
+
+    old_umask = os.umask(0o077)
+    try:
+        server = HookServer(args.socket)
+    finally:
+        os.umask(old_umask)
+
+    if args.idle_timeout > 0:
+        def watch_idle():
+            while True:
+                time.sleep(min(args.idle_timeout, 30))
+                if time.monotonic() - server.last_request > args.idle_timeout:
+                    server.shutdown()
+                    return
+        threading.Thread(target=watch_idle, daemon=True).start()
+
+    # Exit through the finally block on SIGTERM so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        # A replacement daemon may already be listening on the same path
+        server.remove_socket_file()
+
+
+if __name__ == "__main__":
+    main()
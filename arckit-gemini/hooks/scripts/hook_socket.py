@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Hook daemon socket location and trust checks, shared by hook-client.py and
+hook-daemon.py.
+
+The client replays whatever the daemon answers as the hook result, so it
+only talks to a socket that belongs to the current user and sits in a
+directory nobody else can write to. The default socket is
+$XDG_RUNTIME_DIR/arckit-hooks.sock, or <tmpdir>/arckit-<uid>/hooks.sock
+(a 0700 directory created by the daemon) when XDG_RUNTIME_DIR is not set.
+
+Kept to stdlib modules that are cheap to import: the client loads this on
+every hook call.
+"""
+
+import hashlib
+import os
+import stat
+import tempfile
+
+
+def socket_path():
+    """Per-user socket path, overridable with ARCKIT_HOOK_SOCKET."""
+    override = os.environ.get("ARCKIT_HOOK_SOCKET")
+    if override:
+        return override
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and is_private_dir(runtime_dir):
+        return os.path.join(runtime_dir, "arckit-hooks.sock")
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"arckit-{uid}", "hooks.sock")
+
+
+def _owned_and_private(st):
+    """True if owned by this user and not writable by group or others."""
+    if not hasattr(os, "getuid"):
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def is_private_dir(path):
+    """True if path is a real directory owned by this user that only it can write."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and _owned_and_private(st)
+
+
+def is_trusted_socket(path):
+    """True if path is this user's socket, in a directory only this user can write."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(st.st_mode)
+        and _owned_and_private(st)
+        and is_private_dir(os.path.dirname(os.path.abspath(path)))
+    )
+
+
+def ensure_socket_dir(path):
+    """Create the socket's directory (0700) if missing. Returns False if it is not private."""
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+    return is_private_dir(directory)
+
+
+def code_fingerprint(script_dir):
+    """Fingerprint of the hook code in script_dir (paths, sizes and mtimes).
+
+    The daemon records it at startup; a client whose fingerprint differs
+    (extension upgraded or installed elsewhere) asks the daemon to restart
+    instead of running new hook scripts against helpers it loaded earlier.
+    """
+    digest = hashlib.sha1(os.path.abspath(script_dir).encode("utf-8"))
+    for directory in (script_dir, os.path.join(script_dir, "arckit_core")):
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(".py"):
+                st = entry.stat()
+                digest.update(f"\0{entry.path}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
@@ -7,102 +7,22 @@ Provides common helpers for stdin parsing, repo discovery, doc-type
 metadata, and JSON output formatting.
 """
 
+import importlib.util
 import json
 import os
 import re
 import sys
+import tempfile
 
-# ── Document Type Codes (mirrors arckit-claude/config/doc-types.mjs) ──
-
-DOC_TYPES = {
-    # Discovery
-    "REQ":       {"name": "Requirements",                      "category": "Discovery"},
-    "STKE":      {"name": "Stakeholder Analysis",              "category": "Discovery"},
-    "RSCH":      {"name": "Research Findings",                 "category": "Discovery"},
-    "DSCT":      {"name": "Data Source Discovery",             "category": "Discovery"},
-    # Planning
-    "SOBC":      {"name": "Strategic Outline Business Case",   "category": "Planning"},
-    "PLAN":      {"name": "Project Plan",                      "category": "Planning"},
-    "ROAD":      {"name": "Roadmap",                           "category": "Planning"},
-    "STRAT":     {"name": "Architecture Strategy",             "category": "Planning"},
-    "BKLG":      {"name": "Product Backlog",                   "category": "Planning"},
-    # Architecture
-    "PRIN":      {"name": "Architecture Principles",           "category": "Architecture"},
-    "HLDR":      {"name": "High-Level Design Review",          "category": "Architecture"},
-    "DLDR":      {"name": "Detailed Design Review",            "category": "Architecture"},
-    "DATA":      {"name": "Data Model",                        "category": "Architecture"},
-    "WARD":      {"name": "Wardley Map",                       "category": "Architecture"},
-    "DIAG":      {"name": "Architecture Diagrams",             "category": "Architecture"},
-    "DFD":       {"name": "Data Flow Diagram",                 "category": "Architecture"},
-    "ADR":       {"name": "Architecture Decision Records",     "category": "Architecture"},
-    "PLAT":      {"name": "Platform Design",                   "category": "Architecture"},
-    # Governance
-    "RISK":      {"name": "Risk Register",                     "category": "Governance"},
-    "TRAC":      {"name": "Traceability Matrix",               "category": "Governance"},
-    "PRIN-COMP": {"name": "Principles Compliance",             "category": "Governance"},
-    "CONF":      {"name": "Conformance Assessment",            "category": "Governance"},
-    "PRES":      {"name": "Presentation",                      "category": "Governance"},
-    "ANAL":      {"name": "Analysis Report",                   "category": "Governance"},
-    "GAPS":      {"name": "Gap Analysis",                      "category": "Governance"},
-    # Compliance
-    "TCOP":      {"name": "TCoP Assessment",                   "category": "Compliance"},
-    "SECD":      {"name": "Secure by Design",                  "category": "Compliance"},
-    "SECD-MOD":  {"name": "MOD Secure by Design",              "category": "Compliance"},
-    "AIPB":      {"name": "AI Playbook Assessment",            "category": "Compliance"},
-    "ATRS":      {"name": "ATRS Record",                       "category": "Compliance"},
-    "DPIA":      {"name": "Data Protection Impact Assessment", "category": "Compliance"},
-    "JSP936":    {"name": "JSP 936 Assessment",                "category": "Compliance"},
-    "SVCASS":    {"name": "Service Assessment",                "category": "Compliance"},
-    # Operations
-    "SNOW":      {"name": "ServiceNow Design",                 "category": "Operations"},
-    "DEVOPS":    {"name": "DevOps Strategy",                   "category": "Operations"},
-    "MLOPS":     {"name": "MLOps Strategy",                    "category": "Operations"},
-    "FINOPS":    {"name": "FinOps Strategy",                   "category": "Operations"},
-    "OPS":       {"name": "Operational Readiness",             "category": "Operations"},
-    # Procurement
-    "SOW":       {"name": "Statement of Work",                 "category": "Procurement"},
-    "EVAL":      {"name": "Evaluation Criteria",               "category": "Procurement"},
-    "DOS":       {"name": "DOS Requirements",                  "category": "Procurement"},
-    "GCLD":      {"name": "G-Cloud Search",                    "category": "Procurement"},
-    "GCLC":      {"name": "G-Cloud Clarifications",            "category": "Procurement"},
-    "DMC":       {"name": "Data Mesh Contract",                "category": "Procurement"},
-    "VEND":      {"name": "Vendor Evaluation",                 "category": "Procurement"},
-    # Research
-    "AWRS":      {"name": "AWS Research",                      "category": "Research"},
-    "AZRS":      {"name": "Azure Research",                    "category": "Research"},
-    "GCRS":      {"name": "GCP Research",                      "category": "Research"},
-    # Other
-    "STORY":     {"name": "Project Story",                     "category": "Other"},
-}
-
-# Set of all valid type codes
-KNOWN_TYPES = set(DOC_TYPES.keys())
-
-# Multi-instance types requiring sequence numbers (ADR-001, DIAG-002, etc.)
-MULTI_INSTANCE_TYPES = {
-    "ADR", "DIAG", "DFD", "WARD", "DMC",
-    "RSCH", "AWRS", "AZRS", "GCRS", "DSCT",
-}
-
-# Type code -> required subdirectory
-SUBDIR_MAP = {
-    "ADR":  "decisions",
-    "DIAG": "diagrams",
-    "DFD":  "diagrams",
-    "WARD": "wardley-maps",
-    "DMC":  "data-contracts",
-    "RSCH": "research",
-    "AWRS": "research",
-    "AZRS": "research",
-    "GCRS": "research",
-    "DSCT": "research",
-}
-
-# Compound types (contain hyphens) -- checked first during extraction
-COMPOUND_TYPES = [k for k in DOC_TYPES if "-" in k]
-
-# Regex for ARC filenames: ARC-NNN-TYPE[-SEQ]-vN.N.md
-ARC_PATTERN = re.compile(r"^ARC-\d{3}-.+-v\d+(\.\d+)?\.md$")
+# ── Document Type Codes (arckit_core.doc_types, vendored next to this file) ──
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from arckit_core.doc_types import (  # noqa: E402,F401
+    ARTIFACT_SUBDIRS, DOC_TYPES, KNOWN_TYPES, MULTI_INSTANCE_TYPES, SUBDIR_MAP, COMPOUND_TYPES,
+    ARC_PATTERN, ARC_FILENAME_RE, ARC_GENERIC_RE, SEQ_SUFFIX_RE,
+    ArcFilename, classify_filename, format_arc_filename,
+    extract_doc_type, extract_version, doc_type_name,
+)
 
 # Subdirectory name -> manifest array key
 SUBDIR_TO_KEY = {}
@@ -112,9 +32,6 @@ for _dir in set(SUBDIR_MAP.values()):
     SUBDIR_TO_KEY[_dir] = _key
 SUBDIR_TO_KEY["reviews"] = "reviews"
 
-# Subdirectories to scan for artifacts
-ARTIFACT_SUBDIRS = list(set(SUBDIR_MAP.values())) + ["reviews"]
-
 
 # ── File System Helpers ──
 
@@ -153,13 +70,116 @@ def mtime_ms(path):
         return 0
 
 
+# ── Bounded Readers ──
+#
+# Titles, frontmatter and the Document Control table sit at the top of ARC
+# documents. These readers stream lines from the start of a file and stop
+# as soon as the field is found or HEAD_MAX_BYTES have been read, so large
+# artifacts (multi-MB traceability matrices) are never loaded whole.
+
+HEAD_MAX_BYTES = 64 * 1024
+
+HEADING_RE = re.compile(r"^#\s+(.+)")
+DOC_CONTROL_RE = re.compile(r"^\|\s*\*\*([^*]+)\*\*\s*\|\s*(.+?)\s*\|")
+
+
+def iter_head_lines(path, max_lines=None, max_bytes=HEAD_MAX_BYTES):
+    """Yield lines (without the newline) from the start of a file.
+
+    Stops after max_lines lines or max_bytes bytes (None = unlimited); a line
+    cut off by the byte cap is dropped. Invalid UTF-8 is replaced, like
+    Node's readFileSync(p, 'utf8'). Yields nothing if the file is unreadable.
+    """
+    try:
+        f = open(path, "rb")
+    except (OSError, IOError):
+        return
+    with f:
+        count = 0
+        remaining = max_bytes
+        while max_lines is None or count < max_lines:
+            line = f.readline(-1 if remaining is None else remaining)
+            if not line:
+                return
+            if remaining is not None:
+                remaining -= len(line)
+                if remaining <= 0 and not line.endswith(b"\n") and f.read(1):
+                    return
+            if line.endswith(b"\n"):
+                line = line[:-1]
+            yield line.decode("utf-8", errors="replace")
+            count += 1
+
+
+def read_head(path, max_lines=10, max_bytes=None):
+    """First `max_lines` lines of a file joined by newlines ("" on failure)."""
+    return "\n".join(iter_head_lines(path, max_lines, max_bytes))
+
+
+def first_heading(lines):
+    """First `# heading` in an iterable of lines, or None."""
+    for line in lines:
+        m = HEADING_RE.match(line)
+        if m:
+            return m.group(1).strip()
+    return None
+
+
+def read_first_heading(path, max_lines=20, max_bytes=HEAD_MAX_BYTES):
+    """First `# heading` within the first lines of a file, or None."""
+    return first_heading(iter_head_lines(path, max_lines, max_bytes))
+
+
+def read_frontmatter(path, max_bytes=HEAD_MAX_BYTES):
+    """Flat `key: value` pairs from a leading YAML frontmatter block ({} if none)."""
+    lines = iter_head_lines(path, None, max_bytes)
+    if next(lines, "").rstrip("\r") != "---":
+        return {}
+    fields = {}
+    for line in lines:
+        line = line.rstrip("\r")
+        if line in ("---", "..."):
+            return fields
+        key, sep, value = line.partition(":")
+        if sep and key.strip() and not key[:1].isspace() and not key.startswith("#"):
+            fields[key.strip()] = value.strip().strip("\"'")
+    # Unterminated (or larger than max_bytes) -- not usable frontmatter
+    return {}
+
+
+def read_doc_control_fields(path, wanted=None, max_bytes=HEAD_MAX_BYTES):
+    """Fields from the Document Control table, e.g. {"Status": "DRAFT"}.
+
+    Stops as soon as every field named in `wanted` has been found, or when
+    the first table of `| **Field** | Value |` rows ends.
+    """
+    fields = {}
+    wanted = set(wanted) if wanted else None
+    in_table = False
+    for line in iter_head_lines(path, None, max_bytes):
+        m = DOC_CONTROL_RE.match(line)
+        if m:
+            in_table = True
+            fields[m.group(1).strip()] = m.group(2).strip()
+            if wanted is not None and wanted <= fields.keys():
+                break
+        elif in_table and not line.startswith("|"):
+            break
+    return fields
+
+
 # ── Repository Discovery ──
 
+# Hooks find the repository root by its projects/ directory, like the plugin
+# scripts; pass it as marker= to arckit_core helpers that resolve the root
+ROOT_MARKER = "projects"
+
+
 def find_repo_root(cwd):
     """Walk up from cwd until a directory containing projects/ is found."""
     current = os.path.abspath(cwd)
     while True:
-        if is_dir(os.path.join(current, "projects")):
+        if is_dir(os.path.join(current, ROOT_MARKER)):
             return current
         parent = os.path.dirname(current)
         if parent == current:
@@ -168,35 +188,270 @@ def find_repo_root(cwd):
     return None
 
 
-# ── Doc Type Extraction ──
+# ── Hook Cache (.arckit/cache/) ──
+
+CACHE_DIR = os.path.join(".arckit", "cache")
+
 
-def extract_doc_type(filename):
-    """Extract the document type code from an ARC filename."""
-    m = re.match(r"^ARC-\d{3}-(.+)-v\d+(\.\d+)?\.md$", filename)
-    if not m:
+def cache_path(repo_root, name):
+    """Return the path of a named cache file under .arckit/cache/."""
+    return os.path.join(repo_root, CACHE_DIR, name)
+
+
+def load_cache(repo_root, name):
+    """Load a JSON cache file, return None if missing or unreadable."""
+    try:
+        with open(cache_path(repo_root, name), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, IOError, json.JSONDecodeError, ValueError):
         return None
-    rest = m.group(1)
+    return data if isinstance(data, dict) else None
 
-    # Try compound types first (e.g. SECD-MOD, PRIN-COMP)
-    for code in COMPOUND_TYPES:
-        if rest.startswith(code):
-            return code
 
-    # Strip trailing -NNN for multi-instance types (ADR-001, DIAG-002)
-    rest = re.sub(r"-\d{3}$", "", rest)
-    return rest
+def save_cache(repo_root, name, data):
+    """Atomically write a JSON cache file. Failures are silently ignored."""
+    directory = os.path.join(repo_root, CACHE_DIR)
+    try:
+        if not is_dir(directory):
+            os.makedirs(directory, exist_ok=True)
+            # Keep cache files out of version control
+            with open(os.path.join(directory, ".gitignore"), "w", encoding="utf-8") as f:
+                f.write("*\n")
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, cache_path(repo_root, name))
+    except (OSError, IOError):
+        pass
+
+
+# ── Artifact Index ──
+#
+# Persistent record of every ARC-* file (plus vendors, tech notes, external
+# documents and policies) under projects/. Each project entry is keyed on
+# the mtimes of the directories it was built from, so revalidating the index
+# costs one stat() per tracked directory instead of a full rescan.
 
+INDEX_NAME = "artifact-index.json"
+INDEX_VERSION = 2
 
-def extract_version(filename):
-    """Extract version string from ARC filename."""
-    m = re.search(r"-v(\d+(?:\.\d+)?)\.md$", filename)
-    return m.group(1) if m else None
+# Per-project directories whose mtimes decide whether an entry is stale
+INDEX_DIRS = [""] + ARTIFACT_SUBDIRS + ["vendors", "tech-notes", "external", "policies"]
 
+# In-process memo (repo_root -> (cache file mtime, index)) so a long-running
+# hook daemon does not re-read the index file on every request
+_index_memo = {}
 
-def doc_type_name(code):
-    """Get display name for a doc type code."""
-    entry = DOC_TYPES.get(code)
-    return entry["name"] if entry else code
+
+def dir_mtime_ns(path):
+    """Get directory (or file) modification time in nanoseconds, 0 if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, IOError):
+        return 0
+
+
+def scan_entries(path):
+    """List a directory with os.scandir, return sorted (name, is_dir, mtime_ms) tuples.
+
+    Directories report an mtime of 0; only file mtimes are needed by hooks.
+    """
+    entries = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        entries.append((entry.name, True, 0))
+                    elif entry.is_file():
+                        entries.append((entry.name, False, entry.stat().st_mtime * 1000))
+                except OSError:
+                    continue
+    except (OSError, IOError):
+        return []
+    entries.sort()
+    return entries
+
+
+def project_signature(project_dir):
+    """Return the tracked directory mtimes for a project as a dict."""
+    return {
+        sub: dir_mtime_ns(os.path.join(project_dir, sub) if sub else project_dir)
+        for sub in INDEX_DIRS
+    }
+
+
+def snapshot_project(project_dir):
+    """Walk a project directory once with os.scandir.
+
+    Returns (dirs, listings): `dirs` is the project_signature() dict, with
+    subdirectory mtimes taken from the DirEntry that listed them (missing
+    directories cost no syscall); `listings` maps the project directory ("")
+    and each tracked subdirectory that exists to scan_entries()-style tuples.
+    """
+    dirs = dict.fromkeys(INDEX_DIRS, 0)
+    dirs[""] = dir_mtime_ns(project_dir)
+    listings = {}
+    if not dirs[""]:
+        return dirs, listings
+
+    root = []
+    try:
+        with os.scandir(project_dir) as it:
+            for entry in it:
+                try:
+                    if entry.name in dirs:
+                        dirs[entry.name] = entry.stat().st_mtime_ns
+                    if entry.is_dir():
+                        root.append((entry.name, True, 0))
+                    elif entry.is_file():
+                        root.append((entry.name, False, entry.stat().st_mtime * 1000))
+                except OSError:
+                    continue
+    except OSError:
+        return dirs, listings
+    root.sort()
+    listings[""] = root
+
+    for sub in INDEX_DIRS:
+        if sub and dirs[sub]:
+            listings[sub] = scan_entries(os.path.join(project_dir, sub))
+    return dirs, listings
+
+
+def scan_project(project_dir):
+    """Scan a single project directory into an artifact index entry."""
+    dirs, listings = snapshot_project(project_dir)
+    entry = {
+        "dirs": dirs,
+        "artifacts": [],
+        "vendors": {"dirs": [], "profiles": []},
+        "techNotes": [],
+        "external": [],
+        "policies": [],
+    }
+
+    for sub in [""] + ARTIFACT_SUBDIRS:
+        for name, is_subdir, mt in listings.get(sub, ()):
+            if is_subdir or not name.startswith("ARC-") or not name.endswith(".md"):
+                continue
+            parsed = classify_filename(name)
+            entry["artifacts"].append({
+                "path": f"{sub}/{name}" if sub else name,
+                "type": parsed.doc_type if parsed else name,
+                "version": parsed.version if parsed else extract_version(name),
+                "mtime": mt,
+            })
+
+    for name, is_subdir, _ in listings.get("vendors", ()):
+        if is_subdir:
+            entry["vendors"]["dirs"].append(name)
+        elif name.endswith("-profile.md"):
+            entry["vendors"]["profiles"].append(name)
+
+    for name, is_subdir, _ in listings.get("tech-notes", ()):
+        if not is_subdir and name.endswith(".md"):
+            entry["techNotes"].append(name)
+
+    for name, is_subdir, mt in listings.get("external", ()):
+        if not is_subdir and name != "README.md":
+            entry["external"].append({"name": name, "mtime": mt})
+
+    for name, is_subdir, _ in listings.get("policies", ()):
+        if not is_subdir:
+            entry["policies"].append(name)
+
+    return entry
+
+
+def _memoized_index(repo_root):
+    """Return the memoized index if the cache file is unchanged, else reload it."""
+    stamp = dir_mtime_ns(cache_path(repo_root, INDEX_NAME))
+    memo = _index_memo.get(repo_root)
+    if memo and memo[0] == stamp:
+        return memo[1]
+    return load_cache(repo_root, INDEX_NAME)
+
+
+def _memoize_index(repo_root, index):
+    """Remember an index together with the mtime of its cache file."""
+    _index_memo[repo_root] = (dir_mtime_ns(cache_path(repo_root, INDEX_NAME)), index)
+
+
+def list_project_names(repo_root):
+    """Return the sorted project directory names under projects/."""
+    projects_dir = os.path.join(repo_root, "projects")
+    return [n for n, is_subdir, _ in scan_entries(projects_dir) if is_subdir]
+
+
+def load_artifact_index(repo_root, only=None):
+    """Return the artifact index for repo_root, revalidated by directory mtimes.
+
+    Result: {"names": [...], "projects": {name: entry}} with project names
+    in sorted order. Only projects whose tracked directories changed are
+    rescanned; the index is written back to .arckit/cache/ when anything
+    changed. When `only` is a set of project names, the other projects are
+    not revalidated: their cached entries (possibly stale) are returned
+    as-is and projects never indexed before are absent from "projects".
+    """
+    projects_dir = os.path.join(repo_root, "projects")
+    cached = _memoized_index(repo_root)
+    if not cached or cached.get("version") != INDEX_VERSION:
+        cached = {"version": INDEX_VERSION, "mtime": 0, "names": [], "projects": {}}
+
+    changed = False
+    projects_mtime = dir_mtime_ns(projects_dir)
+    if projects_mtime != cached["mtime"]:
+        names = list_project_names(repo_root)
+        cached["mtime"] = projects_mtime
+        cached["names"] = names
+        changed = True
+    else:
+        names = cached["names"]
+
+    old_projects = cached["projects"]
+    projects = {}
+    for name in names:
+        project_dir = os.path.join(projects_dir, name)
+        entry = old_projects.get(name)
+        if only is not None and name not in only:
+            if entry is not None:
+                projects[name] = entry
+            continue
+        if entry is None or entry["dirs"] != project_signature(project_dir):
+            entry = scan_project(project_dir)
+            changed = True
+        projects[name] = entry
+    if len(projects) != len(old_projects):
+        changed = True
+    cached["projects"] = projects
+
+    if changed:
+        save_cache(repo_root, INDEX_NAME, cached)
+    _memoize_index(repo_root, cached)
+    return cached
+
+
+def update_artifact_index(repo_root, project_name):
+    """Rescan one project after a write and persist the index.
+
+    Overwriting an existing file does not change its directory mtime, so
+    hooks that write artifacts refresh the affected entry explicitly.
+    """
+    index = _memoized_index(repo_root)
+    if not index or index.get("version") != INDEX_VERSION:
+        return
+    project_dir = os.path.join(repo_root, "projects", project_name)
+    if not is_dir(project_dir) or project_name not in index["projects"]:
+        return
+    index["projects"][project_name] = scan_project(project_dir)
+    save_cache(repo_root, INDEX_NAME, index)
+    _memoize_index(repo_root, index)
+
+
+def newest_artifact_mtime(entry):
+    """Return the newest ARC-* artifact mtime (ms) in an index entry."""
+    return max((a["mtime"] for a in entry["artifacts"]), default=0)
 
 
 # ── Hook Input/Output ──
@@ -233,3 +488,48 @@ def output_block(reason):
     """Write reason to stderr and exit with code 2 (block)."""
     sys.stderr.write(reason + "\n")
     sys.exit(2)
+
+
+# ── Hook Decisions ──
+#
+# Checks that can run standalone or inside a combined dispatcher return a
+# decision dict instead of writing output directly:
+#   {}                                  allow, no output
+#   {"updatedInput": {...}}             allow with rewritten tool input
+#   {"additionalContext": "..."}        allow with a note for the model
+#   {"block": "reason"}                 block (stderr + exit code 2)
+
+def emit_decision(decision):
+    """Write a hook decision to stdout/stderr (exits with 2 when blocking)."""
+    if decision.get("block"):
+        output_block(decision["block"])
+    result = {}
+    if "updatedInput" in decision:
+        result["updatedInput"] = decision["updatedInput"]
+    if decision.get("additionalContext"):
+        result["hookSpecificOutput"] = {
+            "additionalContext": decision["additionalContext"],
+        }
+    if result:
+        output_json(result)
+
+
+def load_hook_module(name):
+    """Import a hook script (e.g. "file-protection") as a module.
+
+    Hook scripts have hyphenated filenames, so they cannot be imported by
+    name. The module is cached in sys.modules and only loaded once per process.
+    """
+    module_name = "arckit_hook_" + name.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
@@ -0,0 +1,744 @@
+#!/usr/bin/env python3
+"""
+ArcKit Manifest Builder -- Full docs/manifest.json regeneration.
+
+Python port of the manifest half of arckit-claude/hooks/sync-guides.mjs
+(buildManifest) and the dependency graph from graph-utils.mjs. Given the
+same repository it writes a byte-identical manifest, so Gemini users get
+the same full rebuild that the Claude Code pages hook performs.
+
+Projects are scanned in parallel (one thread per project directory) and
+titles are read from the first 10 lines of each file only.
+
+Usage:
+    python3 manifest_builder.py [REPO_ROOT] [--guides-dir DIR] [--jobs N] [--stdout]
+
+Guide titles come from DIR (default: REPO_ROOT/docs/guides, i.e. guides
+already synced by /arckit:pages) plus .arckit/guides-custom/.
+"""
+
+import argparse
+import functools
+import json
+import math
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(__file__))
+from hook_utils import (
+    find_repo_root, is_dir, is_file, read_text, read_head, extract_doc_type,
+    DOC_TYPES, SUBDIR_MAP,
+)
+from manifest_store import file_lock, journal_path, lock_path, write_json_atomic
+
+# JavaScript regex and String.prototype.trim() semantics, so titles and
+# fields match the Node implementation exactly: \s is JS whitespace (no
+# \x1c-\x1f, includes BOM) and "." stops at any JS line terminator.
+_WS = "\t\n\v\f\r \u00a0\u1680" + "".join(map(chr, range(0x2000, 0x200b))) \
+    + "\u2028\u2029\u202f\u205f\u3000\ufeff"
+_S = f"[{_WS}]"
+_S_LINE = "[" + _WS.replace("\n", "") + "]"
+_DOT = "[^\n\r\u2028\u2029]"
+
+TITLE_LINE_RE = re.compile(f"#{_S}+({_DOT}+)")
+ROLE_SUFFIX_RE = re.compile(f"{_S}*[—–-]{_S}*ArcKit Command Guide{_S}*\\Z", re.IGNORECASE)
+CONTENT_TITLE_RE = re.compile(f"(?:^|(?<=[\r\u2028\u2029]))#{_S}+({_DOT}+)", re.MULTILINE)
+# Doc control rows, matched per line in a single pass over the content
+DOC_CONTROL_RE = re.compile(
+    f"^\\|{_S_LINE}*\\*\\*([^*\n]+)\\*\\*{_S_LINE}*\\|{_S_LINE}*({_DOT}+?){_S_LINE}*\\|",
+    re.MULTILINE,
+)
+# \bARC-... with the literal first, so re can skip ahead to candidate matches
+ARC_REF_RE = re.compile(r"ARC-(?<!\wARC-)(\d{3})-([A-Z][\w-]*?)(?:-(\d{3}))?(?:-v[\d.]+)?(?:\.md)?\b", re.ASCII)
+PROJECT_DIR_RE = re.compile(r"[0-9]{3}-")
+MD_SUFFIX_RE = re.compile(r"\.md\Z")
+VERSION_SUFFIX_RE = re.compile(r"-v[\d.]+\Z")
+VERSIONED_MD_RE = re.compile(r"-v[\d.]+\.md\Z")
+REMOTE_URL_RE = re.compile(f"\\[remote{_S}+\"origin\"\\][^\\[]*?url{_S}*={_S}*({_DOT}+)")
+
+HEADING_LINES = 10
+
+
+def js_trim(text):
+    return text.strip(_WS)
+
+
+def js_sorted(names):
+    """Sort like Array.prototype.sort(): by UTF-16 code units."""
+    return sorted(names, key=lambda n: n.encode("utf-16-be", "surrogatepass"))
+
+
+def js_key_order(d):
+    """Reorder dict keys the way a JS object enumerates them (array indices first)."""
+    def is_index(k):
+        return isinstance(k, str) and k.isascii() and k.isdigit() \
+            and str(int(k)) == k and int(k) < 2 ** 32 - 1
+    indices = sorted((k for k in d if is_index(k)), key=int)
+    if not indices:
+        return d
+    return {**{k: d[k] for k in indices}, **{k: v for k, v in d.items() if not is_index(k)}}
+
+
+def js_number(value):
+    """Integral floats serialize as ints in JSON.stringify (4.0 -> 4)."""
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2 ** 63:
+        return int(value)
+    return value
+
+
+def js_round2(value):
+    """Math.round(value * 100) / 100."""
+    return js_number(math.floor(value * 100 + 0.5) / 100)
+
+
+def js_or(value, default):
+    """`value || default` with JavaScript truthiness ([] and {} are truthy)."""
+    if value is None or value is False or value == "":
+        return default
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and (value == 0 or value != value):
+        return default
+    return value
+
+
+def js_eq(a, b):
+    """Strict equality (===) for JSON scalars."""
+    if isinstance(a, (dict, list)) or isinstance(b, (dict, list)):
+        return False
+    if isinstance(a, bool) != isinstance(b, bool):
+        return False
+    return a == b
+
+
+def list_dir(path):
+    """List directory contents in JS sort order, empty list on failure."""
+    try:
+        return js_sorted(os.listdir(path))
+    except (OSError, IOError):
+        return []
+
+
+def stem(filename, suffix=".md"):
+    """path.basename(f, '.md')."""
+    if filename.endswith(suffix) and filename != suffix:
+        return filename[:-len(suffix)]
+    return filename
+
+
+def file_ext(filename):
+    """path.extname(f) without the dot, or "file"."""
+    ext = os.path.splitext(filename)[1]
+    return ext.replace(".", "", 1) or "file"
+
+
+def capitalize_words(slug, keep_upper=False):
+    """"fuel-prices" -> "Fuel Prices" (first letter only, rest untouched)."""
+    words = []
+    for w in slug.split("-"):
+        if keep_upper and w.upper() == w:
+            words.append(w)
+        else:
+            words.append(w[:1].upper() + w[1:])
+    return " ".join(words)
+
+
+# ── Static data tables (mirror sync-guides.mjs) ──
+
+DOC_TYPE_META = {
+    code: {"category": meta["category"], "title": meta["name"]}
+    for code, meta in DOC_TYPES.items()
+}
+
+GUIDE_CATEGORIES = {
+    # Getting Started
+    "init": "Getting Started", "start": "Getting Started", "upgrading": "Getting Started",
+    "customize": "Getting Started", "template-builder": "Getting Started",
+    "remote-control": "Getting Started",
+    "productivity": "Getting Started",
+    # Discovery
+    "requirements": "Discovery", "stakeholders": "Discovery", "stakeholder-analysis": "Discovery",
+    "research": "Discovery", "datascout": "Discovery",
+    # Planning
+    "sobc": "Planning", "business-case": "Planning", "plan": "Planning", "roadmap": "Planning",
+    "backlog": "Planning", "strategy": "Planning", "migration": "Planning",
+    # Architecture
+    "principles": "Architecture", "adr": "Architecture", "diagram": "Architecture",
+    "wardley": "Architecture", "data-model": "Architecture", "hld-review": "Architecture",
+    "dld-review": "Architecture", "design-review": "Architecture", "platform-design": "Architecture",
+    "data-mesh-contract": "Architecture", "c4-layout-science": "Architecture",
+    "dfd": "Architecture", "framework": "Architecture",
+    # Governance
+    "risk": "Governance", "risk-management": "Governance", "traceability": "Governance",
+    "principles-compliance": "Governance", "analyze": "Governance", "artifact-health": "Governance",
+    "data-quality-framework": "Governance", "knowledge-compounding": "Governance",
+    "search": "Governance", "impact": "Governance",
+    "conformance": "Governance", "health": "Governance", "maturity-model": "Governance",
+    # Compliance
+    "tcop": "Compliance", "secure": "Compliance", "mod-secure": "Compliance", "dpia": "Compliance",
+    "ai-playbook": "Compliance", "atrs": "Compliance", "jsp-936": "Compliance",
+    "service-assessment": "Compliance", "govs-007-security": "Compliance",
+    "national-data-strategy": "Compliance", "codes-of-practice": "Compliance",
+    "security-hooks": "Compliance",
+    # Operations
+    "devops": "Operations", "mlops": "Operations", "finops": "Operations",
+    "operationalize": "Operations",
+    # Procurement
+    "sow": "Procurement", "evaluate": "Procurement", "dos": "Procurement",
+    "gcloud-search": "Procurement", "gcloud-clarify": "Procurement", "procurement": "Procurement",
+    "score": "Procurement",
+    # Integrations
+    "aws-research": "Integrations", "azure-research": "Integrations", "gcp-research": "Integrations",
+    "mcp-servers": "Integrations", "pinecone-mcp": "Integrations",
+    "trello": "Integrations", "servicenow": "Integrations",
+    # Reporting
+    "pages": "Reporting", "story": "Reporting", "presentation": "Reporting",
+    "glossary": "Reporting",
+}
+
+GUIDE_STATUS = {}
+for _name in ["plan", "principles", "stakeholders", "stakeholder-analysis", "risk", "sobc", "requirements", "data-model", "diagram", "traceability", "principles-compliance", "story", "sow", "evaluate", "customize", "risk-management", "business-case"]:
+    GUIDE_STATUS[_name] = "live"
+for _name in ["dpia", "research", "strategy", "roadmap", "adr", "hld-review", "dld-review", "backlog", "servicenow", "analyze", "service-assessment", "tcop", "secure", "presentation", "artifact-health", "design-review", "procurement", "knowledge-compounding", "c4-layout-science", "security-hooks", "codes-of-practice", "data-quality-framework", "govs-007-security", "national-data-strategy", "upgrading", "start", "conformance", "productivity", "remote-control", "mcp-servers", "search", "score", "impact"]:
+    GUIDE_STATUS[_name] = "beta"
+for _name in ["data-mesh-contract", "ai-playbook", "atrs", "pages", "template-builder"]:
+    GUIDE_STATUS[_name] = "alpha"
+for _name in ["platform-design", "wardley", "azure-research", "aws-research", "gcp-research", "datascout", "dos", "gcloud-search", "gcloud-clarify", "trello", "devops", "mlops", "finops", "operationalize", "mod-secure", "jsp-936", "migration", "pinecone-mcp", "dfd", "framework", "health", "maturity-model", "glossary", "init"]:
+    GUIDE_STATUS[_name] = "experimental"
+
+ROLE_FAMILIES = {
+    "enterprise-architect": "Architecture", "solution-architect": "Architecture",
+    "data-architect": "Architecture", "security-architect": "Architecture",
+    "business-architect": "Architecture", "technical-architect": "Architecture",
+    "network-architect": "Architecture",
+    "cto-cdio": "Chief Digital and Data", "cdo": "Chief Digital and Data",
+    "ciso": "Chief Digital and Data",
+    "product-manager": "Product and Delivery", "delivery-manager": "Product and Delivery",
+    "business-analyst": "Product and Delivery", "service-owner": "Product and Delivery",
+    "data-governance-manager": "Data", "performance-analyst": "Data",
+    "it-service-manager": "IT Operations",
+    "devops-engineer": "Software Development",
+}
+
+ROLE_COMMAND_COUNTS = {
+    "enterprise-architect": 12, "solution-architect": 10, "data-architect": 4,
+    "security-architect": 5, "business-architect": 5, "technical-architect": 5,
+    "network-architect": 3, "cto-cdio": 5, "cdo": 4, "ciso": 5,
+    "product-manager": 5, "delivery-manager": 6, "business-analyst": 4,
+    "service-owner": 3, "data-governance-manager": 4, "performance-analyst": 4,
+    "it-service-manager": 3, "devops-engineer": 3,
+}
+
+# Subdirectory name -> manifest key, in SUBDIR_MAP order plus reviews
+MANIFEST_SUBDIRS = {}
+for _dir in SUBDIR_MAP.values():
+    MANIFEST_SUBDIRS.setdefault(_dir, re.sub(r"-([a-z])", lambda m: m.group(1).upper(), _dir))
+MANIFEST_SUBDIRS["reviews"] = "reviews"
+
+OPTIONAL_PROJECT_KEYS = [
+    "diagrams", "decisions", "wardleyMaps", "dataContracts", "reviews",
+    "research", "vendors", "vendorProfiles", "techNotes", "external",
+]
+
+GRAPH_SUBDIRS = ["decisions", "diagrams", "wardley-maps", "data-contracts", "reviews", "research"]
+
+
+# ── Titles ──
+
+def extract_title(content, rel_path=None):
+    """First # heading within the first 10 lines (sync-guides.mjs extractTitle)."""
+    for line in content.split("\n", HEADING_LINES)[:HEADING_LINES]:
+        m = TITLE_LINE_RE.match(line)
+        if m:
+            title = js_trim(m.group(1))
+            if rel_path and rel_path.startswith("roles/"):
+                title = ROLE_SUFFIX_RE.sub("", title, count=1)
+            return title
+    return None
+
+
+def extract_first_heading(path):
+    """Title of a markdown file, reading only its first lines."""
+    content = read_head(path, HEADING_LINES)
+    if not content:
+        return None
+    return extract_title(content)
+
+
+def doc_meta(type_code):
+    return DOC_TYPE_META.get(type_code) or {"category": "Other", "title": type_code}
+
+
+def extract_doc_id(filename):
+    return filename[:-3] if filename.endswith(".md") else filename
+
+
+# ── Guides ──
+
+def walk_md_files(base_dir, current_dir=None):
+    current_dir = current_dir or base_dir
+    results = []
+    for entry in list_dir(current_dir):
+        full_path = os.path.join(current_dir, entry)
+        if is_dir(full_path):
+            results.extend(walk_md_files(base_dir, full_path))
+        elif entry.endswith(".md") and is_file(full_path):
+            results.append(os.path.relpath(full_path, base_dir))
+    return results
+
+
+def collect_guide_titles(guides_dir, repo_root):
+    """Build the guideTitles map: docs/guides/* titles, then community guides."""
+    guide_titles = {}
+    if guides_dir and is_dir(guides_dir):
+        for rel_path in walk_md_files(guides_dir):
+            content = read_head(os.path.join(guides_dir, rel_path), HEADING_LINES)
+            title = extract_title(content or "", rel_path)
+            if title:
+                guide_titles[f"docs/guides/{rel_path}"] = title
+
+    community_dir = os.path.join(repo_root, ".arckit", "guides-custom")
+    if is_dir(community_dir):
+        for f in list_dir(community_dir):
+            if not f.endswith(".md") or not is_file(os.path.join(community_dir, f)):
+                continue
+            content = read_head(os.path.join(community_dir, f), HEADING_LINES)
+            if not content:
+                continue
+            title = extract_title(content, f)
+            if title:
+                guide_titles[f"community-guide:{f}"] = title
+    return guide_titles
+
+
+def build_guides(guide_titles):
+    guides = []
+    role_guides = []
+
+    for path, title in guide_titles.items():
+        # Community guides from .arckit/guides-custom/
+        if path.startswith("community-guide:"):
+            name = stem(os.path.basename(path.replace("community-guide:", "", 1)))
+            guides.append({
+                "path": f".arckit/guides-custom/{name}.md",
+                "title": title,
+                "category": "Community",
+                "status": "community",
+            })
+            continue
+
+        rel = re.sub(r"^docs/guides/", "", path)
+        if rel.startswith("roles/"):
+            name = stem(os.path.basename(rel))
+            if name == "README":
+                continue
+            role_guides.append({
+                "path": path,
+                "title": title,
+                "family": ROLE_FAMILIES.get(name, "Other"),
+                "commandCount": ROLE_COMMAND_COUNTS.get(name, 0),
+            })
+        elif "/" not in rel:
+            # Top-level guide only (exclude uk-government/, uk-mod/ subdirs)
+            name = stem(os.path.basename(rel))
+            guides.append({
+                "path": path,
+                "title": title,
+                "category": GUIDE_CATEGORIES.get(name, "Other"),
+                "status": GUIDE_STATUS.get(name, "beta"),
+            })
+
+    return guides, role_guides
+
+
+def parse_repo_name(repo_root):
+    """Repository name from the origin remote, else the directory name."""
+    name = os.path.basename(repo_root)
+    git_config = read_text(os.path.join(repo_root, ".git", "config"))
+    if not git_config:
+        return name
+    remote = REMOTE_URL_RE.search(git_config)
+    if not remote:
+        return name
+    raw_url = js_trim(remote.group(1))
+    m = re.search(r"https?://github\.com/([^/]+)/([^/.]+)", raw_url) \
+        or re.search(r"git@github\.com:([^/]+)/([^/.]+)", raw_url)
+    return m.group(2) if m else name
+
+
+# ── Projects ──
+
+def list_other_files(directory, path_prefix, skip_readme=True):
+    """Non-hidden files in external/ or policies/ as {path, title, type}."""
+    entries = []
+    for f in list_dir(directory):
+        if (skip_readme and f == "README.md") or f.startswith("."):
+            continue
+        if is_file(os.path.join(directory, f)):
+            entries.append({"path": f"{path_prefix}/{f}", "title": f, "type": file_ext(f)})
+    return entries
+
+
+def scan_global_docs(repo_root):
+    global_dir = os.path.join(repo_root, "projects", "000-global")
+    global_docs, global_external, global_policies = [], [], []
+    if not is_dir(global_dir):
+        return global_docs, global_external, global_policies
+
+    for f in list_dir(global_dir):
+        if f.startswith("ARC-") and f.endswith(".md") and is_file(os.path.join(global_dir, f)):
+            meta = doc_meta(extract_doc_type(f))
+            global_docs.append({
+                "path": f"projects/000-global/{f}",
+                "title": meta["title"],
+                "category": meta["category"],
+                "documentId": extract_doc_id(f),
+            })
+
+    ext_dir = os.path.join(global_dir, "external")
+    if is_dir(ext_dir):
+        global_external = list_other_files(ext_dir, "projects/000-global/external")
+    pol_dir = os.path.join(global_dir, "policies")
+    if is_dir(pol_dir):
+        global_policies = list_other_files(pol_dir, "projects/000-global/policies", skip_readme=False)
+
+    return global_docs, global_external, global_policies
+
+
+def build_vendor_scores(scores_path):
+    """Summarise vendors/scores.json, None if missing or malformed."""
+    try:
+        with open(scores_path, "r", encoding="utf-8", errors="replace") as f:
+            data = json.loads(f.read(), parse_constant=lambda c: json.loads("x"))
+        criteria, vendors = data.get("criteria"), data.get("vendors")
+        if js_or(criteria, None) is None or js_or(vendors, None) is None:
+            return None
+
+        categories = []
+        for c in criteria:
+            if c.get("category") not in categories:
+                categories.append(c.get("category"))
+
+        if isinstance(vendors, list):
+            vendors = {str(i): v for i, v in enumerate(vendors)}
+        summaries = []
+        for slug, vendor in js_key_order(vendors).items():
+            category_averages = {}
+            for cat in categories:
+                cat_scores = []
+                for c in criteria:
+                    if not js_eq(c.get("category"), cat):
+                        continue
+                    found = next((s for s in vendor["scores"] if js_eq(s.get("criterionId"), c.get("id"))), None)
+                    cat_scores.append(found["score"] if found else 0)
+                total = 0
+                for score in cat_scores:
+                    total += score
+                category_averages[cat] = js_round2(total / len(cat_scores)) if cat_scores else 0
+            summaries.append({
+                "name": js_or(vendor.get("displayName"), slug),
+                "slug": slug,
+                "totalWeighted": js_number(js_or(vendor.get("totalWeighted"), 0)),
+                "totalRaw": js_number(js_or(vendor.get("totalRaw"), 0)),
+                "maxPossible": js_number(js_or(vendor.get("maxPossible"), 0)),
+                "categoryAverages": js_key_order(category_averages),
+            })
+        summaries.sort(key=lambda v: v["totalWeighted"], reverse=True)
+        return {
+            "lastUpdated": js_or(data.get("lastUpdated"), None),
+            "categories": categories,
+            "vendors": summaries,
+        }
+    except Exception:
+        # Silently skip malformed scores.json
+        return None
+
+
+def build_project(repo_root, project_name):
+    """Manifest entry for one numbered project (sync-guides.mjs scanProject)."""
+    project_dir = os.path.join(repo_root, "projects", project_name)
+    project_path = f"projects/{project_name}"
+
+    project = {
+        "id": project_name,
+        "name": capitalize_words(re.sub(r"^[0-9]{3}-", "", project_name)),
+        "documents": [],
+    }
+    for key in OPTIONAL_PROJECT_KEYS:
+        project[key] = []
+
+    # Core documents in project root
+    for f in list_dir(project_dir):
+        if not f.startswith("ARC-") or not f.endswith(".md") or not is_file(os.path.join(project_dir, f)):
+            continue
+        meta = doc_meta(extract_doc_type(f))
+        project["documents"].append({
+            "path": f"{project_path}/{f}",
+            "title": meta["title"],
+            "category": meta["category"],
+            "documentId": extract_doc_id(f),
+        })
+
+    # Multi-instance subdirectories: title from first heading
+    for dir_name, key in MANIFEST_SUBDIRS.items():
+        sub_dir = os.path.join(project_dir, dir_name)
+        if not is_dir(sub_dir):
+            continue
+        for f in list_dir(sub_dir):
+            fp = os.path.join(sub_dir, f)
+            if not f.startswith("ARC-") or not f.endswith(".md") or not is_file(fp):
+                continue
+            heading = extract_first_heading(fp)
+            project[key].append({
+                "path": f"{project_path}/{dir_name}/{f}",
+                "title": heading or doc_meta(extract_doc_type(f))["title"],
+                "documentId": extract_doc_id(f),
+            })
+
+    # Vendors
+    vendors_dir = os.path.join(project_dir, "vendors")
+    if is_dir(vendors_dir):
+        for entry in list_dir(vendors_dir):
+            entry_path = os.path.join(vendors_dir, entry)
+            if is_dir(entry_path):
+                vendor_docs = []
+                for f in list_dir(entry_path):
+                    if f == "README.md" or f.startswith("."):
+                        continue
+                    fp = os.path.join(entry_path, f)
+                    if is_file(fp) and f.endswith(".md"):
+                        vendor_docs.append({
+                            "path": f"{project_path}/vendors/{entry}/{f}",
+                            "title": extract_first_heading(fp) or stem(f),
+                        })
+                if vendor_docs:
+                    project["vendors"].append({"name": capitalize_words(entry), "documents": vendor_docs})
+            elif is_file(entry_path) and entry.endswith("-profile.md"):
+                project["vendorProfiles"].append({
+                    "path": f"{project_path}/vendors/{entry}",
+                    "title": capitalize_words(entry[:-len("-profile.md")], keep_upper=True),
+                })
+
+    scores_path = os.path.join(vendors_dir, "scores.json")
+    if is_file(scores_path):
+        vendor_scores = build_vendor_scores(scores_path)
+        if vendor_scores is not None:
+            project["vendorScores"] = vendor_scores
+
+    # Tech notes
+    tech_dir = os.path.join(project_dir, "tech-notes")
+    if is_dir(tech_dir):
+        for f in list_dir(tech_dir):
+            if f == "README.md" or f.startswith("."):
+                continue
+            fp = os.path.join(tech_dir, f)
+            if is_file(fp) and f.endswith(".md"):
+                project["techNotes"].append({
+                    "path": f"{project_path}/tech-notes/{f}",
+                    "title": extract_first_heading(fp) or capitalize_words(stem(f)),
+                })
+
+    # External files
+    ext_dir = os.path.join(project_dir, "external")
+    if is_dir(ext_dir):
+        project["external"] = list_other_files(ext_dir, f"{project_path}/external")
+
+    # Remove empty arrays
+    for key in OPTIONAL_PROJECT_KEYS:
+        if not project[key]:
+            del project[key]
+
+    return project
+
+
+# ── Dependency Graph (graph-utils.mjs) ──
+
+def classify_severity(doc_type):
+    info = DOC_TYPES.get(doc_type)
+    if not info:
+        return "LOW"
+    if info["category"] in ("Compliance", "Governance"):
+        return "HIGH"
+    if info["category"] == "Architecture":
+        return "MEDIUM"
+    return "LOW"
+
+
+def extract_doc_control_fields(content):
+    fields = {}
+    for m in DOC_CONTROL_RE.finditer(content):
+        fields[js_trim(m.group(1))] = js_trim(m.group(2))
+    return fields
+
+
+@functools.lru_cache(maxsize=4096)
+def ref_short_id(ref):
+    """ARC-001-REQ-v1.0.md -> ARC-001-REQ (references repeat heavily)."""
+    return VERSION_SUFFIX_RE.sub("", MD_SUFFIX_RE.sub("", ref))
+
+
+def scan_graph_project(project_dir, project_name):
+    """Graph nodes and edges for one project (graph-utils.mjs scanProjectDir)."""
+    nodes = {}
+    edges = []
+    dirs_to_scan = [(project_dir, "")]
+    dirs_to_scan += [(os.path.join(project_dir, d), f"{d}/") for d in GRAPH_SUBDIRS]
+
+    vendors_dir = os.path.join(project_dir, "vendors")
+    if is_dir(vendors_dir):
+        for vendor in list_dir(vendors_dir):
+            vd = os.path.join(vendors_dir, vendor)
+            if is_dir(vd):
+                dirs_to_scan.append((vd, f"vendors/{vendor}/"))
+                vrd = os.path.join(vd, "reviews")
+                if is_dir(vrd):
+                    dirs_to_scan.append((vrd, f"vendors/{vendor}/reviews/"))
+
+    for directory, prefix in dirs_to_scan:
+        if not is_dir(directory):
+            continue
+        for f in list_dir(directory):
+            if not f.startswith("ARC-") or not f.endswith(".md"):
+                continue
+            fp = os.path.join(directory, f)
+            if not is_file(fp):
+                continue
+            try:
+                with open(fp, "r", encoding="utf-8", errors="replace") as fh:
+                    content = fh.read()
+            except (OSError, IOError):
+                continue
+            if not content:
+                continue
+
+            doc_type = extract_doc_type(f)
+            fields = extract_doc_control_fields(content)
+            title_match = CONTENT_TITLE_RE.search(content)
+            title = (js_trim(title_match.group(1)) if title_match else None) \
+                or fields.get("Document Title") or f
+
+            short_id = VERSIONED_MD_RE.sub("", f)
+            full_id = MD_SUFFIX_RE.sub("", f)
+
+            nodes[full_id] = {
+                "type": doc_type,
+                "project": project_name,
+                "path": f"projects/{project_name}/{prefix}{f}",
+                "title": title,
+                "status": fields.get("Status") or "",
+                "severity": classify_severity(doc_type),
+                "createdDate": fields.get("Created Date") or None,
+                "lastModified": fields.get("Last Modified") or None,
+            }
+
+            # Cross-references to other ARC documents (deduplicated per source)
+            seen_refs = set()
+            for m in ARC_REF_RE.finditer(content):
+                ref_short = ref_short_id(m.group(0))
+                if ref_short != short_id and ref_short not in seen_refs:
+                    seen_refs.add(ref_short)
+                    edges.append({"from": full_id, "to": ref_short, "type": "references"})
+
+    return nodes, edges
+
+
+# ── Manifest ──
+
+def scan_project_dir(repo_root, project_name, include_project):
+    project_dir = os.path.join(repo_root, "projects", project_name)
+    project = build_project(repo_root, project_name) if include_project else None
+    return project, scan_graph_project(project_dir, project_name)
+
+
+def build_manifest(repo_root, guide_titles=None, jobs=None):
+    """Build the full manifest dict (sync-guides.mjs buildManifest)."""
+    guides, role_guides = build_guides(guide_titles or {})
+    global_docs, global_external, global_policies = scan_global_docs(repo_root)
+
+    # Find default document (principles if exists)
+    default_doc = next((d for d in global_docs if "PRIN" in d["documentId"]), None)
+    if default_doc:
+        default_doc["isDefault"] = True
+
+    # Numbered projects feed both projects[] and the graph; 000-global only the graph
+    projects_dir = os.path.join(repo_root, "projects")
+    project_names = [
+        e for e in list_dir(projects_dir)
+        if PROJECT_DIR_RE.match(e) and is_dir(os.path.join(projects_dir, e))
+    ]
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        results = list(pool.map(
+            lambda name: scan_project_dir(repo_root, name, name != "000-global"),
+            project_names,
+        ))
+
+    manifest = {
+        "generated": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+        "repository": {"name": parse_repo_name(repo_root)},
+        "defaultDocument": default_doc["path"] if default_doc else "",
+        "guides": guides,
+        "roleGuides": role_guides,
+        "global": global_docs,
+        # Type code -> category map for client-side JS
+        "typeCategories": {code: meta["category"] for code, meta in DOC_TYPES.items()},
+    }
+    if global_external:
+        manifest["globalExternal"] = global_external
+    if global_policies:
+        manifest["globalPolicies"] = global_policies
+    manifest["projects"] = [project for project, _ in results if project is not None]
+
+    nodes, edges = {}, []
+    for _, (project_nodes, project_edges) in results:
+        nodes.update(project_nodes)
+        edges.extend(project_edges)
+    if nodes:
+        manifest["dependencyGraph"] = {"nodes": nodes, "edges": edges}
+
+    return manifest
+
+
+def write_manifest(repo_root, manifest):
+    """Write docs/manifest.json under the manifest lock.
+
+    A full rebuild reflects everything on disk, so pending journal records
+    are discarded rather than replayed.
+    """
+    docs_dir = os.path.join(repo_root, "docs")
+    os.makedirs(docs_dir, exist_ok=True)
+    manifest_path = os.path.join(docs_dir, "manifest.json")
+    with file_lock(lock_path(manifest_path)):
+        write_json_atomic(manifest_path, manifest, indent=2)
+        try:
+            os.unlink(journal_path(manifest_path))
+        except FileNotFoundError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild docs/manifest.json from projects/")
+    parser.add_argument("repo_root", nargs="?", default=None, help="Repository root (default: found from cwd)")
+    parser.add_argument("--guides-dir", help="Guides to index (default: REPO_ROOT/docs/guides)")
+    parser.add_argument("--jobs", type=int, default=None, help="Parallel project scans (default: CPU count + 4, max 32)")
+    parser.add_argument("--stdout", action="store_true", help="Print the manifest instead of writing it")
+    args = parser.parse_args()
+
+    repo_root = os.path.abspath(args.repo_root) if args.repo_root else find_repo_root(os.getcwd())
+    if not repo_root or not is_dir(os.path.join(repo_root, "projects")):
+        sys.stderr.write("No projects/ directory found\n")
+        sys.exit(1)
+
+    guides_dir = args.guides_dir or os.path.join(repo_root, "docs", "guides")
+    manifest = build_manifest(repo_root, collect_guide_titles(guides_dir, repo_root), args.jobs)
+
+    if args.stdout:
+        sys.stdout.write(json.dumps(manifest, indent=2, ensure_ascii=False))
+        return
+    write_manifest(repo_root, manifest)
+    print(f"Wrote docs/manifest.json: {len(manifest['projects'])} project(s), "
+          f"{len(manifest['guides'])} guides, {len(manifest['roleGuides'])} role guides")
+
+
+if __name__ == "__main__":
+    main()
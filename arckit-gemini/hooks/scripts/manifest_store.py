@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+ArcKit Manifest Store -- Locked, atomic updates to docs/manifest.json.
+
+Used by update-manifest.py (and anything else that edits the manifest)
+so concurrent hook invocations cannot clobber each other:
+
+  - An exclusive lock on docs/.manifest.lock is held from load to flush
+    (fcntl on POSIX, msvcrt on Windows)
+  - Writes go to a temp file in docs/ and are moved into place with
+    os.replace, so readers never see a half-written manifest
+  - Entries are indexed by base document ID (ARC-001-REQ-v1.0 -> ARC-001-REQ)
+    per array, so replacing a document is O(1) instead of a list rebuild
+  - Any number of upserts inside one `with ManifestStore(...)` block are
+    coalesced into a single flush
+
+Large manifests are not rewritten on every artifact write: once
+docs/manifest.json exceeds JOURNAL_MANIFEST_BYTES, record_update() appends
+the change to docs/manifest.journal.jsonl instead. The journal is folded
+back into manifest.json whenever a ManifestStore is opened (compaction),
+automatically once it exceeds COMPACT_JOURNAL_BYTES, or on demand:
+
+    python3 manifest_store.py compact [REPO_ROOT]
+
+Full rewrites of manifest.json (/arckit:pages, manifest_builder.py) make
+pending records obsolete: they discard the journal, and records stamped
+before manifest.json's mtime are never replayed.
+
+The implementation lives in arckit_core.manifest (vendored next to this
+file); this module re-exports it for the hooks.
+
+Usage:
+    with ManifestStore(manifest_path) as store:
+        store.upsert("001-fuel-prices", "documents", entry)
+        store.upsert("000-global", "global", other_entry)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from arckit_core.manifest import (  # noqa: E402,F401
+    JOURNAL_NAME, JOURNAL_MANIFEST_BYTES, COMPACT_JOURNAL_BYTES,
+    ManifestStore, base_id, project_display_name, journal_path, lock_path,
+    append_journal, discard_journal, compact, record_update, main,
+)
+from arckit_core.state import file_lock, write_json_atomic, file_size  # noqa: E402,F401
+
+
+if __name__ == "__main__":
+    main()
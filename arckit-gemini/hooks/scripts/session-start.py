@@ -18,7 +18,7 @@ import sys
 sys.path.insert(0, os.path.dirname(__file__))
 from hook_utils import (
     parse_hook_input, is_dir, is_file, read_text,
-    list_dir, mtime_ms, output_context,
+    output_context, load_artifact_index, newest_artifact_mtime,
 )
 
 data = parse_hook_input()
@@ -52,49 +52,19 @@ else:
 # Check for external files newer than latest artifacts
 if is_dir(projects_dir):
     ext_alerts = ""
-    entries = list_dir(projects_dir)
+    index = load_artifact_index(os.path.abspath(cwd))
 
-    for entry in entries:
-        project_dir = os.path.join(projects_dir, entry)
-        if not is_dir(project_dir):
+    for entry in index["names"]:
+        project = index["projects"][entry]
+        if not project["external"]:
             continue
-        external_dir = os.path.join(project_dir, "external")
-        if not is_dir(external_dir):
-            continue
-
-        # Find newest ARC-* artifact mtime across main dir and subdirs
-        newest_artifact = 0
-
-        # Main dir
-        for f in list_dir(project_dir):
-            fp = os.path.join(project_dir, f)
-            if is_file(fp) and f.startswith("ARC-") and f.endswith(".md"):
-                mt = mtime_ms(fp)
-                if mt > newest_artifact:
-                    newest_artifact = mt
-
-        # Subdirectories
-        for subdir in ["decisions", "diagrams", "wardley-maps", "data-contracts", "reviews"]:
-            sub_path = os.path.join(project_dir, subdir)
-            if is_dir(sub_path):
-                for f in list_dir(sub_path):
-                    fp = os.path.join(sub_path, f)
-                    if is_file(fp) and f.startswith("ARC-") and f.endswith(".md"):
-                        mt = mtime_ms(fp)
-                        if mt > newest_artifact:
-                            newest_artifact = mt
 
-        # Compare external files against newest artifact
-        new_ext_files = []
-        for f in list_dir(external_dir):
-            fp = os.path.join(external_dir, f)
-            if not is_file(fp):
-                continue
-            if f == "README.md":
-                continue
-            ext_mtime = mtime_ms(fp)
-            if ext_mtime > newest_artifact:
-                new_ext_files.append(f)
+        # Compare external files against newest ARC-* artifact
+        newest_artifact = newest_artifact_mtime(project)
+        new_ext_files = [
+            ext["name"] for ext in project["external"]
+            if ext["mtime"] > newest_artifact
+        ]
 
         if new_ext_files:
             ext_alerts += (
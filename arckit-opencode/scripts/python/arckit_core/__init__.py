@@ -0,0 +1,19 @@
+"""
+ArcKit core library -- shared implementation behind the ArcKit scripts and hooks.
+
+Modules:
+    log        Coloured stderr logging (log_info, log_success, ...)
+    doc_types  Document type codes and ARC filename parsing
+    state      File locks, atomic JSON writes and state-file helpers
+    repo       Repository root discovery and standard paths
+    projects   Project layout, snapshots, numbering and lookup
+    status     Project status records and completion scoring
+    doc_ids    Document ID generation and sequence allocation
+    manifest   Locked, journaled updates to docs/manifest.json
+    batch      In-process script runner behind `arckit batch`
+
+The package is installed with arckit-cli and vendored next to the scripts
+(scripts/python/arckit_core) and Gemini hooks by scripts/converter.py, so
+plugin repos work without arckit-cli installed. It has no third-party
+dependencies.
+"""
@@ -0,0 +1,306 @@
+"""
+Manifest store -- locked, atomic updates to docs/manifest.json.
+
+Used by update-manifest.py (and anything else that edits the manifest)
+so concurrent hook invocations cannot clobber each other:
+
+  - An exclusive lock on docs/.manifest.lock is held from load to flush
+    (fcntl on POSIX, msvcrt on Windows)
+  - Writes go to a temp file in docs/ and are moved into place with
+    os.replace, so readers never see a half-written manifest
+  - Entries are indexed by base document ID (ARC-001-REQ-v1.0 -> ARC-001-REQ)
+    per array, so replacing a document is O(1) instead of a list rebuild
+  - Any number of upserts inside one `with ManifestStore(...)` block are
+    coalesced into a single flush
+
+Large manifests are not rewritten on every artifact write: once
+docs/manifest.json exceeds JOURNAL_MANIFEST_BYTES, record_update() appends
+the change to docs/manifest.journal.jsonl instead. The journal is folded
+back into manifest.json whenever a ManifestStore is opened (compaction),
+automatically once it exceeds COMPACT_JOURNAL_BYTES, or on demand:
+
+    python3 manifest_store.py compact [REPO_ROOT]
+
+Full rewrites of manifest.json (/arckit:pages, manifest_builder.py) make
+pending records obsolete: they discard the journal, and records stamped
+before manifest.json's mtime are never replayed.
+
+Usage:
+    with ManifestStore(manifest_path) as store:
+        store.upsert("001-fuel-prices", "documents", entry)
+        store.upsert("000-global", "global", other_entry)
+"""
+
+import contextlib
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+
+from .state import file_lock, write_json_atomic, file_size, dir_mtime_ns
+
+JOURNAL_NAME = "manifest.journal.jsonl"
+
+# Manifests larger than this get journal appends instead of full rewrites
+JOURNAL_MANIFEST_BYTES = 256 * 1024
+
+# Journals larger than this are compacted by the next record_update()
+COMPACT_JOURNAL_BYTES = 64 * 1024
+
+
+def base_id(document_id):
+    """Strip version to get base ID for dedup: ARC-001-REQ-v1.0 -> ARC-001-REQ."""
+    return re.sub(r"-v\d+(\.\d+)?$", "", document_id)
+
+
+def project_display_name(project_id):
+    """Derive display name: "001-fuel-prices" -> "Fuel Prices"."""
+    name = re.sub(r"^\d{3}-", "", project_id)
+    return " ".join(word.capitalize() for word in name.split("-"))
+
+
+def journal_path(manifest_path):
+    return os.path.join(os.path.dirname(manifest_path), JOURNAL_NAME)
+
+
+def lock_path(manifest_path):
+    return os.path.join(os.path.dirname(manifest_path), ".manifest.lock")
+
+
+class ManifestStore:
+    """Lock-protected, batched editor for docs/manifest.json.
+
+    Entering the context acquires the lock and loads the manifest; leaving
+    it flushes once (if anything changed) and releases the lock. A manifest
+    that is missing or unparseable loads as None and upserts are ignored.
+    """
+
+    def __init__(self, manifest_path):
+        self.path = manifest_path
+        self.manifest = None
+        self.dirty = False
+        # True once a journal was found on load; flush() then removes it
+        self.journaled = False
+        self._lock = None
+        # (project_id, key) -> {base_id: position in the array}
+        self._index = {}
+
+    def __enter__(self):
+        self._lock = file_lock(lock_path(self.path))
+        self._lock.__enter__()
+        try:
+            self.load()
+        except BaseException:
+            self._lock.__exit__(*sys.exc_info())
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._lock.__exit__(exc_type, exc, tb)
+        return False
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            manifest = None
+        self.manifest = manifest if isinstance(manifest, dict) else None
+        self.dirty = False
+        self._index = {}
+        self.journaled = False
+        if self.manifest is not None:
+            self.replay_journal()
+
+    def replay_journal(self):
+        """Fold pending journal records into the loaded manifest.
+
+        Records older than manifest.json were superseded by a full rewrite
+        and are skipped. Records without a timestamp (older journals) are
+        dated by the journal file's mtime.
+        """
+        path = journal_path(self.path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                journal_mtime = os.fstat(f.fileno()).st_mtime_ns
+                lines = f.readlines()
+        except OSError:
+            return
+        self.journaled = True
+        manifest_mtime = dir_mtime_ns(self.path)
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn final line from an interrupted append
+            if not isinstance(record, dict) or not record.get("project") \
+                    or not isinstance(record.get("entry"), dict):
+                continue
+            stamp = record.get("time_ns")
+            if (stamp if isinstance(stamp, int) else journal_mtime) < manifest_mtime:
+                continue
+            self.upsert(record.get("project", ""), record.get("key", "documents"), record["entry"])
+            if record.get("default"):
+                self.set_default_document()
+
+    def flush(self):
+        """Write the manifest if it changed since load/last flush.
+
+        A replayed journal is removed even when none of its records changed
+        anything (all superseded or unparseable).
+        """
+        if self.manifest is None:
+            return
+        if self.dirty:
+            self.manifest["generated"] = datetime.now(timezone.utc).isoformat()
+            # 2-space indent, like JSON.stringify(m, null, 2)
+            write_json_atomic(self.path, self.manifest, indent=2)
+            self.dirty = False
+        if self.journaled:
+            # Journal records are now part of manifest.json (or were stale)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(journal_path(self.path))
+            self.journaled = False
+
+    def _project(self, project_id):
+        if not isinstance(self.manifest.get("projects"), list):
+            self.manifest["projects"] = []
+        for p in self.manifest["projects"]:
+            if p.get("id") == project_id:
+                return p
+        project = {
+            "id": project_id,
+            "name": project_display_name(project_id),
+            "documents": [],
+        }
+        self.manifest["projects"].append(project)
+        return project
+
+    def _array(self, project_id, key):
+        """Return the target array and its base_id -> position index."""
+        if project_id == "000-global":
+            owner = self.manifest
+        else:
+            owner = self._project(project_id)
+        if not isinstance(owner.get(key), list):
+            owner[key] = []
+        entries = owner[key]
+
+        index = self._index.get((project_id, key))
+        if index is None or len(index) != len(entries):
+            # Build once per array; older manifests may hold duplicates
+            # (same base ID, different versions), keep only the last one
+            index = {}
+            deduped = []
+            for e in entries:
+                bid = base_id(e.get("documentId", ""))
+                if bid in index:
+                    deduped[index[bid]] = e
+                else:
+                    index[bid] = len(deduped)
+                    deduped.append(e)
+            if len(deduped) != len(entries):
+                entries[:] = deduped
+                self.dirty = True
+            self._index[(project_id, key)] = index
+        return entries, index
+
+    def upsert(self, project_id, key, entry):
+        """Insert or replace `entry` (by base document ID) in a manifest array.
+
+        `key` is "global" for 000-global, otherwise the project array name
+        ("documents", "decisions", ...). Returns False if no manifest is loaded.
+        """
+        if self.manifest is None:
+            return False
+        entries, index = self._array(project_id, key)
+        bid = base_id(entry.get("documentId", ""))
+        pos = index.get(bid)
+        if pos is None:
+            index[bid] = len(entries)
+            entries.append(entry)
+        else:
+            entries[pos] = entry
+        self.dirty = True
+        return True
+
+    def set_default_document(self):
+        """Mark the first global PRIN document as the default landing page."""
+        for d in self.manifest.get("global") or []:
+            if d.get("documentId") and "PRIN" in d["documentId"]:
+                d["isDefault"] = True
+                self.manifest["defaultDocument"] = d["path"]
+                self.dirty = True
+                break
+
+
+def append_journal(manifest_path, project_id, key, entry, set_default=False):
+    """Append one manifest update to the journal (O(1) in manifest size)."""
+    record = {"project": project_id, "key": key, "entry": entry, "time_ns": time.time_ns()}
+    if set_default:
+        record["default"] = True
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with file_lock(lock_path(manifest_path)):
+        with open(journal_path(manifest_path), "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def discard_journal(manifest_path):
+    """Drop pending journal records; call after rewriting manifest.json in full."""
+    with file_lock(lock_path(manifest_path)):
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(journal_path(manifest_path))
+
+
+def compact(manifest_path):
+    """Fold the journal into manifest.json. Returns True if anything was folded."""
+    if not os.path.isfile(journal_path(manifest_path)):
+        return False
+    with ManifestStore(manifest_path) as store:
+        return store.journaled
+
+
+def record_update(manifest_path, project_id, key, entry, set_default=False):
+    """Apply one manifest update the cheapest safe way.
+
+    Small manifests are rewritten directly; large ones get a journal append,
+    with compaction once the journal passes COMPACT_JOURNAL_BYTES.
+    """
+    if file_size(manifest_path) <= JOURNAL_MANIFEST_BYTES:
+        with ManifestStore(manifest_path) as store:
+            store.upsert(project_id, key, entry)
+            if set_default:
+                store.set_default_document()
+        return
+    append_journal(manifest_path, project_id, key, entry, set_default)
+    if file_size(journal_path(manifest_path)) > COMPACT_JOURNAL_BYTES:
+        compact(manifest_path)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="ArcKit manifest store maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_compact = sub.add_parser("compact", help="Fold docs/manifest.journal.jsonl into docs/manifest.json")
+    p_compact.add_argument("repo_root", nargs="?", default=os.getcwd(), help="Repository root (default: cwd)")
+    args = parser.parse_args()
+
+    if args.command == "compact":
+        manifest_path = os.path.join(os.path.abspath(args.repo_root), "docs", "manifest.json")
+        if not os.path.isfile(manifest_path):
+            sys.stderr.write(f"No manifest found at {manifest_path}\n")
+            sys.exit(1)
+        if compact(manifest_path):
+            print(f"Compacted journal into {manifest_path}")
+        else:
+            print("Nothing to compact")
+
+
+if __name__ == "__main__":
+    main()
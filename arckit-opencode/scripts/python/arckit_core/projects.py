@@ -0,0 +1,376 @@
+"""
+Project layout, directory snapshots, project numbering and lookup.
+"""
+
+import bisect
+import os
+import re
+from pathlib import Path
+
+from .log import log_error, log_success
+from .repo import find_repo_root, get_state_dir
+from .state import file_lock, write_json_atomic, read_json, dir_mtime_ns
+
+# Subdirectories created for every new project
+PROJECT_SUBDIRS = [
+    "", "vendors", "external", "final",
+    "decisions", "diagrams", "wardley-maps",
+    "data-contracts", "reviews",
+]
+
+# Counter file (next-project in the state directory, see get_state_dir())
+# holding the next project number and the projects/ mtime it was written
+# against. Any change to projects/ made outside reserve_project_dir() makes
+# it stale, and it is rebuilt from a directory scan.
+PROJECT_COUNTER = "next-project"
+
+
+# ============================================================================
+# Project Layout
+# ============================================================================
+
+def slugify(text):
+    """Convert text to kebab-case slug."""
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = text.strip("-")
+    return text
+
+
+def create_project_dir(project_dir):
+    """Create project directory structure with all required subdirectories."""
+    for sub in PROJECT_SUBDIRS:
+        (Path(project_dir) / sub).mkdir(parents=True, exist_ok=True)
+    log_success(f"Created project directory: {project_dir}")
+
+
+def get_project_number_from_dir(dir_path):
+    """Extract 3-digit project number from directory name."""
+    name = Path(dir_path).name
+    m = re.match(r"^(\d{3})-", name)
+    return m.group(1) if m else None
+
+
+# ============================================================================
+# Project Snapshots
+# ============================================================================
+
+def scan_dir(path, mtimes=True):
+    """List a directory in a single os.scandir pass.
+
+    Returns {name: (is_dir, mtime)} built from each DirEntry's cached file
+    type, so no per-entry isfile/isdir calls are needed. mtime is None for
+    directories (and for files when mtimes=False). Returns {} if the
+    directory is missing or unreadable.
+    """
+    entries = {}
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        entries[entry.name] = (True, None)
+                    elif entry.is_file():
+                        mtime = entry.stat().st_mtime if mtimes else None
+                        entries[entry.name] = (False, mtime)
+                except OSError:
+                    continue
+    except OSError:
+        return {}
+    return entries
+
+
+def snapshot_project(project_dir, mtimes=True):
+    """Snapshot a project directory and its immediate subdirectories.
+
+    Each directory is listed exactly once. Returns a dict:
+        {"name": "001-foo", "path": project_dir,
+         "entries": {"": {...}, "vendors": {...}, ...}}
+    where "entries" maps "" (the project directory) and every subdirectory
+    name to its scan_dir() result.
+    """
+    root = scan_dir(project_dir, mtimes)
+    entries = {"": root}
+    for name, (is_dir, _) in root.items():
+        if is_dir:
+            entries[name] = scan_dir(os.path.join(project_dir, name), mtimes)
+    return {"name": Path(project_dir).name, "path": str(project_dir), "entries": entries}
+
+
+def snapshot_files(snapshot, subdir=""):
+    """Sorted file names in a snapshotted directory ("" = project root)."""
+    entries = snapshot["entries"].get(subdir, {})
+    return sorted(name for name, (is_dir, _) in entries.items() if not is_dir)
+
+
+def snapshot_subdirs(snapshot, subdir=""):
+    """Sorted subdirectory names in a snapshotted directory."""
+    entries = snapshot["entries"].get(subdir, {})
+    return sorted(name for name, (is_dir, _) in entries.items() if is_dir)
+
+
+def list_project_dirs(projects_dir):
+    """Sorted project directory paths (Path objects) under projects/."""
+    return sorted(
+        Path(projects_dir) / name
+        for name, (is_dir, _) in scan_dir(projects_dir, mtimes=False).items()
+        if is_dir
+    )
+
+
+# ============================================================================
+# Project Numbering
+# ============================================================================
+
+def scan_next_project_number(repo_root):
+    """Next project number from a full scan of projects/ (highest NNN + 1)."""
+    max_num = 0
+    projects_dir = os.path.join(repo_root, "projects")
+    for name, (is_dir, _) in scan_dir(projects_dir, mtimes=False).items():
+        if is_dir:
+            m = re.match(r"^(\d{3})-", name)
+            if m:
+                max_num = max(max_num, int(m.group(1)))
+    return max_num + 1
+
+
+def read_project_counter(repo_root):
+    """Return the counter's next project number, or None if missing or stale."""
+    state = read_json(os.path.join(get_state_dir(repo_root), PROJECT_COUNTER))
+    if not isinstance(state, dict):
+        return None
+    next_num = state.get("next")
+    if not isinstance(next_num, int) or next_num < 1:
+        return None
+    if state.get("projects_mtime_ns") != dir_mtime_ns(os.path.join(repo_root, "projects")):
+        return None
+    return next_num
+
+
+def get_next_project_number(repo_root):
+    """Get the next available project number (zero-padded to 3 digits).
+
+    Answered from the project counter when it is current, otherwise from a
+    scan of projects/. Does not reserve the number; use reserve_project_dir()
+    to allocate one.
+    """
+    next_num = read_project_counter(repo_root) or scan_next_project_number(repo_root)
+    return f"{next_num:03d}"
+
+
+def reserve_project_dir(repo_root, slug):
+    """Allocate the next project number and create projects/NNN-slug.
+
+    Allocation and mkdir happen under next-project.lock in the state
+    directory, so concurrent callers always get distinct numbers. Returns
+    (project_number, project_dir).
+    """
+    state_dir = get_state_dir(repo_root)
+    projects_dir = os.path.join(repo_root, "projects")
+    os.makedirs(state_dir, exist_ok=True)
+    os.makedirs(projects_dir, exist_ok=True)
+
+    with file_lock(os.path.join(state_dir, f"{PROJECT_COUNTER}.lock")):
+        next_num = read_project_counter(repo_root) or scan_next_project_number(repo_root)
+        while True:
+            project_dir = os.path.join(projects_dir, f"{next_num:03d}-{slug}")
+            try:
+                os.mkdir(project_dir)
+                break
+            except FileExistsError:
+                # Counter was stale despite a matching mtime: heal from a scan
+                next_num = max(next_num + 1, scan_next_project_number(repo_root))
+        write_json_atomic(os.path.join(state_dir, PROJECT_COUNTER), {
+            "next": next_num + 1,
+            "projects_mtime_ns": dir_mtime_ns(projects_dir),
+        })
+
+    return f"{next_num:03d}", project_dir
+
+
+# ============================================================================
+# Project Finding
+# ============================================================================
+
+# Match tiers, best first. A lookup returns every project in the first
+# tier that matches anything; more than one is reported as ambiguous.
+MATCH_EXACT = "exact"        # full name, or NNN / NNN-slug prefix ("001", "1")
+MATCH_PREFIX = "prefix"      # name or slug starts with the query
+MATCH_TOKEN = "token"        # every query word is (a prefix of) a slug word
+MATCH_SUBSTRING = "substring"
+MATCH_FUZZY = "fuzzy"        # slug within a small edit distance of the query
+
+# In-process memo: projects dir -> ProjectIndex (revalidated by mtime)
+_project_index_cache = {}
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+
+class ProjectIndex:
+    """Name index over projects/: number -> names, slug word -> names.
+
+    Built from one scan of projects/. Exact, number, prefix (bisect over
+    sorted names) and token lookups are dict or O(log n) operations; the
+    substring and edit-distance tiers scan the names and are only reached
+    when the cheaper tiers find nothing.
+    """
+
+    def __init__(self, projects_dir, names):
+        self.projects_dir = str(projects_dir)
+        self.names = sorted(names)
+        self.slugs = {}
+        self.by_number = {}
+        self.by_token = {}
+        for name in self.names:
+            m = re.match(r"^(\d{3})-(.*)$", name)
+            slug = m.group(2) if m else name
+            self.slugs[name] = slug
+            if m:
+                self.by_number.setdefault(m.group(1), []).append(name)
+            for token in filter(None, slug.split("-")):
+                self.by_token.setdefault(token, []).append(name)
+        self.sorted_slugs = sorted((slug, name) for name, slug in self.slugs.items())
+        self.sorted_tokens = sorted(self.by_token)
+
+    @classmethod
+    def load(cls, repo_root):
+        """Index for repo_root/projects, reused while the directory is unchanged."""
+        projects_dir = os.path.join(repo_root, "projects")
+        mtime = dir_mtime_ns(projects_dir)
+        cached = _project_index_cache.get(projects_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        names = [name for name, (is_dir, _) in scan_dir(projects_dir, mtimes=False).items() if is_dir]
+        index = cls(projects_dir, names)
+        _project_index_cache[projects_dir] = (mtime, index)
+        return index
+
+    def path(self, name):
+        return os.path.join(self.projects_dir, name)
+
+    @staticmethod
+    def _prefixed(sorted_keys, prefix):
+        """Keys in a sorted list that start with prefix (bisect, no full scan)."""
+        start = bisect.bisect_left(sorted_keys, prefix)
+        end = bisect.bisect_left(sorted_keys, prefix + "\uffff")
+        return sorted_keys[start:end]
+
+    def _prefixed_slugs(self, prefix):
+        """(slug, name) pairs whose slug starts with prefix."""
+        start = bisect.bisect_left(self.sorted_slugs, (prefix,))
+        end = bisect.bisect_left(self.sorted_slugs, (prefix + "\uffff",))
+        return self.sorted_slugs[start:end]
+
+    def match(self, query):
+        """Return (tier, names) for the best matching tier, or (None, [])."""
+        if not query:
+            return None, []
+
+        # Exact: full name, number (zero-padded if numeric), or NNN-slug
+        if query in self.slugs:
+            exact = [query]
+        elif query.isdigit() and len(query) <= 3:
+            exact = list(self.by_number.get(f"{int(query):03d}", []))
+        else:
+            exact = self._prefixed(self.names, f"{query}-")
+        if exact:
+            return MATCH_EXACT, exact
+
+        words = slugify(query)
+        if not words:
+            return None, []
+
+        prefixed = set(self._prefixed(self.names, query))
+        prefixed.update(name for _, name in self._prefixed_slugs(words))
+        if prefixed:
+            return MATCH_PREFIX, sorted(prefixed)
+
+        tokens = words.split("-")
+        candidates = None
+        for token in tokens:
+            hits = set()
+            for key in self._prefixed(self.sorted_tokens, token):
+                hits.update(self.by_token[key])
+            candidates = hits if candidates is None else candidates & hits
+            if not candidates:
+                break
+        if candidates:
+            return MATCH_TOKEN, sorted(candidates)
+
+        substring = [name for name in self.names if query in name]
+        if substring:
+            return MATCH_SUBSTRING, substring
+
+        limit = max(1, len(words) // 4)
+        scored = sorted(
+            (edit_distance(words, slug, limit), name) for name, slug in self.slugs.items()
+        )
+        best = scored[0][0] if scored else limit + 1
+        if best <= limit:
+            return MATCH_FUZZY, [name for dist, name in scored if dist == best]
+        return None, []
+
+
+def match_projects(query, repo_root=None, marker=None):
+    """Ranked project lookup: returns (tier, [project dirs]) for the best tier."""
+    if repo_root is None:
+        repo_root = find_repo_root(marker=marker)
+    index = ProjectIndex.load(repo_root)
+    tier, names = index.match(query)
+    return tier, [index.path(name) for name in names]
+
+
+def find_project_dir_by_prefix(prefix, repo_root=None, marker=None):
+    """Find project directory by number, name prefix, slug words or fuzzy match.
+
+    Returns None (after logging the candidates) if the best match is
+    ambiguous, rather than picking the first hit.
+    """
+    if repo_root is None:
+        repo_root = find_repo_root(marker=marker)
+    projects_dir = Path(repo_root) / "projects"
+    if not projects_dir.is_dir():
+        log_error("No projects directory found")
+        return None
+
+    tier, matches = match_projects(prefix, repo_root)
+    if not matches:
+        log_error(f"No project found matching: {prefix}")
+        return None
+    if len(matches) > 1:
+        names = ", ".join(Path(m).name for m in matches)
+        log_error(f"Ambiguous project '{prefix}' ({tier} match): {names}")
+        return None
+    return matches[0]
+
+
+def list_projects(repo_root=None, marker=None):
+    """List all projects."""
+    if repo_root is None:
+        repo_root = find_repo_root(marker=marker)
+    projects_dir = Path(repo_root) / "projects"
+    if not projects_dir.is_dir():
+        print("No projects found")
+        return
+
+    dirs = sorted(d for d in projects_dir.iterdir() if d.is_dir())
+    if not dirs:
+        print("No projects found")
+        return
+
+    print("Available projects:")
+    for d in dirs:
+        print(f"  - {d.name}")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Check that the vendored arckit_core copies match src/arckit_core.
+
+src/arckit_core is the only copy to edit. scripts/converter.py vendors it
+into the plugin and extension script directories (they are published
+without arckit-cli, so they cannot import it from an install). This check
+fails when a vendored copy has drifted, e.g. after editing src/ without
+re-running the converter, or editing a copy by hand.
+
+Usage:
+    python scripts/check-core-sync.py          # report drift, exit 1 if any
+    python scripts/check-core-sync.py --fix    # re-copy src/arckit_core over the copies
+
+Uses Python stdlib only.
+"""
+
+import argparse
+import filecmp
+import shutil
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SOURCE = Path("src/arckit_core")
+
+# Every committed vendored copy: the plugin's and each extension's
+# scripts/python, plus the Gemini hooks
+VENDORED_GLOBS = ["arckit-*/scripts/python/arckit_core", "arckit-gemini/hooks/scripts/arckit_core"]
+
+IGNORE = ["__pycache__", "*.pyc"]
+
+
+def vendored_copies(root):
+    """Vendored arckit_core directories under root, sorted."""
+    return sorted({path for pattern in VENDORED_GLOBS for path in root.glob(pattern) if path.is_dir()})
+
+
+def source_files(directory):
+    """Relative paths of the package's source files."""
+    return {
+        path.relative_to(directory)
+        for path in directory.rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts and path.suffix != ".pyc"
+    }
+
+
+def find_drift(root):
+    """Map each out-of-sync copy to the relative paths that differ."""
+    source = root / SOURCE
+    expected = source_files(source)
+    drift = {}
+    for copy in vendored_copies(root):
+        actual = source_files(copy)
+        _, mismatch, errors = filecmp.cmpfiles(source, copy, sorted(expected & actual), shallow=False)
+        differing = sorted(str(p) for p in (expected ^ actual) | {Path(p) for p in mismatch + errors})
+        if differing:
+            drift[copy] = differing
+    return drift
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the vendored arckit_core copies against src/arckit_core")
+    parser.add_argument("--fix", action="store_true", help="Re-copy src/arckit_core over every vendored copy")
+    parser.add_argument("--root", type=Path, default=REPO_ROOT, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    drift = find_drift(args.root)
+    if not drift:
+        print(f"arckit_core: {len(vendored_copies(args.root))} vendored copies match {SOURCE}")
+        return 0
+
+    for copy, paths in drift.items():
+        label = copy.relative_to(args.root)
+        if args.fix:
+            shutil.rmtree(copy)
+            shutil.copytree(args.root / SOURCE, copy, ignore=shutil.ignore_patterns(*IGNORE))
+            print(f"Updated: {label}")
+        else:
+            print(f"Out of sync: {label}: {', '.join(paths)}", file=sys.stderr)
+    if args.fix:
+        return 0
+    print(f"Edit {SOURCE} only, then run: python scripts/check-core-sync.py --fix", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
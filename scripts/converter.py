@@ -374,6 +374,30 @@ def convert(commands_dir, agents_dir):
     return counts
 
 
+CORE_PACKAGE_DIR = "src/arckit_core"
+
+# Directories that get a vendored copy of the arckit_core package, so plugin
+# scripts and Gemini hooks import it without arckit-cli installed
+CORE_PACKAGE_TARGETS = ["scripts/python", "../arckit-gemini/hooks/scripts"]
+
+
+def copy_core_package(plugin_dir):
+    """Vendor src/arckit_core into the plugin's script directories.
+
+    Runs before copy_extension_files, which then carries the plugin's
+    scripts/python copy to the other extensions.
+    """
+    for target in CORE_PACKAGE_TARGETS:
+        dst = os.path.normpath(os.path.join(plugin_dir, target, "arckit_core"))
+        if os.path.isdir(dst):
+            shutil.rmtree(dst)
+        shutil.copytree(
+            CORE_PACKAGE_DIR, dst,
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
+        print(f"  Copied: {CORE_PACKAGE_DIR} -> {dst}")
+
+
 def copy_extension_files(plugin_dir):
     """Copy supporting files from plugin to all extension directories.
 
@@ -637,7 +661,9 @@ def generate_gemini_hooks(output_dir):
     """Generate hooks.json for Gemini CLI extension.
 
     Creates arckit-gemini/hooks/hooks.json which tells Gemini CLI
-    which hook scripts to run for each lifecycle event.
+    which hook scripts to run for each lifecycle event. Every entry goes
+    through hook-client.py, which uses the optional hook daemon when it
+    is running and otherwise executes the hook script in-process.
     """
     hooks_dir = os.path.join(output_dir, "hooks")
     os.makedirs(hooks_dir, exist_ok=True)
@@ -649,7 +675,7 @@ def generate_gemini_hooks(output_dir):
                     "hooks": [
                         {
                             "type": "command",
-                            "command": "python3 ${extensionPath}/hooks/scripts/session-start.py",
+                            "command": "python3 ${extensionPath}/hooks/scripts/hook-client.py session-start",
                             "name": "ArcKit Session Init",
                             "timeout": 5000,
                             "description": "Inject ArcKit version and project context",
@@ -662,7 +688,7 @@ def generate_gemini_hooks(output_dir):
                     "hooks": [
                         {
                             "type": "command",
-                            "command": "python3 ${extensionPath}/hooks/scripts/context-inject.py",
+                            "command": "python3 ${extensionPath}/hooks/scripts/hook-client.py context-inject",
                             "name": "ArcKit Context",
                             "timeout": 10000,
                             "description": "Inject project context before agent planning",
@@ -671,27 +697,15 @@ def generate_gemini_hooks(output_dir):
                 }
             ],
             "BeforeTool": [
-                {
-                    "matcher": "write_file",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": "python3 ${extensionPath}/hooks/scripts/validate-filename.py",
-                            "name": "ARC Filename Validator",
-                            "timeout": 5000,
-                            "description": "Validate ARC-xxx filename convention",
-                        }
-                    ],
-                },
                 {
                     "matcher": "write_file|edit_file",
                     "hooks": [
                         {
                             "type": "command",
-                            "command": "python3 ${extensionPath}/hooks/scripts/file-protection.py",
-                            "name": "File Protection",
+                            "command": "python3 ${extensionPath}/hooks/scripts/hook-client.py before-tool",
+                            "name": "ARC Filename Validator and File Protection",
                             "timeout": 5000,
-                            "description": "Protect ArcKit system files from modification",
+                            "description": "Validate ARC-xxx filename convention and protect sensitive files",
                         }
                     ],
                 },
@@ -702,7 +716,7 @@ def generate_gemini_hooks(output_dir):
                     "hooks": [
                         {
                             "type": "command",
-                            "command": "python3 ${extensionPath}/hooks/scripts/update-manifest.py",
+                            "command": "python3 ${extensionPath}/hooks/scripts/hook-client.py update-manifest",
                             "name": "Manifest Updater",
                             "timeout": 5000,
                             "description": "Update manifest.json after writing project files",
@@ -862,6 +876,7 @@ if __name__ == "__main__":
     # Copy extension supporting files BEFORE convert so reference skills
     # are in place before command skills are generated on top
     print("Copying extension supporting files...")
+    copy_core_package(plugin_dir)
     copy_extension_files(plugin_dir)
 
     print()
@@ -11,30 +11,27 @@ A toolkit for enterprise architects to manage:
 - Requirements traceability
 """
 
+import json
 import os
 import subprocess
 import sys
-import zipfile
-import tempfile
+import time
 import shutil
 from pathlib import Path
 from typing import Optional
 
 import typer
-import httpx
 from rich.console import Console
-from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
 
-# For cross-platform keyboard input
-import readchar
-import ssl
-import truststore
-import platformdirs
+from arckit_core.batch import run_ops
+from arckit_core.repo import find_repo_root
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
+from .install import (
+    LINK_MODES, CopyPlan, load_install_manifest, manifest_entries, plan_upgrade,
+    remove_stale_files, run_plan, save_install_manifest,
+)
 
 # Agent configuration for ArcKit
 # Note: Claude Code support has moved to the ArcKit plugin (arckit-claude/).
@@ -74,6 +71,9 @@ TAGLINE = "Enterprise Architecture Governance & Vendor Procurement"
 
 console = Console()
 
+# Never installed into workspaces from the packaged scripts
+SCRIPT_IGNORE_PATTERNS = ("__pycache__", "*.pyc")
+
 app = typer.Typer(
     name="arckit",
     help="Enterprise Architecture Governance & Vendor Procurement Toolkit",
@@ -209,6 +209,8 @@ def get_data_paths():
                     return build_paths(share_path)
 
         # Try platformdirs approach for other installs
+        import platformdirs
+
         data_dir = Path(platformdirs.user_data_dir("arckit"))
         if data_dir.exists():
             return build_paths(data_dir)
@@ -316,6 +318,243 @@ Use the `/arckit.customize` command to copy templates for editing:
     return project_path
 
 
+def read_package_version(data_paths):
+    """Version string from the packaged VERSION file, or None."""
+    try:
+        return data_paths["version"].read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def detect_install_options(project_path: Path) -> dict:
+    """Guess init options for a workspace installed before install manifests."""
+    if (project_path / ".opencode").is_dir():
+        ai_assistant = "opencode"
+    elif (project_path / ".github" / "prompts").is_dir():
+        ai_assistant = "copilot"
+    else:
+        ai_assistant = "codex"
+    return {
+        "ai": ai_assistant,
+        "all_ai": False,
+        "minimal": not (project_path / "docs" / "guides").is_dir(),
+        "link_mode": "copy",
+    }
+
+
+def build_install_plan(project_path, data_paths, ai_assistant, all_ai, minimal, out=console):
+    """Plan every packaged file that init installs into project_path.
+
+    Shared by init (which executes the whole plan) and upgrade (which
+    executes only the files whose packaged content changed). Progress and
+    warnings go to `out`.
+    """
+    templates_src = data_paths["templates"]
+    scripts_src = data_paths["scripts"]
+
+    templates_dst = project_path / ".arckit" / "templates"
+    scripts_dst = project_path / ".arckit" / "scripts"
+    agent_folder = AGENT_CONFIG[ai_assistant]["folder"]
+
+    # Determine destination subfolder based on assistant type
+    subfolder = "commands" if ai_assistant == "opencode" else "prompts"
+    commands_dst = project_path / agent_folder / subfolder
+
+    plan = CopyPlan()
+
+    # Copy templates if they exist
+    if templates_src.exists():
+        out.print(f"[dim]Copying templates from: {templates_src}[/dim]")
+        template_count = plan.add_glob(templates_src, "*.md", templates_dst)
+        plan.report(f"Copied {template_count} templates")
+    else:
+        out.print(
+            f"[yellow]Warning: Templates not found at {templates_src}[/yellow]"
+        )
+
+    # Copy scripts if they exist
+    if scripts_src.exists():
+        out.print(f"[dim]Copying scripts from: {scripts_src}[/dim]")
+        plan.add_tree(scripts_src, scripts_dst, ignore=SCRIPT_IGNORE_PATTERNS)
+        plan.report("Scripts copied")
+
+        # Vendor the arckit_core package next to the Python scripts so they
+        # run without arckit-cli on the interpreter's path
+        core_src = Path(__file__).parent.parent / "arckit_core"
+        if core_src.is_dir():
+            plan.add_tree(
+                core_src,
+                scripts_dst / "python" / "arckit_core",
+                ignore=SCRIPT_IGNORE_PATTERNS,
+            )
+    else:
+        out.print(f"[yellow]Warning: Scripts not found at {scripts_src}[/yellow]")
+
+    # Copy references if they exist
+    references_src = data_paths.get("codex_references")
+    if references_src and references_src.exists():
+        references_dst = project_path / ".arckit" / "references"
+        plan.add_tree(references_src, references_dst)
+        plan.report("References copied")
+
+    # Copy slash commands
+    # Copy Codex prompts (all_ai and single-AI both install codex)
+    if ai_assistant == "codex" or all_ai:
+        # Copy Codex skills to .agents/skills/ (replaces deprecated .codex/prompts/)
+        codex_skills_src = data_paths.get("codex_skills")
+        if codex_skills_src and codex_skills_src.exists():
+            skills_dst = project_path / ".agents" / "skills"
+            plan.add_tree(codex_skills_src, skills_dst)
+            skill_count = sum(
+                1 for d in codex_skills_src.iterdir()
+                if d.is_dir() and not d.name.startswith(".")
+            )
+            plan.report(f"Copied {skill_count} skills to .agents/skills/")
+        else:
+            out.print(
+                f"[yellow]Warning: Codex skills not found at {codex_skills_src}[/yellow]"
+            )
+
+        # Copy Codex agent configs
+        codex_agents_src = data_paths.get("codex_agents")
+        if codex_agents_src and codex_agents_src.exists():
+            agents_dst = project_path / ".codex" / "agents"
+            agent_count = 0
+            for agent_file in sorted(codex_agents_src.iterdir()):
+                if agent_file.suffix in (".toml", ".md"):
+                    agent_count += plan.add_file(agent_file, agents_dst / agent_file.name)
+            plan.report(f"Copied {agent_count} agent configs to .codex/agents/")
+
+        # Copy Codex config.toml (MCP servers + agent roles)
+        codex_config_src = data_paths.get("codex_config")
+        if codex_config_src and codex_config_src.exists():
+            config_dst = project_path / ".codex" / "config.toml"
+            plan.add_file(codex_config_src, config_dst)
+            plan.report("Copied config.toml (MCP servers + agent roles)")
+
+    # Copy OpenCode commands and agents
+    if ai_assistant == "opencode" or all_ai:
+        # Copy commands
+        commands_src = data_paths["opencode_commands"]
+        if all_ai:
+            target_cmd_dst = project_path / ".opencode" / "commands"
+            target_agent_dst = project_path / ".opencode" / "agents"
+        else:
+            target_cmd_dst = project_path / agent_folder / "commands"
+            target_agent_dst = project_path / agent_folder / "agents"
+
+        if commands_src.exists():
+            out.print(f"[dim]Copying OpenCode commands from: {commands_src}[/dim]")
+            command_count = plan.add_glob(commands_src, "arckit.*.md", target_cmd_dst)
+            plan.report(f"Copied {command_count} OpenCode commands")
+        else:
+            out.print(
+                f"[yellow]Warning: OpenCode commands not found at {commands_src}[/yellow]"
+            )
+
+        # Copy agents
+        agents_src = data_paths["opencode_agents"]
+        if agents_src.exists():
+            out.print(f"[dim]Copying OpenCode agents from: {agents_src}[/dim]")
+            agent_count = plan.add_glob(agents_src, "*.md", target_agent_dst)
+            plan.report(f"Copied {agent_count} OpenCode agents")
+        else:
+            out.print(
+                f"[yellow]Warning: OpenCode agents not found at {agents_src}[/yellow]"
+            )
+
+    # Copy .opencode/README.md, .gitignore and skills (single-AI OpenCode only)
+    opencode_src = data_paths.get("opencode_root")
+    if ai_assistant == "opencode" and opencode_src and opencode_src.exists():
+        opencode_dst = project_path / ".opencode"
+        if plan.add_file(opencode_src / "README.md", opencode_dst / "README.md"):
+            plan.report("Copied .opencode/README.md")
+        if plan.add_file(opencode_src / ".gitignore", opencode_dst / ".gitignore"):
+            plan.report("Copied .opencode/.gitignore")
+        opencode_skills_src = opencode_src / "skills"
+        if opencode_skills_src.exists():
+            plan.add_tree(opencode_skills_src, opencode_dst / "skills")
+            plan.report("Copied .opencode/skills")
+
+    # Copy Copilot prompt files and agents
+    if ai_assistant == "copilot":
+        out.print("[cyan]Setting up Copilot environment...[/cyan]")
+
+        # Copy prompt files to .github/prompts/
+        copilot_prompts_src = data_paths.get("copilot_prompts")
+        if copilot_prompts_src and copilot_prompts_src.exists():
+            prompts_dst = project_path / ".github" / "prompts"
+            prompt_count = plan.add_glob(copilot_prompts_src, "*.prompt.md", prompts_dst)
+            plan.report(f"Copied {prompt_count} prompt files to .github/prompts/")
+        else:
+            out.print(
+                f"[yellow]Warning: Copilot prompts not found at {copilot_prompts_src}[/yellow]"
+            )
+
+        # Copy agent files to .github/agents/
+        copilot_agents_src = data_paths.get("copilot_agents")
+        if copilot_agents_src and copilot_agents_src.exists():
+            agents_dst = project_path / ".github" / "agents"
+            agent_count = plan.add_glob(copilot_agents_src, "*.agent.md", agents_dst)
+            plan.report(f"Copied {agent_count} agent files to .github/agents/")
+
+        # Copy copilot-instructions.md
+        copilot_instructions_src = data_paths.get("copilot_instructions")
+        if copilot_instructions_src and copilot_instructions_src.exists():
+            instructions_dst = project_path / ".github" / "copilot-instructions.md"
+            plan.add_file(copilot_instructions_src, instructions_dst)
+            plan.report("Copied copilot-instructions.md")
+
+        plan.report("Copilot environment configured")
+
+    plan.report("Templates configured")
+
+    # Copy documentation (unless --minimal)
+    if not minimal:
+        out.print("[cyan]Setting up documentation...[/cyan]")
+
+        # Copy docs/guides/
+        docs_guides_src = data_paths["docs_guides"]
+        if docs_guides_src.exists():
+            docs_guides_dst = project_path / "docs" / "guides"
+            plan.add_tree(docs_guides_src, docs_guides_dst)
+            guide_count = len(list(docs_guides_src.glob("*.md")))
+            plan.report(f"Copied {guide_count} command guides")
+
+        # Copy docs/README.md
+        docs_readme_src = data_paths["docs_readme"]
+        if docs_readme_src.exists():
+            plan.add_file(docs_readme_src, project_path / "docs" / "README.md")
+            plan.report("Copied docs/README.md")
+
+        # Copy DEPENDENCY-MATRIX.md
+        dep_matrix_src = data_paths["dependency_matrix"]
+        if dep_matrix_src.exists():
+            plan.add_file(dep_matrix_src, project_path / "docs" / "DEPENDENCY-MATRIX.md")
+            plan.report("Copied docs/DEPENDENCY-MATRIX.md")
+
+        # Copy WORKFLOW-DIAGRAMS.md
+        workflow_src = data_paths["workflow_diagrams"]
+        if workflow_src.exists():
+            plan.add_file(workflow_src, project_path / "docs" / "WORKFLOW-DIAGRAMS.md")
+            plan.report("Copied docs/WORKFLOW-DIAGRAMS.md")
+
+        plan.report("Documentation configured")
+
+    # Copy VERSION and CHANGELOG.md (always, not gated by --minimal)
+    version_src = data_paths["version"]
+    if version_src.exists():
+        plan.add_file(version_src, project_path / "VERSION")
+        plan.report("Copied VERSION")
+
+    changelog_src = data_paths["changelog"]
+    if changelog_src.exists():
+        plan.add_file(changelog_src, project_path / "CHANGELOG.md")
+        plan.report("Copied CHANGELOG.md")
+
+    return plan
+
+
 @app.command()
 def init(
     project_name: str = typer.Argument(
@@ -337,6 +576,12 @@ def init(
     minimal: bool = typer.Option(
         False, "--minimal", help="Minimal install: skip docs and guides"
     ),
+    link_mode: str = typer.Option(
+        "copy",
+        "--link-mode",
+        help="How to install packaged files: copy, hardlink, reflink (copy-on-write) or "
+        "symlink; falls back to copy where linking is not possible",
+    ),
 ):
     """
     Initialize a new ArcKit project for enterprise architecture governance.
@@ -353,6 +598,11 @@ def init(
         arckit init my-project --ai codex
         arckit init . --ai codex
         arckit init --here --ai codex --minimal
+        arckit init my-project --ai codex --link-mode reflink
+
+    With --link-mode hardlink or symlink, workspace files share storage
+    with the installed ArcKit assets: customise templates through
+    .arckit/templates-custom/ rather than editing .arckit/templates/ in place.
     """
 
     show_banner()
@@ -367,6 +617,11 @@ def init(
         )
         raise typer.Exit(1)
 
+    if link_mode not in LINK_MODES:
+        console.print(f"[red]Error:[/red] Invalid link mode '{link_mode}'")
+        console.print(f"Choose from: {', '.join(LINK_MODES)}")
+        raise typer.Exit(1)
+
     if not here and not project_name:
         console.print(
             "[red]Error:[/red] Must specify either a project name or use '.' / --here flag"
@@ -470,211 +725,17 @@ def init(
     console.print(f"[dim]  templates: {templates_src}[/dim]")
     console.print(f"[dim]  scripts: {scripts_src}[/dim]")
 
-    templates_dst = project_path / ".arckit" / "templates"
-    scripts_dst = project_path / ".arckit" / "scripts"
-    agent_folder = AGENT_CONFIG[ai_assistant]["folder"]
-
-    # Determine destination subfolder based on assistant type
-    subfolder = "commands" if ai_assistant == "opencode" else "prompts"
-    commands_dst = project_path / agent_folder / subfolder
-
-    # Copy templates if they exist
-    if templates_src.exists():
-        console.print(f"[dim]Copying templates from: {templates_src}[/dim]")
-        template_count = 0
-        for template_file in templates_src.glob("*.md"):
-            shutil.copy2(template_file, templates_dst / template_file.name)
-            template_count += 1
-        console.print(f"[green]✓[/green] Copied {template_count} templates")
-    else:
-        console.print(
-            f"[yellow]Warning: Templates not found at {templates_src}[/yellow]"
-        )
-
-    # Copy scripts if they exist
-    if scripts_src.exists():
-        console.print(f"[dim]Copying scripts from: {scripts_src}[/dim]")
-        shutil.copytree(
-            scripts_src,
-            scripts_dst,
-            dirs_exist_ok=True,
-            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
-        )
-        console.print(f"[green]✓[/green] Scripts copied")
-    else:
-        console.print(f"[yellow]Warning: Scripts not found at {scripts_src}[/yellow]")
-
-    # Copy references if they exist
-    references_src = data_paths.get("codex_references")
-    if references_src and references_src.exists():
-        references_dst = project_path / ".arckit" / "references"
-        references_dst.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(references_src, references_dst, dirs_exist_ok=True)
-        console.print(f"[green]✓[/green] References copied")
-
-    # Copy slash commands
-    # Copy Codex prompts (all_ai and single-AI both install codex)
-    if ai_assistant == "codex" or all_ai:
-        # Copy Codex skills to .agents/skills/ (replaces deprecated .codex/prompts/)
-        codex_skills_src = data_paths.get("codex_skills")
-        if codex_skills_src and codex_skills_src.exists():
-            skills_dst = project_path / ".agents" / "skills"
-            skills_dst.mkdir(parents=True, exist_ok=True)
-            shutil.copytree(codex_skills_src, skills_dst, dirs_exist_ok=True)
-            skill_count = sum(
-                1 for d in skills_dst.iterdir()
-                if d.is_dir() and not d.name.startswith(".")
-            )
-            console.print(f"[green]✓[/green] Copied {skill_count} skills to .agents/skills/")
-        else:
-            console.print(
-                f"[yellow]Warning: Codex skills not found at {codex_skills_src}[/yellow]"
-            )
-
-        # Copy Codex agent configs
-        codex_agents_src = data_paths.get("codex_agents")
-        if codex_agents_src and codex_agents_src.exists():
-            agents_dst = project_path / ".codex" / "agents"
-            agents_dst.mkdir(parents=True, exist_ok=True)
-            agent_count = 0
-            for agent_file in sorted(codex_agents_src.iterdir()):
-                if agent_file.suffix in (".toml", ".md"):
-                    shutil.copy2(agent_file, agents_dst / agent_file.name)
-                    agent_count += 1
-            console.print(f"[green]✓[/green] Copied {agent_count} agent configs to .codex/agents/")
+    # Plan every file copy first, then run them together on a thread pool
+    plan = build_install_plan(project_path, data_paths, ai_assistant, all_ai, minimal)
+    run_plan(plan, console, link_mode=link_mode)
 
-        # Copy Codex config.toml (MCP servers + agent roles)
-        codex_config_src = data_paths.get("codex_config")
-        if codex_config_src and codex_config_src.exists():
-            config_dst = project_path / ".codex" / "config.toml"
-            shutil.copy2(codex_config_src, config_dst)
-            console.print(f"[green]✓[/green] Copied config.toml (MCP servers + agent roles)")
-
-    # Copy OpenCode commands and agents
-    if ai_assistant == "opencode" or all_ai:
-        # Copy commands
-        commands_src = data_paths["opencode_commands"]
-        if all_ai:
-            target_cmd_dst = project_path / ".opencode" / "commands"
-            target_agent_dst = project_path / ".opencode" / "agents"
-        else:
-            target_cmd_dst = project_path / agent_folder / "commands"
-            target_agent_dst = project_path / agent_folder / "agents"
-
-        if commands_src.exists():
-            console.print(f"[dim]Copying OpenCode commands from: {commands_src}[/dim]")
-            command_count = 0
-            target_cmd_dst.mkdir(parents=True, exist_ok=True)
-            for command_file in commands_src.glob("arckit.*.md"):
-                shutil.copy2(command_file, target_cmd_dst / command_file.name)
-                command_count += 1
-            console.print(f"[green]✓[/green] Copied {command_count} OpenCode commands")
-        else:
-            console.print(
-                f"[yellow]Warning: OpenCode commands not found at {commands_src}[/yellow]"
-            )
-
-        # Copy agents
-        agents_src = data_paths["opencode_agents"]
-        if agents_src.exists():
-            console.print(f"[dim]Copying OpenCode agents from: {agents_src}[/dim]")
-            agent_count = 0
-            target_agent_dst.mkdir(parents=True, exist_ok=True)
-            for agent_file in agents_src.glob("*.md"):
-                shutil.copy2(agent_file, target_agent_dst / agent_file.name)
-                agent_count += 1
-            console.print(f"[green]✓[/green] Copied {agent_count} OpenCode agents")
-        else:
-            console.print(
-                f"[yellow]Warning: OpenCode agents not found at {agents_src}[/yellow]"
-            )
-
-    # Copy Copilot prompt files and agents
-    if ai_assistant == "copilot":
-        console.print("[cyan]Setting up Copilot environment...[/cyan]")
-
-        # Copy prompt files to .github/prompts/
-        copilot_prompts_src = data_paths.get("copilot_prompts")
-        if copilot_prompts_src and copilot_prompts_src.exists():
-            prompts_dst = project_path / ".github" / "prompts"
-            prompts_dst.mkdir(parents=True, exist_ok=True)
-            prompt_count = 0
-            for prompt_file in copilot_prompts_src.glob("*.prompt.md"):
-                shutil.copy2(prompt_file, prompts_dst / prompt_file.name)
-                prompt_count += 1
-            console.print(f"[green]✓[/green] Copied {prompt_count} prompt files to .github/prompts/")
-        else:
-            console.print(
-                f"[yellow]Warning: Copilot prompts not found at {copilot_prompts_src}[/yellow]"
-            )
-
-        # Copy agent files to .github/agents/
-        copilot_agents_src = data_paths.get("copilot_agents")
-        if copilot_agents_src and copilot_agents_src.exists():
-            agents_dst = project_path / ".github" / "agents"
-            agents_dst.mkdir(parents=True, exist_ok=True)
-            agent_count = 0
-            for agent_file in copilot_agents_src.glob("*.agent.md"):
-                shutil.copy2(agent_file, agents_dst / agent_file.name)
-                agent_count += 1
-            console.print(f"[green]✓[/green] Copied {agent_count} agent files to .github/agents/")
-
-        # Copy copilot-instructions.md
-        copilot_instructions_src = data_paths.get("copilot_instructions")
-        if copilot_instructions_src and copilot_instructions_src.exists():
-            instructions_dst = project_path / ".github" / "copilot-instructions.md"
-            shutil.copy2(copilot_instructions_src, instructions_dst)
-            console.print(f"[green]✓[/green] Copied copilot-instructions.md")
-
-        console.print("[green]✓[/green] Copilot environment configured")
-
-    console.print("[green]✓[/green] Templates configured")
-
-    # Copy documentation (unless --minimal)
-    if not minimal:
-        console.print("[cyan]Setting up documentation...[/cyan]")
-
-        # Copy docs/guides/
-        docs_guides_src = data_paths["docs_guides"]
-        if docs_guides_src.exists():
-            docs_guides_dst = project_path / "docs" / "guides"
-            docs_guides_dst.mkdir(parents=True, exist_ok=True)
-            shutil.copytree(docs_guides_src, docs_guides_dst, dirs_exist_ok=True)
-            guide_count = len(list(docs_guides_dst.glob("*.md")))
-            console.print(f"[green]✓[/green] Copied {guide_count} command guides")
-
-        # Copy docs/README.md
-        docs_readme_src = data_paths["docs_readme"]
-        if docs_readme_src.exists():
-            docs_readme_dst = project_path / "docs" / "README.md"
-            docs_readme_dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(docs_readme_src, docs_readme_dst)
-            console.print(f"[green]✓[/green] Copied docs/README.md")
-
-        # Copy DEPENDENCY-MATRIX.md
-        dep_matrix_src = data_paths["dependency_matrix"]
-        if dep_matrix_src.exists():
-            shutil.copy2(dep_matrix_src, project_path / "docs" / "DEPENDENCY-MATRIX.md")
-            console.print(f"[green]✓[/green] Copied docs/DEPENDENCY-MATRIX.md")
-
-        # Copy WORKFLOW-DIAGRAMS.md
-        workflow_src = data_paths["workflow_diagrams"]
-        if workflow_src.exists():
-            shutil.copy2(workflow_src, project_path / "docs" / "WORKFLOW-DIAGRAMS.md")
-            console.print(f"[green]✓[/green] Copied docs/WORKFLOW-DIAGRAMS.md")
-
-        console.print("[green]✓[/green] Documentation configured")
-
-    # Copy VERSION and CHANGELOG.md (always, not gated by --minimal)
-    version_src = data_paths["version"]
-    if version_src.exists():
-        shutil.copy2(version_src, project_path / "VERSION")
-        console.print(f"[green]✓[/green] Copied VERSION")
-
-    changelog_src = data_paths["changelog"]
-    if changelog_src.exists():
-        shutil.copy2(changelog_src, project_path / "CHANGELOG.md")
-        console.print(f"[green]✓[/green] Copied CHANGELOG.md")
+    # Record what was installed so `arckit upgrade` can update incrementally
+    save_install_manifest(
+        project_path,
+        manifest_entries(plan, project_path),
+        {"ai": ai_assistant, "all_ai": all_ai, "minimal": minimal, "link_mode": link_mode},
+        read_package_version(data_paths),
+    )
 
     # Determine command prefix based on AI assistant
     if ai_assistant == "codex":
@@ -834,22 +895,12 @@ export OPENCODE_HOME="$PWD/.opencode"
 """
         envrc_path.write_text(envrc_content, encoding="utf-8")
 
-        # Copy .opencode/README.md if it exists
+        # .opencode/README.md, .gitignore and skills were copied with the plan
         opencode_src = data_paths.get("opencode_root")
         if opencode_src and opencode_src.exists():
-            opencode_readme_src = opencode_src / "README.md"
-            opencode_gitignore_src = opencode_src / ".gitignore"
             opencode_dst = project_path / ".opencode"
             opencode_dst.mkdir(parents=True, exist_ok=True)
 
-            if opencode_readme_src.exists():
-                shutil.copy2(opencode_readme_src, opencode_dst / "README.md")
-                console.print(f"[green]✓[/green] Copied .opencode/README.md")
-
-            if opencode_gitignore_src.exists():
-                shutil.copy2(opencode_gitignore_src, opencode_dst / ".gitignore")
-                console.print(f"[green]✓[/green] Copied .opencode/.gitignore")
-
             # Create opencode.json with MCP configuration (workspace config)
             # Using dictionary format with type="remote" matching SDK McpRemoteConfig
             opencode_json_path = opencode_dst / "opencode.json"
@@ -882,15 +933,6 @@ export OPENCODE_HOME="$PWD/.opencode"
                 f"[green]✓[/green] Created .opencode/opencode.json with MCP servers"
             )
 
-            # Copy skills if they exist
-            opencode_skills_src = opencode_src / "skills"
-            if opencode_skills_src.exists():
-                opencode_skills_dst = opencode_dst / "skills"
-                shutil.copytree(
-                    opencode_skills_src, opencode_skills_dst, dirs_exist_ok=True
-                )
-                console.print(f"[green]✓[/green] Copied .opencode/skills")
-
         # Create/update .gitignore
 
         gitignore_path = project_path / ".gitignore"
@@ -955,6 +997,8 @@ export OPENCODE_HOME="$PWD/.opencode"
             "4. Create your first project: [cyan]/arckit-requirements[/cyan]"
         )
 
+    from rich.panel import Panel
+
     console.print(Panel("\n".join(next_steps), title="Next Steps", border_style="cyan"))
 
 
@@ -978,6 +1022,156 @@ def check():
     console.print("\n[bold green]ArcKit CLI is ready to use![/bold green]")
 
 
+@app.command()
+def upgrade(
+    ai_assistant: str = typer.Option(
+        None, "--ai", help="AI assistant to install for (default: as recorded at init)"
+    ),
+    minimal: Optional[bool] = typer.Option(
+        None, "--minimal/--full", help="Skip or include docs and guides (default: as recorded)"
+    ),
+    link_mode: str = typer.Option(
+        None, "--link-mode", help="copy, hardlink, reflink or symlink (default: as recorded)"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would change without touching any files"
+    ),
+):
+    """
+    Upgrade the ArcKit files in the current workspace to this version.
+
+    Compares the packaged templates, scripts, commands and docs with the
+    install manifest recorded in .arckit/ and copies only new and changed
+    files, removing files that are no longer shipped. Files under
+    .arckit/templates-custom/, and installed files you have edited, are
+    never overwritten or removed; they are listed as kept. Workspaces initialised before
+    install manifests existed are fully refreshed once.
+
+    Examples:
+        arckit upgrade
+        arckit upgrade --dry-run
+        arckit upgrade --full --link-mode hardlink
+    """
+    started = time.monotonic()
+    repo_root = find_repo_root(required=False)
+    if not repo_root:
+        console.print("[red]Error:[/red] Not in an ArcKit workspace (no .arckit directory found)")
+        console.print("Run [cyan]arckit init[/cyan] first.")
+        raise typer.Exit(1)
+    project_path = Path(repo_root)
+
+    manifest = load_install_manifest(project_path)
+    previous = manifest["files"] if manifest else {}
+    options = dict(manifest["options"]) if manifest else detect_install_options(project_path)
+    if ai_assistant is not None:
+        options["ai"] = ai_assistant
+    if minimal is not None:
+        options["minimal"] = minimal
+    if link_mode is not None:
+        options["link_mode"] = link_mode
+
+    if options["ai"] not in AGENT_CONFIG:
+        console.print(f"[red]Error:[/red] Invalid AI assistant '{options['ai']}'")
+        console.print(f"Choose from: {', '.join(AGENT_CONFIG.keys())}")
+        raise typer.Exit(1)
+    if options["link_mode"] not in LINK_MODES:
+        console.print(f"[red]Error:[/red] Invalid link mode '{options['link_mode']}'")
+        console.print(f"Choose from: {', '.join(LINK_MODES)}")
+        raise typer.Exit(1)
+
+    data_paths = get_data_paths()
+    plan = build_install_plan(
+        project_path, data_paths, options["ai"], options["all_ai"], options["minimal"],
+        out=Console(quiet=True),
+    )
+    changes, entries, summary = plan_upgrade(plan, project_path, previous)
+
+    if dry_run:
+        for dst in changes.files:
+            console.print(f"[green]+[/green] {Path(dst).relative_to(project_path).as_posix()}")
+        for rel in summary["stale"]:
+            console.print(f"[red]-[/red] {rel}")
+        print_kept_files(summary["edited"], summary["kept"])
+        console.print(
+            f"[dim]Dry run: {summary['added']} to add, {summary['updated']} to update, "
+            f"{len(summary['stale'])} to remove, "
+            f"{len(summary['edited']) + len(summary['kept'])} kept, "
+            f"{summary['unchanged']} unchanged[/dim]"
+        )
+        return
+
+    if changes:
+        run_plan(changes, console, description="Upgrading files", link_mode=options["link_mode"])
+    removed, kept = remove_stale_files(project_path, summary["stale"], previous)
+    print_kept_files(summary["edited"], summary["kept"] + kept)
+
+    # Kept files stay in the manifest so a later upgrade can still update or
+    # clean them up
+    entries.update((rel, previous[rel]) for rel in kept)
+    save_install_manifest(project_path, entries, options, read_package_version(data_paths))
+
+    elapsed_ms = (time.monotonic() - started) * 1000
+    console.print(
+        f"[green]✓[/green] Upgrade complete: {summary['added']} added, "
+        f"{summary['updated']} updated, {len(removed)} removed, "
+        f"{len(summary['edited']) + len(summary['kept']) + len(kept)} kept, "
+        f"{summary['unchanged']} unchanged ({elapsed_ms:.0f} ms)"
+    )
+
+
+def print_kept_files(edited, kept):
+    """Report files an upgrade left alone because they were edited locally."""
+    for rel in edited:
+        console.print(
+            f"[yellow]~ Kept {rel}[/yellow] [dim](edited locally; delete it and "
+            f"re-run upgrade to get the new version)[/dim]"
+        )
+    for rel in kept:
+        console.print(f"[yellow]~ Kept {rel}[/yellow] [dim](edited locally, no longer shipped)[/dim]")
+
+
+def find_scripts_dir() -> Path:
+    """Python scripts of the enclosing ArcKit repo, else the installed copies."""
+    repo_root = find_repo_root(required=False)
+    if repo_root:
+        repo_scripts = Path(repo_root) / ".arckit" / "scripts" / "python"
+        if repo_scripts.is_dir():
+            return repo_scripts
+    return get_data_paths()["scripts"] / "python"
+
+
+@app.command()
+def batch(
+    scripts_dir: Path = typer.Option(
+        None, "--scripts-dir", help="Directory of ArcKit Python scripts (default: .arckit/scripts/python)"
+    ),
+):
+    """Run a JSON list of script operations from stdin in one process.
+
+    Each operation is {"op": "create-project", "args": ["--name", "X", "--json"]}
+    with optional "stdin" and "cwd". Prints a JSON array with one result per
+    operation; exits 1 if any operation failed.
+    """
+    try:
+        ops = json.load(sys.stdin)
+    except ValueError as e:
+        typer.echo(f"Error: Invalid JSON on stdin: {e}", err=True)
+        raise typer.Exit(1)
+    if not isinstance(ops, list):
+        typer.echo("Error: Expected a JSON list of operations on stdin", err=True)
+        raise typer.Exit(1)
+
+    scripts_dir = scripts_dir or find_scripts_dir()
+    if not scripts_dir.is_dir():
+        typer.echo(f"Error: Scripts not found at {scripts_dir}", err=True)
+        raise typer.Exit(1)
+
+    results = run_ops(ops, scripts_dir)
+    print(json.dumps(results, indent=2))
+    if any(r["code"] != 0 for r in results):
+        raise typer.Exit(1)
+
+
 @app.callback()
 def callback(ctx: typer.Context):
     """Show banner when no subcommand is provided."""
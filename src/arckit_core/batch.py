@@ -0,0 +1,153 @@
+"""
+In-process runner for ArcKit scripts, used by ``arckit batch``.
+
+Agent workflows chain create-project.py, generate-document-id.py and
+list-projects.py calls, each paying for an interpreter start, the common.py
+and arckit_core imports, and repo root discovery. Running the same scripts
+here executes them in one process: modules (and the repo root cache they
+hold) are loaded once and shared by every operation.
+
+Operations are JSON objects:
+
+    {"op": "create-project", "args": ["--name", "Payments", "--json"]}
+    {"op": "generate-document-id", "args": ["--batch"], "stdin": "..."}
+    {"op": "list-projects", "args": ["--json"], "cwd": "/path/to/repo"}
+
+"op" is a script stem in the scripts directory; "args", "stdin" and "cwd"
+are optional. Each result is {"op", "code"} plus "output" (stdout parsed
+as JSON; always a list, one item per line, when the args select a
+JSON-lines mode such as --ndjson or --batch) or "stdout" (when it is not
+JSON), and "stderr" if anything was logged.
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import traceback
+
+# Operation names are plain script stems (no paths)
+SCRIPT_NAME_RE = re.compile(r"^[a-z][a-z-]*$")
+
+# Script flags that switch stdout to one JSON value per line
+JSON_LINES_FLAGS = {"--ndjson", "--batch"}
+
+
+class ScriptRunner:
+    """Executes scripts from `scripts_dir` in this process with captured stdio.
+
+    Scripts mutate process globals (stdin/stdout, argv, cwd, sys.path), so
+    each run restores them afterwards. Compiled script code is cached and
+    recompiled only when the script file changes.
+    """
+
+    def __init__(self, scripts_dir):
+        self.scripts_dir = os.path.abspath(scripts_dir)
+        self.code_cache = {}
+
+    def compile_script(self, path):
+        mtime = os.stat(path).st_mtime_ns
+        cached = self.code_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(path, "r", encoding="utf-8") as f:
+            code = compile(f.read(), path, "exec")
+        self.code_cache[path] = (mtime, code)
+        return code
+
+    def run(self, name, args=(), stdin_text="", cwd=None):
+        """Run one script; returns {"code", "stdout", "stderr"}."""
+        if not SCRIPT_NAME_RE.match(name or ""):
+            return {"code": 1, "stdout": "", "stderr": f"Invalid operation: {name!r}\n"}
+        path = os.path.join(self.scripts_dir, f"{name}.py")
+        if not os.path.isfile(path):
+            return {"code": 1, "stdout": "", "stderr": f"Unknown operation: {name}\n"}
+
+        out, err = io.StringIO(), io.StringIO()
+        saved_stdin, saved_argv, saved_path = sys.stdin, sys.argv, list(sys.path)
+        saved_cwd = os.getcwd()
+        code = 0
+        try:
+            if cwd:
+                os.chdir(cwd)
+            sys.stdin = io.StringIO(stdin_text)
+            sys.argv = [path, *args]
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                try:
+                    exec(self.compile_script(path), {"__name__": "__main__", "__file__": path})
+                except SystemExit as e:
+                    if e.code is None:
+                        code = 0
+                    elif isinstance(e.code, int):
+                        code = e.code
+                    else:
+                        err.write(f"{e.code}\n")
+                        code = 1
+                except Exception:
+                    traceback.print_exc(file=err)
+                    code = 1
+        except OSError as e:
+            err.write(f"{e}\n")
+            code = 1
+        finally:
+            sys.stdin, sys.argv, sys.path[:] = saved_stdin, saved_argv, saved_path
+            os.chdir(saved_cwd)
+        return {"code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def parse_output(stdout, json_lines=False):
+    """Parse script stdout as one JSON value, or with json_lines as a list.
+
+    In JSON-lines mode the result is a list even for zero or one line, so
+    callers never have to guess its shape. Returns None if the output is
+    not JSON.
+    """
+    try:
+        if json_lines:
+            return [json.loads(line) for line in stdout.splitlines() if line.strip()]
+        return json.loads(stdout)
+    except ValueError:
+        return None
+
+
+def parse_op(op):
+    """Validate one operation; returns (name, args, stdin, cwd). Raises ValueError."""
+    if not isinstance(op, dict) or not isinstance(op.get("op"), str):
+        raise ValueError("operation must be an object with an \"op\" name")
+    args = op.get("args", [])
+    if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+        raise ValueError("\"args\" must be a list of strings")
+    stdin_text = op.get("stdin", "")
+    if not isinstance(stdin_text, str):
+        raise ValueError("\"stdin\" must be a string")
+    cwd = op.get("cwd")
+    if cwd is not None and not isinstance(cwd, str):
+        raise ValueError("\"cwd\" must be a string")
+    return op["op"], args, stdin_text, cwd
+
+
+def run_ops(ops, scripts_dir):
+    """Run a list of operations in order; return one result dict per operation."""
+    runner = ScriptRunner(scripts_dir)
+    results = []
+    for op in ops:
+        try:
+            name, args, stdin_text, cwd = parse_op(op)
+        except ValueError as e:
+            results.append({"op": op.get("op") if isinstance(op, dict) else None,
+                            "code": 1, "stderr": f"Invalid operation: {e}\n"})
+            continue
+
+        run = runner.run(name, args, stdin_text, cwd)
+        result = {"op": name, "code": run["code"]}
+        output = parse_output(run["stdout"], json_lines=not JSON_LINES_FLAGS.isdisjoint(args))
+        if output is not None:
+            result["output"] = output
+        else:
+            result["stdout"] = run["stdout"]
+        if run["stderr"]:
+            result["stderr"] = run["stderr"]
+        results.append(result)
+    return results
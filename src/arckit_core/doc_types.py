@@ -0,0 +1,172 @@
+"""
+ArcKit document type codes and ARC filename parsing.
+
+Mirrors arckit-claude/config/doc-types.mjs. ARC filenames follow
+ARC-{PID}-{TYPE}[-{SEQ}]-v{VERSION}.md, e.g. ARC-001-ADR-003-v1.0.md.
+"""
+
+import collections
+import functools
+import re
+
+DOC_TYPES = {
+    # Discovery
+    "REQ":       {"name": "Requirements",                      "category": "Discovery"},
+    "STKE":      {"name": "Stakeholder Analysis",              "category": "Discovery"},
+    "RSCH":      {"name": "Research Findings",                 "category": "Discovery"},
+    "DSCT":      {"name": "Data Source Discovery",             "category": "Discovery"},
+    # Planning
+    "SOBC":      {"name": "Strategic Outline Business Case",   "category": "Planning"},
+    "PLAN":      {"name": "Project Plan",                      "category": "Planning"},
+    "ROAD":      {"name": "Roadmap",                           "category": "Planning"},
+    "STRAT":     {"name": "Architecture Strategy",             "category": "Planning"},
+    "BKLG":      {"name": "Product Backlog",                   "category": "Planning"},
+    # Architecture
+    "PRIN":      {"name": "Architecture Principles",           "category": "Architecture"},
+    "HLDR":      {"name": "High-Level Design Review",          "category": "Architecture"},
+    "DLDR":      {"name": "Detailed Design Review",            "category": "Architecture"},
+    "DATA":      {"name": "Data Model",                        "category": "Architecture"},
+    "WARD":      {"name": "Wardley Map",                       "category": "Architecture"},
+    "DIAG":      {"name": "Architecture Diagrams",             "category": "Architecture"},
+    "DFD":       {"name": "Data Flow Diagram",                 "category": "Architecture"},
+    "ADR":       {"name": "Architecture Decision Records",     "category": "Architecture"},
+    "PLAT":      {"name": "Platform Design",                   "category": "Architecture"},
+    # Governance
+    "RISK":      {"name": "Risk Register",                     "category": "Governance"},
+    "TRAC":      {"name": "Traceability Matrix",               "category": "Governance"},
+    "PRIN-COMP": {"name": "Principles Compliance",             "category": "Governance"},
+    "CONF":      {"name": "Conformance Assessment",            "category": "Governance"},
+    "PRES":      {"name": "Presentation",                      "category": "Reporting"},
+    "ANAL":      {"name": "Analysis Report",                   "category": "Governance"},
+    "GAPS":      {"name": "Gap Analysis",                      "category": "Governance"},
+    # Compliance
+    "TCOP":      {"name": "TCoP Assessment",                   "category": "Compliance"},
+    "SECD":      {"name": "Secure by Design",                  "category": "Compliance"},
+    "SECD-MOD":  {"name": "MOD Secure by Design",              "category": "Compliance"},
+    "AIPB":      {"name": "AI Playbook Assessment",            "category": "Compliance"},
+    "ATRS":      {"name": "ATRS Record",                       "category": "Compliance"},
+    "DPIA":      {"name": "Data Protection Impact Assessment", "category": "Compliance"},
+    "JSP936":    {"name": "JSP 936 Assessment",                "category": "Compliance"},
+    "SVCASS":    {"name": "Service Assessment",                "category": "Compliance"},
+    # Operations
+    "SNOW":      {"name": "ServiceNow Design",                 "category": "Operations"},
+    "DEVOPS":    {"name": "DevOps Strategy",                   "category": "Operations"},
+    "MLOPS":     {"name": "MLOps Strategy",                    "category": "Operations"},
+    "FINOPS":    {"name": "FinOps Strategy",                   "category": "Operations"},
+    "OPS":       {"name": "Operational Readiness",             "category": "Operations"},
+    # Procurement
+    "SOW":       {"name": "Statement of Work",                 "category": "Procurement"},
+    "EVAL":      {"name": "Evaluation Criteria",               "category": "Procurement"},
+    "DOS":       {"name": "DOS Requirements",                  "category": "Procurement"},
+    "GCLD":      {"name": "G-Cloud Search",                    "category": "Procurement"},
+    "GCLC":      {"name": "G-Cloud Clarifications",            "category": "Procurement"},
+    "DMC":       {"name": "Data Mesh Contract",                "category": "Procurement"},
+    "VEND":      {"name": "Vendor Evaluation",                 "category": "Procurement"},
+    # Research
+    "AWRS":      {"name": "AWS Research",                      "category": "Research"},
+    "AZRS":      {"name": "Azure Research",                    "category": "Research"},
+    "GCRS":      {"name": "GCP Research",                      "category": "Research"},
+    # Reporting
+    "STORY":     {"name": "Project Story",                     "category": "Reporting"},
+}
+
+# Set of all valid type codes
+KNOWN_TYPES = set(DOC_TYPES.keys())
+
+# Multi-instance types requiring sequence numbers (ADR-001, DIAG-002, etc.)
+MULTI_INSTANCE_TYPES = {
+    "ADR", "DIAG", "DFD", "WARD", "DMC",
+    "RSCH", "AWRS", "AZRS", "GCRS", "DSCT",
+}
+
+# Type code -> required subdirectory
+SUBDIR_MAP = {
+    "ADR":  "decisions",
+    "DIAG": "diagrams",
+    "DFD":  "diagrams",
+    "WARD": "wardley-maps",
+    "DMC":  "data-contracts",
+    "RSCH": "research",
+    "AWRS": "research",
+    "AZRS": "research",
+    "GCRS": "research",
+    "DSCT": "research",
+}
+
+# Project subdirectories that hold ARC documents (besides the project root),
+# in SUBDIR_MAP declaration order
+ARTIFACT_SUBDIRS = list(dict.fromkeys(SUBDIR_MAP.values())) + ["reviews"]
+
+# Compound types (contain hyphens) -- checked first during extraction
+COMPOUND_TYPES = [k for k in DOC_TYPES if "-" in k]
+
+# Regex for ARC filenames: ARC-NNN-TYPE[-SEQ]-vN.N.md
+ARC_PATTERN = re.compile(r"^ARC-\d{3}-.+-v\d+(\.\d+)?\.md$")
+
+# Known type codes as one alternation, longest first so compound codes
+# (SECD-MOD, PRIN-COMP) win over their prefixes (SECD, PRIN)
+_TYPE_ALTERNATION = "|".join(
+    re.escape(code) for code in sorted(DOC_TYPES, key=len, reverse=True)
+)
+
+# Well-formed ARC filename with a known type: project, type, seq, version
+ARC_FILENAME_RE = re.compile(
+    rf"^ARC-(\d{{3}})-({_TYPE_ALTERNATION})(?:-(\d{{3}}))?-v(\d+(?:\.\d+)?)\.md$"
+)
+
+# Any ARC filename (unknown type codes): project, type[-seq], version
+ARC_GENERIC_RE = re.compile(r"^ARC-(\d{3})-(.+)-v(\d+(?:\.\d+)?)\.md$")
+SEQ_SUFFIX_RE = re.compile(r"-(\d{3})$")
+
+
+ArcFilename = collections.namedtuple("ArcFilename", ["project", "doc_type", "seq", "version"])
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_filename(filename):
+    """Parse an ARC filename in one pass.
+
+    Returns ArcFilename(project, doc_type, seq, version) -- e.g.
+    ARC-001-ADR-003-v1.0.md -> ("001", "ADR", "003", "1.0") -- or None if
+    the name is not an ARC filename. Unknown type codes keep the legacy
+    rules: a compound-type prefix wins, otherwise a trailing -NNN is the
+    sequence number.
+    """
+    m = ARC_FILENAME_RE.match(filename)
+    if m:
+        return ArcFilename(*m.groups())
+    m = ARC_GENERIC_RE.match(filename)
+    if not m:
+        return None
+    project, rest, version = m.groups()
+    for code in COMPOUND_TYPES:
+        if rest.startswith(code):
+            return ArcFilename(project, code, None, version)
+    sm = SEQ_SUFFIX_RE.search(rest)
+    if sm:
+        return ArcFilename(project, rest[:sm.start()], sm.group(1), version)
+    return ArcFilename(project, rest, None, version)
+
+
+def format_arc_filename(parsed):
+    """Inverse of classify_filename: ArcFilename -> canonical filename."""
+    seq = f"-{parsed.seq}" if parsed.seq else ""
+    return f"ARC-{parsed.project}-{parsed.doc_type}{seq}-v{parsed.version}.md"
+
+
+def extract_doc_type(filename):
+    """Extract the document type code from an ARC filename."""
+    parsed = classify_filename(filename)
+    return parsed.doc_type if parsed else None
+
+
+def extract_version(filename):
+    """Extract version string from ARC filename."""
+    m = re.search(r"-v(\d+(?:\.\d+)?)\.md$", filename)
+    return m.group(1) if m else None
+
+
+def doc_type_name(code):
+    """Get display name for a doc type code."""
+    entry = DOC_TYPES.get(code)
+    return entry["name"] if entry else code
@@ -0,0 +1,26 @@
+"""Coloured logging to stderr, shared by all ArcKit scripts."""
+
+import sys
+
+# ANSI color codes
+RED = "\033[0;31m"
+GREEN = "\033[0;32m"
+YELLOW = "\033[1;33m"
+BLUE = "\033[0;34m"
+NC = "\033[0m"  # No Color
+
+
+def log_info(msg):
+    print(f"{BLUE}[INFO]{NC} {msg}", file=sys.stderr)
+
+
+def log_success(msg):
+    print(f"{GREEN}[SUCCESS]{NC} {msg}", file=sys.stderr)
+
+
+def log_warning(msg):
+    print(f"{YELLOW}[WARNING]{NC} {msg}", file=sys.stderr)
+
+
+def log_error(msg):
+    print(f"{RED}[ERROR]{NC} {msg}", file=sys.stderr)
@@ -0,0 +1,23 @@
+"""Shared paths for the ArcKit test suite."""
+
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / "scripts" / "python"
+PLUGIN_SCRIPTS_DIR = REPO_ROOT / "arckit-claude" / "scripts" / "python"
+GEMINI_HOOKS_DIR = REPO_ROOT / "arckit-gemini" / "hooks" / "scripts"
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# Gemini hook modules (hook_utils, hook_socket) import as top-level modules
+if str(GEMINI_HOOKS_DIR) not in sys.path:
+    sys.path.append(str(GEMINI_HOOKS_DIR))
+
+
+def script_env(**extra):
+    """Environment for running scripts in a subprocess: src/ importable, no ARCKIT_* leakage."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("ARCKIT_")}
+    env["PYTHONPATH"] = str(REPO_ROOT / "src")
+    env.update(extra)
+    return env
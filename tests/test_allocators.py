@@ -0,0 +1,191 @@
+"""Project number and document sequence allocation under concurrency."""
+
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from arckit_core.projects import get_next_project_number, read_project_counter, reserve_project_dir
+from arckit_core.repo import find_repo_root, get_state_dir
+
+from conftest import GEMINI_HOOKS_DIR, PLUGIN_SCRIPTS_DIR, SCRIPTS_DIR, script_env
+
+PARALLEL = 8
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Keep plugin-repo state out of the real user cache."""
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    return cache
+
+
+@pytest.fixture
+def cli_repo(tmp_path):
+    repo = tmp_path / "cli-repo"
+    (repo / ".arckit").mkdir(parents=True)
+    (repo / "projects" / "000-global").mkdir(parents=True)
+    return repo
+
+
+@pytest.fixture
+def plugin_repo(tmp_path):
+    repo = tmp_path / "plugin-repo"
+    (repo / "projects" / "000-global").mkdir(parents=True)
+    return repo
+
+
+def run_parallel(commands, cwd, env):
+    """Start every command at once; return their parsed JSON outputs."""
+    procs = [
+        subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for cmd in commands
+    ]
+    outputs = []
+    for proc in procs:
+        out, err = proc.communicate(timeout=60)
+        assert proc.returncode == 0, err
+        outputs.append(out)
+    return outputs
+
+
+def create_projects(scripts_dir, repo, cache):
+    commands = [
+        [sys.executable, str(scripts_dir / "create-project.py"), "--name", f"Project {i}", "--json", "--force"]
+        for i in range(PARALLEL)
+    ]
+    outputs = run_parallel(commands, repo, script_env(XDG_CACHE_HOME=str(cache)))
+    return sorted(json.loads(out)["project_number"] for out in outputs)
+
+
+def test_parallel_create_project_gets_distinct_numbers(cli_repo, cache_home):
+    (cli_repo / "projects" / "004-existing").mkdir()
+    numbers = create_projects(SCRIPTS_DIR, cli_repo, cache_home)
+    assert numbers == [f"{n:03d}" for n in range(5, 5 + PARALLEL)]
+    assert (cli_repo / ".arckit" / "state" / "next-project").is_file()
+    assert get_next_project_number(str(cli_repo)) == f"{5 + PARALLEL:03d}"
+
+
+def test_plugin_repo_keeps_state_out_of_the_repo(plugin_repo, cache_home):
+    numbers = create_projects(PLUGIN_SCRIPTS_DIR, plugin_repo, cache_home)
+    assert numbers == [f"{n:03d}" for n in range(1, 1 + PARALLEL)]
+    assert not (plugin_repo / ".arckit").exists()
+    state_dir = get_state_dir(str(plugin_repo))
+    assert state_dir.startswith(str(cache_home))
+    assert os.path.isfile(os.path.join(state_dir, "next-project"))
+
+
+def test_threads_in_one_process_get_distinct_numbers(cli_repo):
+    with ThreadPoolExecutor(PARALLEL) as pool:
+        results = list(pool.map(lambda i: reserve_project_dir(str(cli_repo), f"p{i}"), range(PARALLEL)))
+    assert sorted(number for number, _ in results) == [f"{n:03d}" for n in range(1, 1 + PARALLEL)]
+    assert all(os.path.isdir(project_dir) for _, project_dir in results)
+
+
+def test_counter_goes_stale_when_projects_change(cli_repo):
+    reserve_project_dir(str(cli_repo), "first")
+    assert read_project_counter(str(cli_repo)) == 2
+    # A project created by hand (e.g. git pull) invalidates the counter
+    (cli_repo / "projects" / "007-manual").mkdir()
+    assert read_project_counter(str(cli_repo)) is None
+    assert reserve_project_dir(str(cli_repo), "next")[0] == "008"
+
+
+def generate_ids(repo, args_list, **env):
+    commands = [[sys.executable, str(SCRIPTS_DIR / "generate-document-id.py"), *args] for args in args_list]
+    return run_parallel(commands, repo, script_env(**env))
+
+
+def test_parallel_next_num_reserves_distinct_sequences(cli_repo):
+    decisions = cli_repo / "projects" / "001-payments" / "decisions"
+    decisions.mkdir(parents=True)
+    (decisions / "ARC-001-ADR-003-v1.0.md").write_text("# ADR\n")
+    outputs = generate_ids(cli_repo, [["001", "ADR", "--next-num", str(decisions)]] * PARALLEL)
+    assert sorted(out.strip() for out in outputs) == [
+        f"ARC-001-ADR-{n:03d}-v1.0" for n in range(4, 4 + PARALLEL)
+    ]
+    assert os.listdir(cli_repo / ".arckit" / "state" / "sequences")
+
+
+def test_batch_reserves_one_block_per_group(cli_repo):
+    (cli_repo / "projects" / "001-payments" / "decisions").mkdir(parents=True)
+    requests = [
+        {"project": "1", "type": "ADR"},
+        {"project": "001", "type": "REQ", "version": "2.0"},
+        {"project": "001", "type": "ADR"},
+        {"project": "001"},
+    ]
+    result = subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / "generate-document-id.py"), "--batch"],
+        input="".join(json.dumps(r) + "\n" for r in requests),
+        cwd=cli_repo, env=script_env(), capture_output=True, text=True,
+    )
+    # Every request gets a result line; the exit status reports the failure
+    assert result.returncode == 1
+    results = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r.get("id") for r in results[:3]] == [
+        "ARC-001-ADR-001-v1.0", "ARC-001-REQ-v2.0", "ARC-001-ADR-002-v1.0",
+    ]
+    assert results[1]["filename"] == "ARC-001-REQ-v2.0.md"
+    assert "error" in results[3]
+
+
+def test_arckit_root_ignored_outside_it(cli_repo, tmp_path, monkeypatch):
+    other = tmp_path / "other-repo"
+    (other / ".arckit").mkdir(parents=True)
+    monkeypatch.setenv("ARCKIT_ROOT", str(other))
+    assert find_repo_root(str(other / "projects")) == str(other)
+    assert find_repo_root(str(cli_repo / "projects")) == str(cli_repo)
+    assert find_repo_root() == str(other)
+
+    # Sequence state follows the directory being numbered, not ARCKIT_ROOT
+    decisions = cli_repo / "projects" / "001-payments" / "decisions"
+    decisions.mkdir(parents=True)
+    generate_ids(cli_repo, [["001", "ADR", "--next-num", str(decisions)]], ARCKIT_ROOT=str(other))
+    assert (cli_repo / ".arckit" / "state" / "sequences").is_dir()
+    assert not (other / ".arckit" / "state").exists()
+
+
+def test_plugin_scripts_find_root_by_projects_marker(plugin_repo, cache_home):
+    (plugin_repo / "projects" / "001-payments" / "decisions").mkdir(parents=True)
+    result = subprocess.run(
+        [sys.executable, str(PLUGIN_SCRIPTS_DIR / "generate-document-id.py"), "--batch"],
+        input='{"project": "1", "type": "ADR"}\n{"project": "1", "type": "ADR"}\n',
+        cwd=plugin_repo / "projects", env=script_env(XDG_CACHE_HOME=str(cache_home)),
+        capture_output=True, text=True, check=True,
+    )
+    ids = [json.loads(line)["id"] for line in result.stdout.splitlines()]
+    assert ids == ["ARC-001-ADR-001-v1.0", "ARC-001-ADR-002-v1.0"]
+    assert not (plugin_repo / ".arckit").exists()
+
+
+@pytest.mark.parametrize("with_arckit_dir", [True, False])
+def test_filename_hook_shares_sequence_reservations(tmp_path, cache_home, with_arckit_dir):
+    """The Gemini hook never renames a write onto a number the script reserved."""
+    repo = tmp_path / "repo"
+    decisions = repo / "projects" / "001-x" / "decisions"
+    decisions.mkdir(parents=True)
+    if with_arckit_dir:
+        (repo / ".arckit").mkdir()
+    scripts_dir = SCRIPTS_DIR if with_arckit_dir else PLUGIN_SCRIPTS_DIR
+    env = script_env(XDG_CACHE_HOME=str(cache_home))
+    reserved = subprocess.run(
+        [sys.executable, str(scripts_dir / "generate-document-id.py"), "001", "ADR", "--next-num", str(decisions)],
+        cwd=repo, env=env, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    assert reserved == "ARC-001-ADR-001-v1.0"
+
+    hook_input = {
+        "tool_name": "write_file",
+        "tool_input": {"file_path": str(repo / "projects" / "001-x" / "ARC-001-ADR-v1.0.md"), "content": "# ADR"},
+        "cwd": str(repo),
+    }
+    result = subprocess.run(
+        [sys.executable, str(GEMINI_HOOKS_DIR / "validate-filename.py")],
+        input=json.dumps(hook_input), cwd=repo, env=env, capture_output=True, text=True, check=True,
+    )
+    assert json.loads(result.stdout)["updatedInput"]["file_path"] == str(decisions / "ARC-001-ADR-002-v1.0.md")
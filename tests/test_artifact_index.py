@@ -0,0 +1,117 @@
+"""Gemini artifact index: mtime revalidation and per-project rescans."""
+
+import json
+import os
+
+import pytest
+
+import hook_utils
+
+
+def touch_dir(path):
+    """Move a directory's mtime forward (coarse clocks may not tick between writes)."""
+    later = os.stat(path).st_mtime_ns + 10**9
+    os.utime(path, ns=(later, later))
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(hook_utils, "_index_memo", {})
+    payments = tmp_path / "projects" / "001-payments"
+    for sub in ("decisions", "reviews", "diagrams", "research"):
+        (payments / sub).mkdir(parents=True)
+    (payments / "ARC-001-REQ-v1.0.md").write_text("")
+    (payments / "reviews" / "ARC-001-HLDR-v1.0.md").write_text("")
+    (payments / "research" / "ARC-001-RSCH-001-v1.0.md").write_text("")
+    (payments / "diagrams" / "ARC-001-DIAG-001-v1.0.md").write_text("")
+    (payments / "decisions" / "ARC-001-ADR-001-v1.0.md").write_text("")
+    (payments / "decisions" / "ARC-001-NOTES.md").write_text("")
+    (tmp_path / "projects" / "002-ledger").mkdir()
+    return str(tmp_path)
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Record which projects load_artifact_index rescans."""
+    scanned = []
+    real_scan = hook_utils.scan_project
+
+    def scan(project_dir):
+        scanned.append(os.path.basename(project_dir))
+        return real_scan(project_dir)
+
+    monkeypatch.setattr(hook_utils, "scan_project", scan)
+    return scanned
+
+
+def test_first_load_scans_in_subdir_order_and_persists(repo, scans):
+    index = hook_utils.load_artifact_index(repo)
+    assert index["names"] == ["001-payments", "002-ledger"]
+    artifacts = index["projects"]["001-payments"]["artifacts"]
+    assert [(a["path"], a["type"]) for a in artifacts] == [
+        ("ARC-001-REQ-v1.0.md", "REQ"),
+        ("decisions/ARC-001-ADR-001-v1.0.md", "ADR"),
+        ("decisions/ARC-001-NOTES.md", "ARC-001-NOTES.md"),
+        ("diagrams/ARC-001-DIAG-001-v1.0.md", "DIAG"),
+        ("research/ARC-001-RSCH-001-v1.0.md", "RSCH"),
+        ("reviews/ARC-001-HLDR-v1.0.md", "HLDR"),
+    ]
+    with open(hook_utils.cache_path(repo, hook_utils.INDEX_NAME), encoding="utf-8") as f:
+        assert json.load(f)["projects"] == index["projects"]
+    assert sorted(scans) == ["001-payments", "002-ledger"]
+
+
+def test_unchanged_projects_are_not_rescanned(repo, scans):
+    hook_utils.load_artifact_index(repo)
+    scans.clear()
+    hook_utils._index_memo.clear()  # a new hook process reads the cache file
+    hook_utils.load_artifact_index(repo)
+    assert scans == []
+
+
+def test_only_the_changed_project_is_rescanned(repo, scans):
+    hook_utils.load_artifact_index(repo)
+    scans.clear()
+    decisions = os.path.join(repo, "projects", "001-payments", "decisions")
+    open(os.path.join(decisions, "ARC-001-ADR-002-v1.0.md"), "w").close()
+    touch_dir(decisions)
+
+    index = hook_utils.load_artifact_index(repo)
+    assert scans == ["001-payments"]
+    paths = [a["path"] for a in index["projects"]["001-payments"]["artifacts"]]
+    assert "decisions/ARC-001-ADR-002-v1.0.md" in paths
+
+
+def test_new_project_is_picked_up(repo, scans):
+    hook_utils.load_artifact_index(repo)
+    scans.clear()
+    projects = os.path.join(repo, "projects")
+    os.mkdir(os.path.join(projects, "003-identity"))
+    touch_dir(projects)
+
+    index = hook_utils.load_artifact_index(repo)
+    assert index["names"] == ["001-payments", "002-ledger", "003-identity"]
+    assert scans == ["003-identity"]
+
+
+def test_only_limits_revalidation(repo, scans):
+    hook_utils.load_artifact_index(repo)
+    scans.clear()
+    for name in ("001-payments", "002-ledger"):
+        touch_dir(os.path.join(repo, "projects", name))
+    hook_utils.load_artifact_index(repo, only={"002-ledger"})
+    assert scans == ["002-ledger"]
+
+
+def test_older_index_version_is_rebuilt(repo, scans):
+    hook_utils.load_artifact_index(repo)
+    path = hook_utils.cache_path(repo, hook_utils.INDEX_NAME)
+    with open(path, encoding="utf-8") as f:
+        stale = json.load(f)
+    stale["version"] = hook_utils.INDEX_VERSION - 1
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(stale, f)
+    hook_utils._index_memo.clear()
+    scans.clear()
+    assert hook_utils.load_artifact_index(repo)["version"] == hook_utils.INDEX_VERSION
+    assert sorted(scans) == ["001-payments", "002-ledger"]
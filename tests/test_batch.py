@@ -0,0 +1,56 @@
+"""arckit batch: scripts run in one process, output parsed by mode."""
+
+import os
+
+import pytest
+
+from arckit_core.batch import parse_output, run_ops
+
+from conftest import SCRIPTS_DIR
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    for name in list(os.environ):
+        if name.startswith("ARCKIT_"):
+            monkeypatch.delenv(name)
+    (tmp_path / ".arckit").mkdir()
+    (tmp_path / "projects" / "000-global").mkdir(parents=True)
+    return tmp_path
+
+
+def test_parse_output_modes():
+    assert parse_output('{"a": 1}\n') == {"a": 1}
+    assert parse_output('{"a": 1}\n{"a": 2}\n') is None
+    assert parse_output("ARC-001-REQ-v1.0\n") is None
+    assert parse_output('{"a": 1}\n', json_lines=True) == [{"a": 1}]
+    assert parse_output("", json_lines=True) == []
+    assert parse_output('{"a": 1}\nnot json\n', json_lines=True) is None
+
+
+def test_run_ops_shares_one_process(repo):
+    ops = [
+        {"op": "create-project", "args": ["--name", "Payments", "--json", "--force"], "cwd": str(repo)},
+        {"op": "generate-document-id", "args": ["001", "REQ"], "cwd": str(repo)},
+        {"op": "generate-document-id", "args": ["--batch"], "cwd": str(repo),
+         "stdin": '{"project": "001", "type": "ADR"}\n'},
+        {"op": "list-projects", "args": ["--ndjson"], "cwd": str(repo)},
+        {"op": "list-projects", "args": ["--json"], "cwd": str(repo)},
+    ]
+    created, single_id, batch, ndjson, listing = run_ops(ops, SCRIPTS_DIR)
+
+    assert created["code"] == 0 and created["output"]["project_number"] == "001"
+    assert single_id == {"op": "generate-document-id", "code": 0, "stdout": "ARC-001-REQ-v1.0\n"}
+    # JSON-lines modes are lists even with a single line
+    assert batch["output"] == [{"id": "ARC-001-ADR-001-v1.0", "filename": "ARC-001-ADR-001-v1.0.md"}]
+    assert [p["number"] for p in ndjson["output"]] == ["000", "001"]
+    assert listing["output"]["project_count"] == 2
+
+
+def test_run_ops_reports_bad_operations(repo):
+    results = run_ops([{"op": "../evil"}, {"op": "no-such-script"}, {"args": []},
+                       {"op": "list-projects", "args": "--json"}], SCRIPTS_DIR)
+    assert [r["code"] for r in results] == [1, 1, 1, 1]
+    assert "Invalid operation" in results[0]["stderr"]
+    assert "Unknown operation" in results[1]["stderr"]
+    assert "must be a list" in results[3]["stderr"]
@@ -0,0 +1,38 @@
+"""Importing arckit_cli stays cheap: no network stack until it is needed."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import script_env
+
+pytest.importorskip("typer")
+pytest.importorskip("rich")
+
+# Generous: a regression here is the network stack (hundreds of ms), not noise
+IMPORT_BUDGET_US = 1_500_000
+
+DEFERRED_MODULES = ["httpx", "truststore", "ssl", "platformdirs", "readchar"]
+
+
+def test_import_does_not_load_network_stack():
+    code = (
+        "import json, sys; import arckit_cli; "
+        f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=script_env(), capture_output=True, text=True, check=True,
+    )
+    assert json.loads(result.stdout) == []
+
+    # "import time: self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        _, _, fields = line.partition("import time:")
+        parts = fields.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            cumulative[parts[2].strip()] = int(parts[1])
+    assert cumulative["arckit_cli"] < IMPORT_BUDGET_US
@@ -0,0 +1,34 @@
+"""The vendored arckit_core copies stay identical to src/arckit_core."""
+
+import shutil
+import subprocess
+import sys
+
+from conftest import REPO_ROOT
+
+CHECK = REPO_ROOT / "scripts" / "check-core-sync.py"
+
+
+def run_check(*args):
+    return subprocess.run([sys.executable, str(CHECK), *args], capture_output=True, text=True)
+
+
+def test_vendored_copies_match_source():
+    result = run_check()
+    assert result.returncode == 0, result.stderr
+
+
+def test_drift_is_reported_and_fixed(tmp_path):
+    shutil.copytree(REPO_ROOT / "src" / "arckit_core", tmp_path / "src" / "arckit_core")
+    copy = tmp_path / "arckit-claude" / "scripts" / "python" / "arckit_core"
+    shutil.copytree(tmp_path / "src" / "arckit_core", copy)
+    (copy / "repo.py").write_text("# edited by hand\n")
+    (copy / "stale.py").write_text("")
+
+    result = run_check("--root", str(tmp_path))
+    assert result.returncode == 1
+    assert "repo.py, stale.py" in result.stderr
+
+    assert run_check("--root", str(tmp_path), "--fix").returncode == 0
+    assert not (copy / "stale.py").exists()
+    assert run_check("--root", str(tmp_path)).returncode == 0
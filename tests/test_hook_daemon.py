@@ -0,0 +1,151 @@
+"""Gemini hook client/daemon: socket trust, environment isolation, restarts."""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import GEMINI_HOOKS_DIR, script_env
+
+import hook_socket
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+
+@pytest.fixture
+def hooks_dir(tmp_path):
+    """Private copy of the hook scripts, so tests can change them."""
+    target = tmp_path / "hooks"
+    shutil.copytree(GEMINI_HOOKS_DIR, target, ignore=shutil.ignore_patterns("__pycache__"))
+    return target
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    project = tmp_path / "repo" / "projects" / "001-payments"
+    project.mkdir(parents=True)
+    (project / "ARC-001-REQ-v1.0.md").write_text("# Requirements\n")
+    other = tmp_path / "repo" / "projects" / "002-ledger"
+    other.mkdir()
+    (other / "ARC-002-REQ-v1.0.md").write_text("# Requirements\n")
+    runtime_dir = tmp_path / "run"
+    runtime_dir.mkdir(mode=0o700)
+    return tmp_path / "repo", runtime_dir
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def start_daemon(hooks_dir, runtime_dir, **env):
+    proc = subprocess.Popen(
+        [sys.executable, str(hooks_dir / "hook-daemon.py"), "--idle-timeout", "60"],
+        env=script_env(XDG_RUNTIME_DIR=str(runtime_dir), **env),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    sock = runtime_dir / "arckit-hooks.sock"
+    assert wait_for(sock.exists), proc.stderr.read().decode() if proc.poll() is not None else ""
+    return proc
+
+
+def run_client(hooks_dir, repo, runtime_dir, prompt="/arckit:adr 001", **env):
+    """Run context-inject through the client; returns (context text, ran in-process)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(hooks_dir / "hook-client.py"), "context-inject"],
+        input=json.dumps({"prompt": prompt, "cwd": str(repo)}),
+        env=script_env(XDG_RUNTIME_DIR=str(runtime_dir), **env),
+        capture_output=True, text=True, cwd=repo, check=True,
+    )
+    context = json.loads(result.stdout)["hookSpecificOutput"]["additionalContext"]
+    return context, "hook_utils" in result.stderr
+
+
+@pytest.fixture
+def daemons():
+    procs = []
+    yield procs
+    for proc in procs:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait(5)
+
+
+def test_client_uses_trusted_daemon(hooks_dir, workspace, daemons):
+    repo, runtime_dir = workspace
+    daemons.append(start_daemon(hooks_dir, runtime_dir))
+    context, in_process = run_client(hooks_dir, repo, runtime_dir)
+    assert "001-payments" in context
+    assert not in_process
+
+
+def test_client_ignores_socket_in_shared_directory(hooks_dir, workspace, daemons):
+    repo, runtime_dir = workspace
+    daemons.append(start_daemon(hooks_dir, runtime_dir))
+    os.chmod(runtime_dir, 0o777)
+    try:
+        assert not hook_socket.is_trusted_socket(str(runtime_dir / "arckit-hooks.sock"))
+        _, in_process = run_client(hooks_dir, repo, runtime_dir)
+        assert in_process
+    finally:
+        os.chmod(runtime_dir, 0o700)
+
+
+def test_daemon_refuses_shared_socket_directory(hooks_dir, tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o777)
+    result = subprocess.run(
+        [sys.executable, str(hooks_dir / "hook-daemon.py"), "--socket", str(shared / "hooks.sock")],
+        env=script_env(), capture_output=True, text=True, timeout=10,
+    )
+    assert result.returncode == 1
+    assert not (shared / "hooks.sock").exists()
+
+
+def test_daemon_environment_does_not_leak_into_requests(hooks_dir, workspace, daemons):
+    repo, runtime_dir = workspace
+    daemons.append(start_daemon(hooks_dir, runtime_dir, ARCKIT_CONTEXT_SCOPE="all"))
+    scoped, in_process = run_client(hooks_dir, repo, runtime_dir)
+    assert not in_process
+    assert "Context scoped to **001-payments**" in scoped
+    unscoped, _ = run_client(hooks_dir, repo, runtime_dir, ARCKIT_CONTEXT_SCOPE="all")
+    assert "Context scoped" not in unscoped
+
+
+def test_changed_hook_code_restarts_daemon(hooks_dir, workspace, daemons):
+    repo, runtime_dir = workspace
+    old = start_daemon(hooks_dir, runtime_dir)
+    daemons.append(old)
+    socket_file = runtime_dir / "arckit-hooks.sock"
+    old_inode = socket_file.stat().st_ino
+
+    # Simulate an extension upgrade: the hook code changes under the daemon
+    helper = hooks_dir / "hook_utils.py"
+    os.utime(helper, ns=(helper.stat().st_atime_ns, helper.stat().st_mtime_ns + 10**9))
+
+    # The stale daemon exits without running the request; the client runs
+    # it in-process and starts a fresh daemon
+    context, in_process = run_client(hooks_dir, repo, runtime_dir)
+    assert in_process and "001-payments" in context
+    assert old.wait(5) == 0
+    assert wait_for(lambda: socket_file.exists() and socket_file.stat().st_ino != old_inode)
+    _, in_process = run_client(hooks_dir, repo, runtime_dir)
+    assert not in_process
+
+    # Stop the daemon the client started (it is not a child of this test)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_file))
+        sock.sendall(b'{"hook": "context-inject", "fingerprint": "stop"}\n')
+        assert json.loads(sock.makefile().readline()) == {"restart": True}
+    assert wait_for(lambda: not socket_file.exists())
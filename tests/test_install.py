@@ -0,0 +1,164 @@
+"""arckit init/upgrade install engine: link modes, upgrade diffs, stale files."""
+
+import importlib.util
+import os
+
+import pytest
+
+from conftest import REPO_ROOT
+
+# Loaded by path: importing the arckit_cli package pulls in typer and rich
+_spec = importlib.util.spec_from_file_location("arckit_install", REPO_ROOT / "src" / "arckit_cli" / "install.py")
+install = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(install)
+
+
+@pytest.fixture
+def assets(tmp_path):
+    src = tmp_path / "assets"
+    (src / "templates").mkdir(parents=True)
+    (src / "scripts" / "__pycache__").mkdir(parents=True)
+    (src / "templates" / "adr.md").write_text("# ADR\n")
+    (src / "templates" / "req.md").write_text("# Requirements\n")
+    (src / "scripts" / "common.py").write_text("print('hi')\n")
+    (src / "scripts" / "__pycache__" / "common.pyc").write_bytes(b"\0")
+    return src
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    path = tmp_path / "workspace"
+    path.mkdir()
+    return path
+
+
+def full_plan(assets, workspace):
+    plan = install.CopyPlan()
+    plan.add_glob(assets / "templates", "*.md", workspace / ".arckit" / "templates")
+    plan.add_tree(assets / "scripts", workspace / ".arckit" / "scripts", ignore=["__pycache__"])
+    return plan
+
+
+def rel_files(plan, workspace):
+    return sorted(os.path.relpath(dst, workspace) for dst in plan.files)
+
+
+def test_plan_is_pure_and_execute_creates_dirs(assets, workspace):
+    plan = full_plan(assets, workspace)
+    assert rel_files(plan, workspace) == [
+        ".arckit/scripts/common.py", ".arckit/templates/adr.md", ".arckit/templates/req.md",
+    ]
+    assert os.listdir(workspace) == []
+
+    copied = []
+    install.execute_plan(plan, jobs=4, on_copied=lambda size, method: copied.append(method))
+    assert copied == ["copy"] * 3
+    assert (workspace / ".arckit" / "templates" / "adr.md").read_text() == "# ADR\n"
+
+
+@pytest.mark.parametrize("mode", ["copy", "hardlink", "symlink", "reflink"])
+def test_link_modes(assets, workspace, mode):
+    src = assets / "templates" / "adr.md"
+    dst = workspace / "adr.md"
+    method = install.install_file(str(src), str(dst), mode)
+    assert dst.read_text() == "# ADR\n"
+    if mode == "reflink":
+        assert method in ("reflink", "copy")  # copy where the filesystem cannot clone
+    else:
+        assert method == mode
+    assert os.path.islink(dst) == (mode == "symlink")
+    assert os.path.samefile(src, dst) == (mode in ("hardlink", "symlink"))
+
+
+def test_reinstall_replaces_link_instead_of_writing_through(assets, workspace):
+    src = assets / "templates" / "adr.md"
+    dst = workspace / "adr.md"
+    install.install_file(str(src), str(dst), "hardlink")
+    install.install_file(str(assets / "templates" / "req.md"), str(dst), "copy")
+    assert src.read_text() == "# ADR\n"
+    assert dst.read_text() == "# Requirements\n"
+
+
+def test_cross_device_link_falls_back_to_copy(assets, workspace, monkeypatch):
+    def cross_device(src, dst):
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr(install.os, "link", cross_device)
+    dst = workspace / "adr.md"
+    assert install.install_file(str(assets / "templates" / "adr.md"), str(dst), "hardlink") == "copy"
+    assert dst.read_text() == "# ADR\n" and not os.path.islink(dst)
+
+
+def installed(assets, workspace):
+    """Install everything and record the manifest, as arckit init does."""
+    plan = full_plan(assets, workspace)
+    install.execute_plan(plan)
+    install.save_install_manifest(workspace, install.manifest_entries(plan, workspace), {"ai": "codex"})
+    return install.load_install_manifest(workspace)["files"]
+
+
+def test_upgrade_with_no_changes_does_nothing(assets, workspace):
+    previous = installed(assets, workspace)
+    changes, entries, summary = install.plan_upgrade(full_plan(assets, workspace), workspace, previous)
+    assert len(changes) == 0
+    assert summary == {"added": 0, "updated": 0, "unchanged": 3, "stale": [], "kept": [], "edited": []}
+    assert entries == previous
+
+
+def test_upgrade_copies_new_changed_and_deleted_files(assets, workspace):
+    previous = installed(assets, workspace)
+    (assets / "templates" / "adr.md").write_text("# ADR v2\n")
+    (assets / "templates" / "risk.md").write_text("# Risk\n")
+    (workspace / ".arckit" / "scripts" / "common.py").unlink()
+
+    changes, _, summary = install.plan_upgrade(full_plan(assets, workspace), workspace, previous)
+    assert rel_files(changes, workspace) == [
+        ".arckit/scripts/common.py", ".arckit/templates/adr.md", ".arckit/templates/risk.md",
+    ]
+    assert (summary["added"], summary["updated"], summary["unchanged"]) == (1, 2, 1)
+
+    install.execute_plan(changes)
+    assert (workspace / ".arckit" / "templates" / "adr.md").read_text() == "# ADR v2\n"
+    assert (workspace / ".arckit" / "scripts" / "common.py").exists()
+
+
+def test_stale_files_removed_unless_edited_or_preserved(assets, workspace):
+    previous = installed(assets, workspace)
+    custom = workspace / ".arckit" / "templates-custom" / "adr.md"
+    custom.parent.mkdir(parents=True)
+    custom.write_text("mine\n")
+    previous[".arckit/templates-custom/adr.md"] = install.source_entry(str(custom))
+
+    (assets / "scripts" / "common.py").unlink()
+    (assets / "templates" / "req.md").unlink()
+    (workspace / ".arckit" / "templates" / "req.md").write_text("# Requirements, edited\n")
+
+    _, entries, summary = install.plan_upgrade(full_plan(assets, workspace), workspace, previous)
+    assert summary["stale"] == [".arckit/scripts/common.py"]
+    assert summary["kept"] == [".arckit/templates/req.md"]
+    assert entries[".arckit/templates/req.md"] == previous[".arckit/templates/req.md"]
+
+    removed, kept = install.remove_stale_files(workspace, summary["stale"], previous)
+    assert removed == [".arckit/scripts/common.py"]
+    assert kept == []
+    assert not (workspace / ".arckit" / "scripts").exists()  # emptied directory removed
+    assert (workspace / ".arckit" / "templates" / "req.md").exists()
+    assert custom.exists()
+
+
+def test_upgrade_does_not_overwrite_local_edits(assets, workspace):
+    previous = installed(assets, workspace)
+    edited = workspace / ".arckit" / "templates" / "adr.md"
+    edited.write_text("# ADR, our house style\n")
+    (assets / "templates" / "adr.md").write_text("# ADR v2\n")
+    (assets / "templates" / "req.md").write_text("# Requirements v2\n")
+
+    changes, entries, summary = install.plan_upgrade(full_plan(assets, workspace), workspace, previous)
+    assert rel_files(changes, workspace) == [".arckit/templates/req.md"]
+    assert summary["edited"] == [".arckit/templates/adr.md"]
+    assert (summary["updated"], summary["unchanged"]) == (1, 1)
+    # The recorded hash is kept, so the file is still recognised as edited later
+    assert entries[".arckit/templates/adr.md"] == previous[".arckit/templates/adr.md"]
+
+    install.execute_plan(changes)
+    assert edited.read_text() == "# ADR, our house style\n"
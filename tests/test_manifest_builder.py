@@ -0,0 +1,159 @@
+"""Gemini manifest_builder: full rebuilds match the Node pages hook."""
+
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import manifest_builder
+from conftest import FIXTURES_DIR, REPO_ROOT
+
+SYNC_GUIDES = REPO_ROOT / "arckit-claude" / "hooks" / "sync-guides.mjs"
+EXPECTED_MANIFEST = FIXTURES_DIR / "manifest-expected.json"
+
+SCORES = {
+    "lastUpdated": "2026-03-01",
+    "criteria": [
+        {"id": "C1", "category": "Functional", "weight": 0.4},
+        {"id": "C2", "category": "Functional", "weight": 0.2},
+        {"id": "C3", "category": "Commercial", "weight": 0.4},
+    ],
+    "vendors": {
+        "globex": {
+            "displayName": "Globex Ltd",
+            "totalWeighted": 3.1,
+            "totalRaw": 10,
+            "maxPossible": 15,
+            "scores": [{"criterionId": "C1", "score": 4}, {"criterionId": "C3", "score": 2}],
+        },
+        "acme-corp": {
+            "totalWeighted": 4.25,
+            "totalRaw": 13,
+            "maxPossible": 15,
+            "scores": [
+                {"criterionId": "C1", "score": 5},
+                {"criterionId": "C2", "score": 4},
+                {"criterionId": "C3", "score": 4},
+            ],
+        },
+    },
+}
+
+# Relative path -> content, written as raw UTF-8 so CRLF survives
+FIXTURE_FILES = {
+    ".git/config": '[remote "origin"]\n\turl = https://github.com/example-org/fixture-repo.git\n',
+    ".arckit/guides-custom/räumliche-daten.md": "# Räumliche Daten — Community Guide\r\n\r\nBody.\r\n",
+    ".arckit/guides-custom/notes.txt": "# Not a guide\n",
+    "projects/000-global/ARC-000-PRIN-v1.0.md": (
+        "# Architecture Principles\n\n"
+        "| **Document ID** | ARC-000-PRIN-v1.0 |\n"
+        "| **Status** | APPROVED |\n"
+        "| **Created Date** | 2026-01-05 |\n"
+    ),
+    "projects/000-global/external/estate.png": "",
+    "projects/000-global/policies/README.md": "# Policies\n",
+    "projects/001-café-payments/ARC-001-REQ-v1.0.md": (
+        "# Requirements: Café Payments\r\n\r\n"
+        "| **Document Title** | Café Payments Requirements |\r\n"
+        "| **Status** | DRAFT |\r\n"
+        "| **Created Date** | 2026-02-01 |\r\n"
+        "| **Last Modified** | 2026-02-14 |\r\n\r\n"
+        "Follows ARC-000-PRIN-v1.0.md; see ARC-001-ADR-001 and ARC-001-ADR-001-v1.0.md.\r\n"
+    ),
+    "projects/001-café-payments/ARC-001-STKE-v1.0.md": (
+        "| **Document Title** | Stakeholders — Zürich |\n| **Status** | IN_REVIEW |\n"
+        "Drivers from ARC-001-REQ.\n"
+    ),
+    "projects/001-café-payments/decisions/ARC-001-ADR-001-v1.0.md": (
+        "# ADR-001: Choix de la base de données\r\n\r\n| **Status** | ACCEPTED |\r\n"
+        "Satisfies ARC-001-REQ-v1.0 and ARC-000-PRIN.\r\n"
+    ),
+    "projects/001-café-payments/decisions/ARC-001-ADR-002-v1.1.md": "",
+    "projects/001-café-payments/vendors/acme-corp/proposal.md": "# Acme Proposal\n",
+    "projects/001-café-payments/vendors/acme-corp/README.md": "# Acme\n",
+    "projects/001-café-payments/vendors/acme-corp/reviews/ARC-001-VEND-ACME-v1.0.md": (
+        "# Acme Review\n\nAgainst ARC-001-REQ-v1.0.md.\n"
+    ),
+    "projects/001-café-payments/vendors/globex-aws-profile.md": "# Globex\n",
+    "projects/001-café-payments/vendors/scores.json": json.dumps(SCORES, indent=2),
+    "projects/001-café-payments/tech-notes/kafka-partitions.md": "",
+    "projects/001-café-payments/tech-notes/event-store.md": "# Event Store Notes\n",
+    "projects/001-café-payments/external/rfp.pdf": "",
+    "projects/002-ledger/ARC-002-REQ-v2.0.md": "# Ledger Requirements\n\nReuses ARC-001-REQ.\n",
+    "projects/002-ledger/diagrams/ARC-002-DIAG-001-v1.0.md": (
+        "# Context Diagram\n\nFrom ARC-002-REQ-v2.0.md and ARC-001-ADR-001.\n"
+    ),
+    "projects/002-ledger/vendors/scores.json": "{not json",
+    "projects/notes/ARC-999-REQ-v1.0.md": "# Not a numbered project\n",
+}
+
+# Guides as shipped by the plugin and synced into docs/guides/
+GUIDE_FILES = {
+    "adr.md": "# Architecture Decision Records\n",
+    "start.md": "\ufeff# Getting Started\r\n",
+    "zz-unlisted.md": "# Unlisted Guide\n",
+    "roles/README.md": "# Roles\n",
+    "roles/enterprise-architect.md": "# Enterprise Architect — ArcKit Command Guide\n",
+    "roles/data-architect.md": "# Data Architect - ArcKit Command Guide\r\n",
+    "uk-government/gds.md": "# GDS Service Standard\n",
+}
+
+
+def write_files(root, files):
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content.encode("utf-8"))
+
+
+@pytest.fixture
+def fixture_repo(tmp_path):
+    repo = tmp_path / "repo"
+    write_files(repo, FIXTURE_FILES)
+    write_files(repo / "docs" / "guides", GUIDE_FILES)
+    return repo
+
+
+def build(repo):
+    guide_titles = manifest_builder.collect_guide_titles(str(repo / "docs" / "guides"), str(repo))
+    return manifest_builder.build_manifest(str(repo), guide_titles)
+
+
+def test_manifest_matches_expected(fixture_repo):
+    manifest = build(fixture_repo)
+    manifest["generated"] = "<generated>"
+    with open(EXPECTED_MANIFEST, encoding="utf-8") as f:
+        expected = json.load(f)
+    assert json.dumps(manifest, indent=2, ensure_ascii=False) == json.dumps(expected, indent=2, ensure_ascii=False)
+
+
+def test_job_count_does_not_change_the_manifest(fixture_repo):
+    guide_titles = manifest_builder.collect_guide_titles(str(fixture_repo / "docs" / "guides"), str(fixture_repo))
+    serial = manifest_builder.build_manifest(str(fixture_repo), guide_titles, jobs=1)
+    parallel = manifest_builder.build_manifest(str(fixture_repo), guide_titles, jobs=8)
+    serial.pop("generated")
+    parallel.pop("generated")
+    assert serial == parallel
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_manifest_is_byte_identical_to_node_hook(fixture_repo, tmp_path):
+    # The Node hook syncs guides from the plugin root before building, so
+    # give it the fixture guides and an empty docs/ in a copy of the repo
+    node_repo = tmp_path / "node-repo"
+    write_files(node_repo, FIXTURE_FILES)
+    plugin_root = tmp_path / "plugin"
+    write_files(plugin_root / "docs" / "guides", GUIDE_FILES)
+    subprocess.run(
+        ["node", str(SYNC_GUIDES)],
+        input=json.dumps({"prompt": "/arckit:pages", "cwd": str(node_repo)}),
+        env={"PATH": os.environ["PATH"], "CLAUDE_PLUGIN_ROOT": str(plugin_root)},
+        capture_output=True, text=True, check=True, timeout=60,
+    )
+    node_manifest = (node_repo / "docs" / "manifest.json").read_text(encoding="utf-8")
+    generated = json.loads(node_manifest)["generated"]
+
+    manifest_builder.write_manifest(str(fixture_repo), {**build(fixture_repo), "generated": generated})
+    assert (fixture_repo / "docs" / "manifest.json").read_text(encoding="utf-8") == node_manifest
@@ -0,0 +1,142 @@
+"""ManifestStore: locked upserts, journal appends, replay and compaction."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from arckit_core import manifest as store_mod
+from arckit_core.manifest import (
+    ManifestStore, append_journal, compact, discard_journal, journal_path, record_update,
+)
+
+from conftest import GEMINI_HOOKS_DIR, script_env
+
+
+def entry(doc_id, title="Requirements"):
+    return {"path": f"projects/001-payments/{doc_id}.md", "title": title, "documentId": doc_id}
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (tmp_path / "projects" / "001-payments").mkdir(parents=True)
+    path = docs / "manifest.json"
+    path.write_text(json.dumps({"projects": [], "global": []}))
+    return str(path)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def documents(path):
+    projects = load(path)["projects"]
+    return [d["documentId"] for p in projects for d in p.get("documents", [])]
+
+
+def test_upsert_replaces_by_base_id(manifest_path):
+    with ManifestStore(manifest_path) as store:
+        store.upsert("001-payments", "documents", entry("ARC-001-REQ-v1.0"))
+        store.upsert("001-payments", "documents", entry("ARC-001-REQ-v1.1"))
+        store.upsert("001-payments", "documents", entry("ARC-001-RISK-v1.0"))
+    assert documents(manifest_path) == ["ARC-001-REQ-v1.1", "ARC-001-RISK-v1.0"]
+
+
+def test_large_manifest_journals_then_replays(manifest_path, monkeypatch):
+    monkeypatch.setattr(store_mod, "JOURNAL_MANIFEST_BYTES", 0)
+    before = open(manifest_path).read()
+    record_update(manifest_path, "001-payments", "documents", entry("ARC-001-REQ-v1.0"))
+    record_update(manifest_path, "001-payments", "documents", entry("ARC-001-REQ-v2.0"))
+
+    # Appended to the journal, manifest.json untouched
+    assert open(manifest_path).read() == before
+    assert len(open(journal_path(manifest_path)).readlines()) == 2
+
+    # Opening a store folds the journal in and removes it
+    with ManifestStore(manifest_path) as store:
+        assert store.journaled
+    assert documents(manifest_path) == ["ARC-001-REQ-v2.0"]
+    assert not os.path.exists(journal_path(manifest_path))
+
+
+def test_journal_compacts_past_threshold(manifest_path, monkeypatch):
+    monkeypatch.setattr(store_mod, "JOURNAL_MANIFEST_BYTES", 0)
+    monkeypatch.setattr(store_mod, "COMPACT_JOURNAL_BYTES", 400)
+    for n in range(1, 6):
+        record_update(manifest_path, "001-payments", "documents", entry(f"ARC-001-ADR-00{n}-v1.0"))
+    # At least one compaction ran: some records are already in manifest.json
+    # and the journal holds only what came after it
+    assert documents(manifest_path)
+    compact(manifest_path)
+    assert documents(manifest_path) == [f"ARC-001-ADR-00{n}-v1.0" for n in range(1, 6)]
+    assert not compact(manifest_path)
+
+
+def test_torn_journal_line_is_skipped(manifest_path):
+    append_journal(manifest_path, "001-payments", "documents", entry("ARC-001-REQ-v1.0"))
+    with open(journal_path(manifest_path), "a", encoding="utf-8") as f:
+        f.write('{"project": "001-payments", "key": "docu')
+    assert compact(manifest_path)
+    assert documents(manifest_path) == ["ARC-001-REQ-v1.0"]
+
+
+def test_records_older_than_manifest_are_not_replayed(manifest_path):
+    append_journal(manifest_path, "001-payments", "documents", entry("ARC-001-REQ-v1.0", "Stale"))
+    # A full rewrite (e.g. /arckit:pages) that left the journal behind
+    fresh = {"projects": [{"id": "001-payments", "documents": [entry("ARC-001-REQ-v3.0")]}]}
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(fresh, f)
+    future = os.stat(manifest_path).st_mtime_ns + 10**9
+    os.utime(manifest_path, ns=(future, future))
+
+    append_journal(manifest_path, "001-payments", "documents", entry("ARC-001-RISK-v1.0"))
+    records = [json.loads(line) for line in open(journal_path(manifest_path))]
+    records[1]["time_ns"] = future + 1
+    with open(journal_path(manifest_path), "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(r) + "\n" for r in records)
+
+    compact(manifest_path)
+    assert documents(manifest_path) == ["ARC-001-REQ-v3.0", "ARC-001-RISK-v1.0"]
+
+
+def test_discard_journal(manifest_path):
+    append_journal(manifest_path, "001-payments", "documents", entry("ARC-001-REQ-v1.0"))
+    discard_journal(manifest_path)
+    discard_journal(manifest_path)
+    assert not os.path.exists(journal_path(manifest_path))
+
+
+def test_writing_manifest_json_discards_journal(manifest_path):
+    """The AfterTool hook drops the journal when /arckit:pages rewrites the manifest."""
+    repo = os.path.dirname(os.path.dirname(manifest_path))
+    append_journal(manifest_path, "001-payments", "documents", entry("ARC-001-REQ-v1.0"))
+    hook_input = {
+        "tool_name": "write_file",
+        "tool_input": {"file_path": manifest_path, "content": "{}"},
+        "cwd": repo,
+    }
+    subprocess.run(
+        [sys.executable, str(GEMINI_HOOKS_DIR / "update-manifest.py")],
+        input=json.dumps(hook_input), text=True, env=script_env(), cwd=repo, check=True,
+    )
+    assert not os.path.exists(journal_path(manifest_path))
+
+
+def test_journal_of_skipped_records_leaves_manifest_untouched(manifest_path):
+    with open(journal_path(manifest_path), "w", encoding="utf-8") as f:
+        f.write('{"project": "001-payments", "key": "documents", "entry": {}, "time_ns": 1}\n')
+        f.write('{"project": "001-pay')
+    before = open(manifest_path).read()
+    with ManifestStore(manifest_path) as store:
+        assert store.journaled and not store.dirty
+    assert open(manifest_path).read() == before
+    assert not os.path.exists(journal_path(manifest_path))
+
+
+def test_new_store_is_not_journaled(manifest_path):
+    assert ManifestStore(manifest_path).journaled is False
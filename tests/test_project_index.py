@@ -0,0 +1,62 @@
+"""Project lookup: match tiers, ambiguity and index revalidation."""
+
+import os
+
+import pytest
+
+from arckit_core.projects import (
+    MATCH_EXACT, MATCH_FUZZY, MATCH_PREFIX, MATCH_SUBSTRING, MATCH_TOKEN,
+    ProjectIndex, find_project_dir_by_prefix,
+)
+
+PROJECTS = ["000-global", "001-payments-platform", "002-payroll", "003-data-platform", "012-identity-service"]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    for name in PROJECTS:
+        (tmp_path / "projects" / name).mkdir(parents=True)
+    return tmp_path
+
+
+@pytest.mark.parametrize("query, tier, names", [
+    ("1", MATCH_EXACT, ["001-payments-platform"]),
+    ("001", MATCH_EXACT, ["001-payments-platform"]),
+    ("002-payroll", MATCH_EXACT, ["002-payroll"]),
+    ("payments", MATCH_PREFIX, ["001-payments-platform"]),
+    ("pay", MATCH_PREFIX, ["001-payments-platform", "002-payroll"]),
+    ("Data Plat", MATCH_PREFIX, ["003-data-platform"]),
+    ("ident serv", MATCH_TOKEN, ["012-identity-service"]),
+    ("platform", MATCH_TOKEN, ["001-payments-platform", "003-data-platform"]),
+    ("roll", MATCH_SUBSTRING, ["002-payroll"]),
+    ("paymnets platfrom", MATCH_FUZZY, ["001-payments-platform"]),
+    ("zzz", None, []),
+    ("999", None, []),
+])
+def test_match_tiers(repo, query, tier, names):
+    assert ProjectIndex.load(str(repo)).match(query) == (tier, names)
+
+
+def test_ambiguous_lookup_returns_none(repo, capsys):
+    assert find_project_dir_by_prefix("platform", str(repo)) is None
+    err = capsys.readouterr().err
+    assert "Ambiguous project 'platform' (token match)" in err
+    assert "001-payments-platform, 003-data-platform" in err
+
+
+def test_unique_lookup_returns_path(repo):
+    assert find_project_dir_by_prefix("12", str(repo)) == str(repo / "projects" / "012-identity-service")
+
+
+def test_index_is_reused_until_projects_change(repo):
+    index = ProjectIndex.load(str(repo))
+    assert ProjectIndex.load(str(repo)) is index
+
+    projects = repo / "projects"
+    (projects / "004-payments-gateway").mkdir()
+    later = os.stat(projects).st_mtime_ns + 10**9
+    os.utime(projects, ns=(later, later))
+
+    fresh = ProjectIndex.load(str(repo))
+    assert fresh is not index
+    assert fresh.match("payments") == (MATCH_PREFIX, ["001-payments-platform", "004-payments-gateway"])
@@ -0,0 +1,44 @@
+"""Completion scoring from a project's ARC-* documents."""
+
+import pytest
+
+from arckit_core.status import project_doc_types, scan_project
+from arckit_core.projects import snapshot_project
+
+
+@pytest.fixture
+def project(tmp_path):
+    pdir = tmp_path / "projects" / "001-payments"
+    for sub in ("decisions", "external", "vendors/acme", "reviews"):
+        (pdir / sub).mkdir(parents=True)
+    (pdir / "ARC-001-REQ-v1.0.md").write_text("")
+    (pdir / "decisions" / "ARC-001-ADR-001-v1.0.md").write_text("")
+    (pdir / "reviews" / "ARC-001-HLDR-v1.0.md").write_text("")
+    return pdir
+
+
+def test_doc_types_come_from_artifact_subdirs(project):
+    (project / "external" / "ARC-001-RISK-v1.0.md").write_text("")
+    (project / "vendors" / "ARC-001-SOW-v1.0.md").write_text("")
+    snapshot = snapshot_project(str(project), mtimes=False)
+    assert project_doc_types(snapshot, "001") == {"REQ", "ADR", "HLDR"}
+
+
+def test_doc_types_ignore_other_projects_files(project):
+    (project / "ARC-002-RISK-v1.0.md").write_text("")
+    snapshot = snapshot_project(str(project), mtimes=False)
+    assert "RISK" not in project_doc_types(snapshot, "001")
+    assert "RISK" in project_doc_types(snapshot)
+
+
+def test_scan_project_scores_only_own_documents(project):
+    (project / "external" / "ARC-001-RISK-v1.0.md").write_text("")
+    (project / "ARC-002-SOW-v1.0.md").write_text("")
+    weights = {"REQ": 1, "RISK": 1, "SOW": 2}
+    record = scan_project(project, weights)
+    assert record["number"] == "001"
+    assert record["completion_percentage"] == 25
+    assert record["artifacts"]["requirements"]
+    assert not record["artifacts"]["risk_register"]
+    assert not record["artifacts"]["sow"]
+    assert record["external_doc_count"] == 1